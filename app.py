@@ -2,12 +2,14 @@ import streamlit as st
 from streamlit_option_menu import option_menu
 
 # --- IMPORT MODUL LOKAL ---
-from utils import load_resources
+from utils import get_resource_loader, await_resources
+from perf import PERF_ENABLED
 from views.beranda import render_beranda    
 from views.visualisasi import render_visualisasi
 from views.proses_data import render_proses_data
 from views.analisis_teks import render_analisis_teks
 from views.analisis_csv import render_analisis_csv
+from views.performa import render_performa
 
 # ==============================================================================
 # 1. SETUP KONFIGURASI HALAMAN
@@ -19,8 +21,9 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Load Model LSTM & Tokenizer 
-model, tokenizer = load_resources()
+# Load Model LSTM & Tokenizer di background (sekali per proses), hanya
+# halaman Analisis Teks & Analisis File CSV yang menunggu hasilnya
+resource_loader = get_resource_loader()
 
 # ==============================================================================
 # 2. SIDEBAR NAVIGATION (MENU KIRI)
@@ -44,10 +47,17 @@ with st.sidebar:
     
     st.markdown("---")
     
+    menu_options = ["Beranda", "Visualisasi", "Proses Data", "Analisis Teks", "Analisis File CSV"]
+    menu_icons = ["house", "bar-chart", "gear", "chat-text", "file-earmark-spreadsheet"]
+    # Halaman admin "Performa" hanya muncul bila instrumentasi diaktifkan (SENTIMEN_PERF=1)
+    if PERF_ENABLED:
+        menu_options.append("Performa")
+        menu_icons.append("speedometer2")
+
     selected = option_menu(
         menu_title="Menu Utama",
-        options=["Beranda", "Visualisasi", "Proses Data", "Analisis Teks", "Analisis File CSV"],
-        icons=["house", "bar-chart", "gear", "chat-text", "file-earmark-spreadsheet"],
+        options=menu_options,
+        icons=menu_icons,
         menu_icon="cast",
         default_index=0,
         styles={
@@ -83,6 +93,10 @@ elif selected == "Visualisasi":
 elif selected == "Proses Data":
     render_proses_data()
 elif selected == "Analisis Teks":
+    model, tokenizer = await_resources(resource_loader)
     render_analisis_teks(model, tokenizer) 
 elif selected == "Analisis File CSV":
-    render_analisis_csv(model, tokenizer)
\ No newline at end of file
+    model, tokenizer = await_resources(resource_loader)
+    render_analisis_csv(model, tokenizer)
+elif selected == "Performa":
+    render_performa(resource_loader)
\ No newline at end of file
@@ -0,0 +1,59 @@
+"""Uji kesamaan & benchmark batching berbasis panjang token (bucketing).
+
+Membandingkan prediksi `predict_sentiment_batch` dengan padding penuh
+(`bucket_by_length=False`) dan dengan bucketing pada teks dari
+`data/Data_Lengkap_Tokenisasi.csv`. Membutuhkan file model di `MODEL_PATH`.
+
+Jalankan dari root repository:
+    python benchmark/bench_bucketing.py
+"""
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+from utils import get_sequence_encoder, load_model_and_tokenizer, predict_sentiment_batch
+
+DATA_PATH = os.path.join('data', 'Data_Lengkap_Tokenisasi.csv')
+TOLERANSI = 1e-5
+
+
+def main():
+    model, tokenizer = load_model_and_tokenizer()
+
+    teks = pd.read_csv(DATA_PATH)['Teks Tweet'].fillna('').tolist()
+
+    # Warm-up agar waktu tracing grafik tidak ikut terukur
+    predict_sentiment_batch(teks[:512], model, tokenizer, bucket_by_length=False, use_cache=False)
+    predict_sentiment_batch(teks[:512], model, tokenizer, bucket_by_length=True, use_cache=False)
+
+    mulai = time.perf_counter()
+    label_penuh, _, prob_penuh, bersih = predict_sentiment_batch(teks, model, tokenizer, bucket_by_length=False, use_cache=False)
+    t_penuh = time.perf_counter() - mulai
+
+    mulai = time.perf_counter()
+    label_bucket, _, prob_bucket, _ = predict_sentiment_batch(teks, model, tokenizer, bucket_by_length=True, use_cache=False)
+    t_bucket = time.perf_counter() - mulai
+
+    selisih = float(np.max(np.abs(prob_penuh - prob_bucket)))
+    label_beda = sum(a != b for a, b in zip(label_penuh, label_bucket))
+    panjang = np.count_nonzero(get_sequence_encoder(tokenizer).encode(bersih), axis=1)
+
+    print(f"Jumlah teks            : {len(teks):,}")
+    print(f"Panjang token rata-rata: {panjang.mean():.1f} (maks {panjang.max()})")
+    print(f"Selisih prob. maksimum : {selisih:.2e} (toleransi {TOLERANSI:.0e})")
+    print(f"Label berbeda          : {label_beda}")
+    print(f"Padding penuh (100)    : {t_penuh:.3f} s")
+    print(f"Bucketing              : {t_bucket:.3f} s  ({t_penuh / t_bucket:.1f}x)")
+
+    if selisih > TOLERANSI or label_beda:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
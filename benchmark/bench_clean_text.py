@@ -0,0 +1,91 @@
+"""Benchmark & uji kesamaan output (golden output) untuk `utils.clean_text`.
+
+Membandingkan mesin normalisasi baru (`clean_text` dan `clean_text_series`)
+dengan implementasi lama (tujuh pass `re.sub` + split + `slang_dict.get`)
+pada seluruh kolom `Teks Tweet` di `data/Data_Lengkap_Tokenisasi.csv`.
+
+Jalankan dari root repository:
+    python benchmark/bench_clean_text.py
+"""
+import os
+import re
+import sys
+import time
+import random
+
+import pandas as pd
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+from utils import clean_text, clean_text_series, slang_dict
+
+DATA_PATH = os.path.join(ROOT_DIR, 'data', 'Data_Lengkap_Tokenisasi.csv')
+
+
+def clean_text_lama(text):
+    """Salinan implementasi `clean_text` sebelum dioptimasi (referensi golden output)."""
+    if not isinstance(text, str): return ""
+    text = text.lower()
+    text = re.sub(r'http\S+|www\S+|https\S+', '', text, flags=re.MULTILINE)
+    text = re.sub(r'@\w+', '', text)
+    text = re.sub(r'#\w+', '', text)
+    text = re.sub(r'\d+', '', text)
+    text = re.sub(r'[^\w\s]', ' ', text)
+    text = re.sub(r'\s+', ' ', text).strip()
+
+    words = text.split()
+    normalized_words = [slang_dict.get(w, w) for w in words]
+    return " ".join(normalized_words)
+
+
+def teks_acak(rng, n):
+    """Teks acak berisi potongan yang rawan beda hasil (URL di dalam mention, angka, simbol)."""
+    potongan = ['http', 'https://', 'www', 'www.', '@', '#', '1', '23', ' ', '\n', '\t', '.', ',', '!',
+                '_', 'yg', 'gk', 'd', 'g', 'Tak', 'BGT', 'dana', 'bos', 'é', 'Σ', 'ß', ' ', '😊', '/']
+    return ["".join(rng.choice(potongan) for _ in range(rng.randint(0, 25))) for _ in range(n)]
+
+
+def ukur(fungsi, ulang=3):
+    terbaik = float('inf')
+    for _ in range(ulang):
+        mulai = time.perf_counter()
+        hasil = fungsi()
+        terbaik = min(terbaik, time.perf_counter() - mulai)
+    return terbaik, hasil
+
+
+def main():
+    df = pd.read_csv(DATA_PATH)
+    teks = df['Teks Tweet'].tolist()
+    teks += [None, float('nan'), '', 'ada\x00pemisah']
+    teks += teks_acak(random.Random(42), 20000)
+
+    # --- 1. GOLDEN OUTPUT ---
+    golden = [clean_text_lama(t) for t in teks]
+    beda_single = [i for i, t in enumerate(teks) if clean_text(t) != golden[i]]
+    beda_kolom = [i for i, v in enumerate(clean_text_series(pd.Series(teks))) if v != golden[i]]
+    print(f"Total teks diuji      : {len(teks):,}")
+    print(f"Beda (clean_text)     : {len(beda_single)}")
+    print(f"Beda (series)         : {len(beda_kolom)}")
+    for i in (beda_single + beda_kolom)[:5]:
+        print(f"  contoh beda: {teks[i]!r} -> {golden[i]!r}")
+
+    # --- 2. BENCHMARK (data asli diulang 20x) ---
+    korpus = df['Teks Tweet'].tolist() * 20
+    seri = pd.Series(korpus)
+    t_lama, _ = ukur(lambda: [clean_text_lama(t) for t in korpus])
+    t_baru, _ = ukur(lambda: [clean_text(t) for t in korpus])
+    t_kolom, _ = ukur(lambda: clean_text_series(seri))
+
+    print(f"\nBenchmark {len(korpus):,} teks")
+    print(f"  lama (per baris)    : {t_lama:.3f} s")
+    print(f"  clean_text          : {t_baru:.3f} s  ({t_lama / t_baru:.1f}x)")
+    print(f"  clean_text_series   : {t_kolom:.3f} s  ({t_lama / t_kolom:.1f}x)")
+
+    if beda_single or beda_kolom:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
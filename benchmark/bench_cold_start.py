@@ -0,0 +1,52 @@
+"""Mengukur waktu cold-start hingga halaman Beranda selesai dirender.
+
+Setiap percobaan dijalankan di proses Python baru (import streamlit, modul
+view, dan apa pun yang dimuat `app.py` sebelum routing), lalu `app.py`
+dieksekusi sekali lewat `streamlit.testing.v1.AppTest` dengan menu default
+(Beranda). Waktu yang dilaporkan adalah waktu sejak proses mulai sampai
+run pertama selesai.
+
+Jalankan dari root repository:
+    python benchmark/bench_cold_start.py [--ulang 5]
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+KODE_UKUR = """
+import time
+mulai = time.perf_counter()
+from streamlit.testing.v1 import AppTest
+at = AppTest.from_file({app_path!r}, default_timeout=300)
+at.run()
+print(time.perf_counter() - mulai)
+"""
+
+
+def ukur_sekali(app_path):
+    hasil = subprocess.run(
+        [sys.executable, '-c', KODE_UKUR.format(app_path=app_path)],
+        capture_output=True, text=True,
+    )
+    if hasil.returncode != 0:
+        sys.exit(hasil.stderr)
+    return float(hasil.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--ulang', type=int, default=5, help="Jumlah percobaan cold-start.")
+    parser.add_argument('--app', default=os.path.join(ROOT_DIR, 'app.py'), help="Path app.py yang diukur.")
+    args = parser.parse_args()
+
+    waktu = [ukur_sekali(os.path.abspath(args.app)) for _ in range(args.ulang)]
+    print(f"Cold-start Beranda ({args.ulang}x): median {statistics.median(waktu):.2f} s, "
+          f"min {min(waktu):.2f} s, maks {max(waktu):.2f} s")
+
+
+if __name__ == '__main__':
+    main()
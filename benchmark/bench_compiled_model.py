@@ -0,0 +1,129 @@
+"""Benchmark & laporan SLO latensi: `model.predict` Keras vs `CompiledKerasModel`.
+
+Diukur untuk model Keras asli (`load_keras_model`) dan versi ter-compile
+(`keras_backend.CompiledKerasModel`, dipakai `load_model` untuk backend keras):
+- waktu muat, waktu trace + warm-up, dan latensi panggilan pertama;
+- latensi p50/p95/p99 `predict_sentiment` satu teks (tanpa cache prediksi);
+- latensi p50/p95/p99 `predict_sentiment_batch` per panggilan untuk batch
+  berukuran 32 dan 256 teks;
+- selisih probabilitas maksimum antara keduanya pada seluruh dataset.
+Di akhir, p99 versi ter-compile dibandingkan dengan target SLO interaktif;
+keluar dengan kode 1 bila ada target yang terlewati.
+
+Jalankan dari root repository (butuh TensorFlow & model/Model_Sentiment_LSTM.h5):
+    python benchmark/bench_compiled_model.py [--teks 300] [--slo-tunggal-ms 50] [--slo-batch-ms 500]
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+from inference import (
+    WARM_UP_BATCH_SIZES, WARM_UP_LENGTHS, load_keras_model, load_tokenizer, predict_sentiment,
+    predict_sentiment_batch,
+)
+from keras_backend import CompiledKerasModel
+
+DATA_PATH = os.path.join(ROOT_DIR, 'data', 'Data_Lengkap_Tokenisasi.csv')
+UKURAN_BATCH = (32, 256)
+
+
+def persentil(waktu):
+    waktu = np.asarray(waktu) * 1000
+    return {p: float(np.percentile(waktu, p)) for p in (50, 95, 99)}
+
+
+def ukur_tunggal(model, tokenizer, teks):
+    waktu = []
+    for t in teks:
+        mulai = time.perf_counter()
+        predict_sentiment(t, model, tokenizer, use_cache=False)
+        waktu.append(time.perf_counter() - mulai)
+    return persentil(waktu)
+
+
+def ukur_batch(model, tokenizer, teks, ukuran, ulang):
+    waktu = []
+    for i in range(ulang):
+        awal = (i * ukuran) % max(len(teks) - ukuran, 1)
+        mulai = time.perf_counter()
+        predict_sentiment_batch(teks[awal:awal + ukuran], model, tokenizer, use_cache=False)
+        waktu.append(time.perf_counter() - mulai)
+    return persentil(waktu)
+
+
+def cetak(label, p):
+    print(f"  {label:<28} p50 {p[50]:8.2f} ms   p95 {p[95]:8.2f} ms   p99 {p[99]:8.2f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--teks', type=int, default=300, help="Jumlah request satu teks.")
+    parser.add_argument('--ulang-batch', type=int, default=30, help="Jumlah panggilan per ukuran batch.")
+    parser.add_argument('--slo-tunggal-ms', type=float, default=50.0, help="Target p99 satu teks.")
+    parser.add_argument('--slo-batch-ms', type=float, default=500.0, help="Target p99 batch 256 teks.")
+    args = parser.parse_args()
+
+    teks = pd.read_csv(DATA_PATH)['Teks Tweet'].dropna().astype(str).tolist()
+    tokenizer = load_tokenizer('keras')
+
+    mulai = time.perf_counter()
+    keras_model = load_keras_model()
+    detik_muat = time.perf_counter() - mulai
+
+    mulai = time.perf_counter()
+    predict_sentiment(teks[0], keras_model, tokenizer, use_cache=False)
+    pertama_keras = time.perf_counter() - mulai
+
+    mulai = time.perf_counter()
+    compiled = CompiledKerasModel(keras_model).warm_up(WARM_UP_BATCH_SIZES, WARM_UP_LENGTHS)
+    detik_warm_up = time.perf_counter() - mulai
+
+    mulai = time.perf_counter()
+    predict_sentiment(teks[1], compiled, tokenizer, use_cache=False)
+    pertama_compiled = time.perf_counter() - mulai
+
+    print(f"Muat model Keras: {detik_muat:.2f} s; trace + warm-up {len(WARM_UP_BATCH_SIZES) * len(WARM_UP_LENGTHS)} "
+          f"bentuk: {detik_warm_up:.2f} s")
+    print(f"Panggilan pertama: model.predict {pertama_keras * 1000:.1f} ms, compiled {pertama_compiled * 1000:.1f} ms")
+
+    sampel = teks[:args.teks]
+    hasil = {}
+    print(f"\nSatu teks ({len(sampel)} request, tanpa cache):")
+    for label, model in (('model.predict', keras_model), ('compiled', compiled)):
+        hasil[('tunggal', label)] = ukur_tunggal(model, tokenizer, sampel)
+        cetak(label, hasil[('tunggal', label)])
+
+    for ukuran in UKURAN_BATCH:
+        print(f"\nBatch {ukuran} teks ({args.ulang_batch} panggilan, tanpa cache):")
+        for label, model in (('model.predict', keras_model), ('compiled', compiled)):
+            hasil[(ukuran, label)] = ukur_batch(model, tokenizer, teks, ukuran, args.ulang_batch)
+            cetak(label, hasil[(ukuran, label)])
+
+    _, _, prob_keras, _ = predict_sentiment_batch(teks, keras_model, tokenizer, use_cache=False)
+    _, _, prob_compiled, _ = predict_sentiment_batch(teks, compiled, tokenizer, use_cache=False)
+    print(f"\nSelisih probabilitas maksimum ({len(teks):,} teks): {np.abs(prob_keras - prob_compiled).max():.2e}; "
+          f"jumlah trace: {compiled.tracing_count}")
+
+    target = (
+        ('satu teks', hasil[('tunggal', 'compiled')][99], args.slo_tunggal_ms),
+        (f'batch {UKURAN_BATCH[-1]}', hasil[(UKURAN_BATCH[-1], 'compiled')][99], args.slo_batch_ms),
+    )
+    print("\nSLO (p99, compiled):")
+    gagal = False
+    for nama, p99, batas in target:
+        ok = p99 <= batas
+        gagal |= not ok
+        print(f"  {nama:<12} {p99:8.2f} ms  (target <= {batas:.0f} ms)  {'OK' if ok else 'MELANGGAR'}")
+    if gagal:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
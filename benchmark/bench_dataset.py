@@ -0,0 +1,133 @@
+"""Benchmark waktu muat & memori lapisan data bersama (dataset.py).
+
+Membuat korpus sintetis N kali ukuran `data/Data_Lengkap_Tokenisasi.csv`
+(default 100x) di folder sementara, lalu membandingkan `pd.read_csv` penuh
+(cara lama) dengan cache kolumnar: pembangunan cache, muat dingin (proses
+baru) untuk semua kolom maupun subset kolom per halaman, dan muat hangat.
+Setiap skenario dingin dijalankan di proses terpisah agar RSS puncaknya
+terukur bersih.
+
+Jalankan dari root repository:
+    python benchmark/bench_dataset.py [--kali 100]
+"""
+import argparse
+import json
+import os
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+import pandas as pd
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+from dataset import DatasetCache
+
+DATA_PATH = os.path.join('data', 'Data_Lengkap_Tokenisasi.csv')
+
+# Kolom yang benar-benar dipakai tiap halaman
+SUBSET_HALAMAN = {
+    'visualisasi': ['created_at', 'username', 'Teks Tweet', 'Label', 'Label_Clean', 'Tweet_Final'],
+    'proses_data (tahap 3)': ['Tweet_Final', 'Label'],
+}
+
+
+def _rss_mb():
+    # VmHWM (puncak RSS) di-reset saat exec; ru_maxrss ikut mewarisi proses induk
+    try:
+        with open('/proc/self/status') as f:
+            for baris in f:
+                if baris.startswith('VmHWM:'):
+                    return int(baris.split()[1]) / 1024
+    except OSError:
+        pass
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def jalankan_skenario(skenario, csv_path, cache_dir, kolom):
+    """Dipanggil di proses anak; mencetak hasil sebagai JSON."""
+    rss_awal = _rss_mb()
+    mulai = time.perf_counter()
+    if skenario == 'read_csv':
+        df = pd.read_csv(csv_path)
+    else:
+        df = DatasetCache(csv_path, cache_dir).load(kolom)
+    durasi = time.perf_counter() - mulai
+    print(json.dumps({
+        'detik': durasi,
+        'rss_mb': _rss_mb() - rss_awal,
+        'df_mb': df.memory_usage(deep=True).sum() / 1e6,
+        'baris': len(df),
+    }))
+
+
+def ukur_di_proses_baru(skenario, csv_path, cache_dir, kolom=None):
+    perintah = [sys.executable, os.path.abspath(__file__), '--skenario', skenario,
+                '--csv', csv_path, '--cache-dir', cache_dir]
+    if kolom:
+        perintah += ['--kolom', json.dumps(kolom)]
+    keluaran = subprocess.run(perintah, check=True, capture_output=True, text=True).stdout
+    return json.loads(keluaran.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--kali', type=int, default=100, help="Kelipatan ukuran dataset asli")
+    parser.add_argument('--skenario')
+    parser.add_argument('--csv')
+    parser.add_argument('--cache-dir')
+    parser.add_argument('--kolom')
+    args = parser.parse_args()
+
+    if args.skenario:
+        kolom = json.loads(args.kolom) if args.kolom else None
+        jalankan_skenario(args.skenario, args.csv, args.cache_dir, kolom)
+        return
+
+    folder = tempfile.mkdtemp(prefix='bench_dataset_')
+    try:
+        csv_path = os.path.join(folder, 'Data_Lengkap_Tokenisasi.csv')
+        cache_dir = os.path.join(folder, '.cache')
+        df_asli = pd.read_csv(DATA_PATH)
+        salinan = []
+        for k in range(args.kali):
+            df_k = df_asli.copy()
+            # Akhiran unik agar teks tiap salinan tidak identik (mencegah efek deduplikasi string)
+            for kolom in ['Teks Tweet', 'Tweet_CaseFolded', 'Tweet_Cleaned', 'Tweet_Normalized', 'Tweet_Final']:
+                df_k[kolom] = df_k[kolom].astype(str) + f" s{k}"
+            salinan.append(df_k)
+        pd.concat(salinan, ignore_index=True).to_csv(csv_path, index=False)
+        del salinan
+        print(f"Korpus sintetis        : {len(df_asli) * args.kali:,} baris, {os.path.getsize(csv_path) / 1e6:,.0f} MB ({args.kali}x)")
+
+        mulai = time.perf_counter()
+        cache = DatasetCache(csv_path, cache_dir)
+        cache.load([])
+        t_build = time.perf_counter() - mulai
+        ukuran_cache = sum(os.path.getsize(os.path.join(cache_dir, f)) for f in os.listdir(cache_dir))
+        print(f"Bangun cache (sekali)  : {t_build:.2f} s, {ukuran_cache / 1e6:,.0f} MB di disk")
+        print()
+
+        print(f"{'Skenario':<34}{'Waktu':>9}{'RSS +':>11}{'DataFrame':>12}")
+        hasil = [('pd.read_csv (cara lama)', ukur_di_proses_baru('read_csv', csv_path, cache_dir))]
+        hasil.append(('cache: semua kolom', ukur_di_proses_baru('cache', csv_path, cache_dir)))
+        for halaman, kolom in SUBSET_HALAMAN.items():
+            hasil.append((f"cache: {halaman}", ukur_di_proses_baru('cache', csv_path, cache_dir, kolom)))
+        for nama, h in hasil:
+            print(f"{nama:<34}{h['detik']:>8.2f}s{h['rss_mb']:>8.0f} MB{h['df_mb']:>9.0f} MB")
+
+        # Muat hangat: kolom sudah ada di memori proses (rerun Streamlit berikutnya)
+        cache.load(SUBSET_HALAMAN['visualisasi'])
+        mulai = time.perf_counter()
+        cache.load(SUBSET_HALAMAN['visualisasi'])
+        print(f"{'cache hangat: visualisasi':<34}{time.perf_counter() - mulai:>8.3f}s")
+    finally:
+        shutil.rmtree(folder, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,93 @@
+"""Benchmark micro-batching (micro_batcher.py) untuk request teks tunggal bersamaan.
+
+Sejumlah thread (mensimulasikan sesi Streamlit) masing-masing mengirim
+request satu teks secara berurutan. Dibandingkan:
+- cara lama: setiap request memanggil `predict_sentiment` sendiri;
+- `MicroBatcher`: request digabung menjadi batch oleh satu thread.
+Teks diberi akhiran unik agar cache prediksi tidak ikut membantu. Dilaporkan
+throughput, latensi p50/p99, dan histogram ukuran batch.
+
+Jalankan dari root repository (butuh model/Model_Sentiment_LSTM.h5):
+    python benchmark/bench_micro_batcher.py [--klien 32] [--request 20] [--backend numpy]
+"""
+import argparse
+import os
+import sys
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+from micro_batcher import MicroBatcher
+from utils import load_model_and_tokenizer, predict_sentiment
+
+DATA_PATH = os.path.join(ROOT_DIR, 'data', 'Data_Lengkap_Tokenisasi.csv')
+
+
+def jalankan(klien, request, teks, fungsi):
+    """Jalankan `klien` thread x `request` panggilan, kembalikan (detik, latensi ms, hasil)."""
+    latensi = [[] for _ in range(klien)]
+    hasil = {}
+
+    def kerja(k):
+        for r in range(request):
+            i = k * request + r
+            mulai = time.perf_counter()
+            hasil[i] = fungsi(teks[i])
+            latensi[k].append((time.perf_counter() - mulai) * 1000)
+
+    threads = [threading.Thread(target=kerja, args=(k,)) for k in range(klien)]
+    mulai = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return time.perf_counter() - mulai, np.concatenate(latensi), hasil
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--klien', type=int, default=32)
+    parser.add_argument('--request', type=int, default=20)
+    parser.add_argument('--backend', default=None, help="keras / numpy (default: SENTIMEN_BACKEND)")
+    args = parser.parse_args()
+
+    total = args.klien * args.request
+    sumber = pd.read_csv(DATA_PATH, usecols=['Teks Tweet'])['Teks Tweet'].dropna().tolist()
+    model, tokenizer = load_model_and_tokenizer(args.backend)
+    predict_sentiment("pemanasan", model, tokenizer)
+
+    print(f"{args.klien} klien x {args.request} request = {total:,} request")
+    print(f"{'Mode':<16}{'request/s':>12}{'p50':>10}{'p99':>10}")
+
+    teks = [f"{sumber[i % len(sumber)]} lama{i}" for i in range(total)]
+    waktu, latensi, ref = jalankan(args.klien, args.request, teks,
+                                   lambda t: predict_sentiment(t, model, tokenizer))
+    print(f"{'per request':<16}{total / waktu:>12,.0f}{np.percentile(latensi, 50):>8.1f}ms{np.percentile(latensi, 99):>8.1f}ms")
+
+    batcher = MicroBatcher(model, tokenizer)
+    teks = [f"{sumber[i % len(sumber)]} baru{i}" for i in range(total)]
+    waktu, latensi, hasil = jalankan(args.klien, args.request, teks, batcher.predict)
+    stats = batcher.stats()
+    batcher.close()
+    print(f"{'micro-batch':<16}{total / waktu:>12,.0f}{np.percentile(latensi, 50):>8.1f}ms{np.percentile(latensi, 99):>8.1f}ms")
+    print(f"Ukuran batch rata-rata: {stats['mean_batch_size']:.1f}, histogram: {stats['batch_size_histogram']}")
+    print(f"Latensi internal p50/p99: {stats['p50_ms']:.1f} / {stats['p99_ms']:.1f} ms")
+
+    # Label harus sama dengan prediksi satu per satu (teks sama tanpa akhiran pembeda)
+    cek = [f"{sumber[i]} cek" for i in range(200)]
+    batcher = MicroBatcher(model, tokenizer)
+    _, _, hasil = jalankan(8, 25, cek, batcher.predict)
+    batcher.close()
+    sama = all(hasil[i][0] == predict_sentiment(cek[i], model, tokenizer, use_cache=False)[0] for i in range(len(cek)))
+    print(f"Label micro-batch == predict_sentiment: {sama}")
+    if not sama:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,78 @@
+"""Uji kesamaan & benchmark backend NumPy (`numpy_backend.NumpyLSTMModel`).
+
+Membandingkan probabilitas backend NumPy dengan model Keras pada seluruh teks
+`data/Data_Lengkap_Tokenisasi.csv` (padding penuh dan bucketing), lalu
+memastikan backend NumPy bisa dipakai tanpa meng-import TensorFlow.
+Membutuhkan file model di `MODEL_PATH`.
+
+Jalankan dari root repository:
+    python benchmark/bench_numpy_backend.py
+"""
+import os
+import subprocess
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+from utils import load_model_and_tokenizer, predict_sentiment, predict_sentiment_batch
+
+DATA_PATH = os.path.join('data', 'Data_Lengkap_Tokenisasi.csv')
+TOLERANSI = 1e-5
+
+KODE_TANPA_TF = """
+import sys
+sys.path.insert(0, {root!r})
+from utils import load_model_and_tokenizer, predict_sentiment
+model, tokenizer = load_model_and_tokenizer('numpy')
+predict_sentiment('dana bos dipotong lagi', model, tokenizer)
+print('tensorflow' in sys.modules)
+"""
+
+
+def ukur(fungsi):
+    mulai = time.perf_counter()
+    hasil = fungsi()
+    return time.perf_counter() - mulai, hasil
+
+
+def main():
+    teks = pd.read_csv(DATA_PATH)['Teks Tweet'].fillna('').tolist()
+    model_keras, tokenizer_keras = load_model_and_tokenizer('keras')
+    model_np, tokenizer_np = load_model_and_tokenizer('numpy')
+
+    # Warm-up Keras agar tracing grafik tidak ikut terukur
+    predict_sentiment_batch(teks[:512], model_keras, tokenizer_keras)
+
+    gagal = False
+    for bucket in (False, True):
+        t_keras, (_, _, prob_keras, _) = ukur(lambda: predict_sentiment_batch(teks, model_keras, tokenizer_keras, bucket_by_length=bucket, use_cache=False))
+        t_np, (_, _, prob_np, _) = ukur(lambda: predict_sentiment_batch(teks, model_np, tokenizer_np, bucket_by_length=bucket, use_cache=False))
+        selisih = float(np.max(np.abs(prob_keras - prob_np)))
+        label_beda = int(np.sum(prob_keras.argmax(1) != prob_np.argmax(1)))
+        gagal = gagal or selisih > TOLERANSI or label_beda > 0
+        print(f"[bucket={bucket}] selisih maks {selisih:.2e}, label beda {label_beda}, "
+              f"Keras {t_keras:.3f} s, NumPy {t_np:.3f} s ({t_keras / t_np:.1f}x)")
+
+    # Latensi satu teks (kasus halaman Analisis Teks)
+    sampel = teks[:200]
+    t_keras, _ = ukur(lambda: [predict_sentiment(t, model_keras, tokenizer_keras, use_cache=False) for t in sampel])
+    t_np, _ = ukur(lambda: [predict_sentiment(t, model_np, tokenizer_np, use_cache=False) for t in sampel])
+    print(f"Latensi per teks: Keras {t_keras / len(sampel) * 1000:.2f} ms, NumPy {t_np / len(sampel) * 1000:.2f} ms")
+
+    hasil = subprocess.run([sys.executable, '-c', KODE_TANPA_TF.format(root=ROOT_DIR)],
+                           capture_output=True, text=True)
+    tf_terimport = hasil.stdout.strip().splitlines()[-1] if hasil.returncode == 0 else hasil.stderr
+    print(f"TensorFlow ter-import saat backend NumPy dipakai: {tf_terimport}")
+    gagal = gagal or tf_terimport != 'False'
+
+    if gagal:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
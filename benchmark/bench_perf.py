@@ -0,0 +1,86 @@
+"""Benchmark overhead instrumentasi span (perf.py).
+
+Diukur:
+- biaya per panggilan `span(...)` dan fungsi ber-`@timed` saat nonaktif vs aktif,
+  dibandingkan panggilan fungsi kosong;
+- `predict_sentiment` (tanpa cache) & `predict_sentiment_batch` dengan
+  instrumentasi nonaktif vs aktif, lalu contoh ekspor Prometheus.
+
+Jalankan dari root repository (butuh model/Model_Sentiment_LSTM.h5):
+    python benchmark/bench_perf.py [--teks 200] [--backend numpy]
+"""
+import argparse
+import os
+import sys
+import time
+
+import pandas as pd
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+import perf
+from inference import load_model_and_tokenizer, predict_sentiment, predict_sentiment_batch
+
+DATA_PATH = os.path.join(ROOT_DIR, 'data', 'Data_Lengkap_Tokenisasi.csv')
+ULANG = 200_000
+
+
+def ns_per_panggilan(fungsi, ulang=ULANG):
+    mulai = time.perf_counter()
+    for _ in range(ulang):
+        fungsi()
+    return (time.perf_counter() - mulai) / ulang * 1e9
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--teks', type=int, default=200)
+    parser.add_argument('--backend', default=None)
+    args = parser.parse_args()
+
+    def kosong():
+        pass
+
+    def dengan_span():
+        with perf.span('bench'):
+            pass
+
+    dengan_timed = perf.timed('bench')(kosong)
+
+    print("Overhead per panggilan (ns):")
+    dasar = ns_per_panggilan(kosong)
+    print(f"  fungsi kosong            : {dasar:8.0f}")
+    for aktif in (False, True):
+        perf.set_enabled(aktif)
+        status = 'aktif   ' if aktif else 'nonaktif'
+        print(f"  span  ({status})        : {ns_per_panggilan(dengan_span):8.0f}")
+        print(f"  @timed ({status})       : {ns_per_panggilan(dengan_timed):8.0f}")
+    perf.reset()
+
+    model, tokenizer = load_model_and_tokenizer(args.backend)
+    teks = pd.read_csv(DATA_PATH)['Teks Tweet'].dropna().astype(str).tolist()
+    sampel = teks[:args.teks]
+    predict_sentiment(sampel[0], model, tokenizer, use_cache=False)
+
+    print(f"\nInferensi ({args.teks} teks tunggal, lalu batch {len(teks):,} teks), 3 ulangan terbaik:")
+    for aktif in (False, True):
+        perf.set_enabled(aktif)
+        tunggal = batch = float('inf')
+        for _ in range(3):
+            mulai = time.perf_counter()
+            for t in sampel:
+                predict_sentiment(t, model, tokenizer, use_cache=False)
+            tunggal = min(tunggal, time.perf_counter() - mulai)
+            mulai = time.perf_counter()
+            predict_sentiment_batch(teks, model, tokenizer, use_cache=False)
+            batch = min(batch, time.perf_counter() - mulai)
+        print(f"  {'aktif   ' if aktif else 'nonaktif'}: tunggal {tunggal / len(sampel) * 1000:.3f} ms/teks, "
+              f"batch {batch * 1000:.1f} ms")
+
+    print("\nContoh ekspor Prometheus:")
+    print(perf.to_prometheus())
+
+
+if __name__ == '__main__':
+    main()
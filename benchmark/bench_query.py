@@ -0,0 +1,96 @@
+"""Benchmark tabel dataset: seluruh frame ke st.dataframe vs kueri berhalaman (dataset.py).
+
+`data/Data_Lengkap_Tokenisasi.csv` diperbanyak N kali ke folder sementara.
+Untuk tiap skenario diukur waktu menyiapkan data + serialisasi Arrow yang
+dilakukan st.dataframe (`type_util.data_frame_to_bytes`):
+- Data Explorer cara lama: copy + rename + filter label + str.contains, lalu slice 20 baris;
+- Preprocessing (Proses Data tahap 2) cara lama: 6 kolom teks seluruh baris dikirim;
+- cara baru: select_rows + fetch_page, hanya 20 baris yang dibentuk & dikirim.
+Juga dicek bahwa halaman dari kueri sama dengan hasil filter pandas.
+
+Jalankan dari root repository:
+    python benchmark/bench_query.py [--kali 100]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import pandas as pd
+from streamlit import type_util
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+from dataset import DatasetCache, _caches, count_rows, fetch_page, select_rows
+
+DATA_PATH = os.path.join('data', 'Data_Lengkap_Tokenisasi.csv')
+KOLOM_EXPLORER = ['created_at', 'username', 'Teks Tweet', 'Label_Clean']
+KOLOM_PREPROCESSING = ['Teks Tweet', 'Tweet_CaseFolded', 'Tweet_Cleaned', 'Tweet_Tokenized', 'Tweet_Normalized', 'Tweet_Final']
+ULANG = 5
+
+
+def ukur(fungsi):
+    mulai = time.perf_counter()
+    for _ in range(ULANG):
+        hasil = fungsi()
+    return (time.perf_counter() - mulai) / ULANG * 1000, hasil
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--kali', type=int, default=100)
+    args = parser.parse_args()
+
+    df_asli = pd.read_csv(DATA_PATH)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'dataset.csv')
+        pd.concat([df_asli] * args.kali, ignore_index=True).to_csv(path, index=False)
+        cache = DatasetCache(path, os.path.join(tmp, 'cache'))
+        _caches[path] = cache
+        df = cache.load()
+        print(f"Jumlah baris: {len(df):,} ({args.kali}x)")
+
+        def explorer_lama():
+            df_show = df[KOLOM_EXPLORER].copy().rename(columns={'Label_Clean': 'Label'})
+            df_show = df_show[df_show['Label'] == 'negatif']
+            df_show = df_show[df_show['Teks Tweet'].str.contains('guru', case=False, na=False)]
+            df_show.index = range(1, len(df_show) + 1)
+            return type_util.data_frame_to_bytes(df_show.iloc[:20])
+
+        def explorer_baru():
+            rows = select_rows({'Label_Clean': 'negatif'}, None, sort_by='created_at', path=path)
+            count_rows(rows, path)
+            return type_util.data_frame_to_bytes(fetch_page(KOLOM_EXPLORER, rows, 3, 20, path))
+
+        def preprocessing_lama():
+            return type_util.data_frame_to_bytes(df[KOLOM_PREPROCESSING])
+
+        def preprocessing_baru():
+            rows = select_rows(path=path)
+            return type_util.data_frame_to_bytes(fetch_page(KOLOM_PREPROCESSING, rows, 1, 20, path))
+
+        hasil = [
+            ("Explorer (lama)", ukur(explorer_lama)),
+            ("Explorer (filter + urut, baru)", ukur(explorer_baru)),
+            ("Preprocessing (lama)", ukur(preprocessing_lama)),
+            ("Preprocessing (baru)", ukur(preprocessing_baru)),
+        ]
+        for nama, (waktu, data) in hasil:
+            print(f"{nama:<32}{waktu:>10.1f} ms{len(data) / 1e6:>10.2f} MB dikirim")
+
+        # Halaman hasil kueri harus sama dengan filter + sort pandas
+        rows = select_rows({'Label_Clean': 'netral'}, sort_by='created_at', ascending=False, path=path)
+        ref = df[df['Label_Clean'] == 'netral'].sort_values('created_at', kind='mergesort')[::-1]
+        sama = all(
+            fetch_page(KOLOM_EXPLORER, rows, halaman, 20, path).equals(ref[KOLOM_EXPLORER].iloc[(halaman - 1) * 20:halaman * 20])
+            for halaman in (1, 2, 50)
+        )
+        print(f"Halaman kueri == filter pandas: {sama}")
+        if not sama:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
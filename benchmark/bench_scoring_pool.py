@@ -0,0 +1,72 @@
+"""Benchmark skoring multi-proses (scoring_pool.py): baris/detik untuk 1, 2, 4, 8 worker.
+
+Korpus sintetis dibuat dari kolom `Teks Tweet` dataset yang diacak dan diberi
+akhiran unik per baris (agar cache prediksi tidak ikut membantu). Waktu
+start worker & pemuatan model diukur terpisah dari waktu skoring, dan hasil
+setiap konfigurasi dicek sama persis (urutan baris) dengan skoring satu proses.
+
+Jalankan dari root repository (butuh model/Model_Sentiment_LSTM.h5):
+    python benchmark/bench_scoring_pool.py [--baris 20000] [--backend numpy]
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+from scoring_pool import ScoringPool
+from utils import load_model_and_tokenizer, predict_text_column
+
+DATA_PATH = os.path.join(ROOT_DIR, 'data', 'Data_Lengkap_Tokenisasi.csv')
+JUMLAH_WORKER = (1, 2, 4, 8)
+
+
+def korpus_sintetis(baris, seed=42):
+    teks = pd.read_csv(DATA_PATH, usecols=['Teks Tweet'])['Teks Tweet'].dropna().to_numpy()
+    rng = np.random.default_rng(seed)
+    pilihan = teks[rng.integers(0, len(teks), baris)]
+    return pd.Series([f"{t} sampel{i}" for i, t in enumerate(pilihan)], dtype=object)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--baris', type=int, default=20000)
+    parser.add_argument('--backend', default=None, help="keras / numpy (default: SENTIMEN_BACKEND)")
+    args = parser.parse_args()
+
+    teks = korpus_sintetis(args.baris)
+    print(f"Jumlah baris: {len(teks):,}, CPU: {os.cpu_count()}")
+
+    model, tokenizer = load_model_and_tokenizer(args.backend)
+    mulai = time.perf_counter()
+    ref_label, ref_bersih, _ = predict_text_column(teks, model, tokenizer)
+    t_ref = time.perf_counter() - mulai
+    print(f"{'1 proses (tanpa pool)':<24}{len(teks) / t_ref:>12,.0f} baris/s")
+
+    gagal = False
+    for jumlah in JUMLAH_WORKER:
+        mulai = time.perf_counter()
+        with ScoringPool(jumlah, backend=args.backend) as pool:
+            pool.warm_up()
+            t_start = time.perf_counter() - mulai
+
+            mulai = time.perf_counter()
+            label, bersih, _ = pool.predict_text_column(teks)
+            t_skor = time.perf_counter() - mulai
+
+        sama = label.equals(ref_label) and bersih.equals(ref_bersih)
+        gagal |= not sama
+        print(f"{f'{jumlah} worker':<24}{len(teks) / t_skor:>12,.0f} baris/s"
+              f"  (start {t_start:.1f} s, speedup {t_ref / t_skor:.2f}x, hasil identik: {sama})")
+
+    if gagal:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,68 @@
+"""Benchmark indeks terbalik (search_index.py) vs `str.contains` pada ~1 juta baris.
+
+Kolom `Teks Tweet` dari `data/Data_Lengkap_Tokenisasi.csv` diperbanyak
+hingga `--baris` baris. Diukur waktu bangun indeks, ukuran indeks, dan
+latensi kueri (kata, prefix, multi-kata AND, plus filter label)
+dibandingkan pemindaian `str.contains(..., case=False)` cara lama.
+
+Jalankan dari root repository:
+    python benchmark/bench_search_index.py [--baris 1000000]
+"""
+import argparse
+import os
+import sys
+import time
+
+import pandas as pd
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+from search_index import SearchIndex
+
+DATA_PATH = os.path.join('data', 'Data_Lengkap_Tokenisasi.csv')
+KUERI = ['kip kuliah', 'guru honorer', 'pendidik*', 'dana bos', 'sekolah', 'tunjangan guru telat']
+ULANG = 200
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--baris', type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    df = pd.read_csv(DATA_PATH, usecols=['Teks Tweet', 'Label'])
+    kali = -(-args.baris // len(df))
+    df = pd.concat([df] * kali, ignore_index=True).iloc[:args.baris]
+    teks = df['Teks Tweet']
+    mask_negatif = (df['Label'].str.lower() == 'negatif').to_numpy()
+
+    mulai = time.perf_counter()
+    index = SearchIndex.build(teks)
+    t_build = time.perf_counter() - mulai
+    ukuran = index.postings.nbytes + index.offsets.nbytes
+    print(f"Jumlah baris : {len(df):,}")
+    print(f"Bangun indeks: {t_build:.1f} s ({len(index.vocab):,} kata, postings {ukuran / 1e6:.1f} MB)")
+    print()
+    print(f"{'Kueri':<24}{'Hasil':>10}{'indeks':>12}{'+ label':>12}{'str.contains':>15}")
+
+    for kueri in KUERI:
+        mulai = time.perf_counter()
+        for _ in range(ULANG):
+            hasil = index.search(kueri)
+        t_index = (time.perf_counter() - mulai) / ULANG * 1000
+
+        mulai = time.perf_counter()
+        for _ in range(ULANG):
+            index.search(kueri, mask_negatif)
+        t_label = (time.perf_counter() - mulai) / ULANG * 1000
+
+        # Cara lama hanya mendukung satu substring; diukur sekali karena lambat
+        mulai = time.perf_counter()
+        teks.str.contains(kueri.rstrip('*').split()[0], case=False, na=False)
+        t_scan = (time.perf_counter() - mulai) * 1000
+
+        print(f"{kueri:<24}{len(hasil):>10,}{t_index:>10.3f}ms{t_label:>10.3f}ms{t_scan:>13.0f}ms")
+
+
+if __name__ == '__main__':
+    main()
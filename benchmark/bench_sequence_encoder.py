@@ -0,0 +1,66 @@
+"""Benchmark & uji kesamaan `utils.SequenceEncoder` terhadap Keras.
+
+Membandingkan `tokenizer.texts_to_sequences` + `pad_sequences` dengan encoder
+beku pada teks bersih dari `data/Data_Lengkap_Tokenisasi.csv`.
+
+Jalankan dari root repository:
+    python benchmark/bench_sequence_encoder.py
+"""
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+os.chdir(ROOT_DIR)
+
+from tensorflow.keras.preprocessing.sequence import pad_sequences
+
+from utils import MAX_SEQUENCE_LENGTH, clean_text_series, get_sequence_encoder, load_tokenizer
+
+DATA_PATH = os.path.join('data', 'Data_Lengkap_Tokenisasi.csv')
+
+
+def encode_keras(tokenizer, texts):
+    seqs = tokenizer.texts_to_sequences(texts)
+    return pad_sequences(seqs, maxlen=MAX_SEQUENCE_LENGTH, padding='post', truncating='post')
+
+
+def main():
+    tokenizer = load_tokenizer()
+    encoder = get_sequence_encoder(tokenizer)
+
+    df = pd.read_csv(DATA_PATH)
+    teks_mentah = df['Teks Tweet'].fillna('').tolist()
+    teks_bersih = clean_text_series(df['Teks Tweet']).tolist()
+
+    # --- 1. KESAMAAN OUTPUT ---
+    sama = True
+    for nama, teks in [('mentah', teks_mentah), ('bersih', teks_bersih)]:
+        hasil_sama = np.array_equal(encode_keras(tokenizer, teks), encoder.encode(teks))
+        sama = sama and hasil_sama
+        print(f"Sama dengan Keras ({nama}): {hasil_sama}")
+
+    # --- 2. BENCHMARK ---
+    korpus = teks_bersih * 20
+    mulai = time.perf_counter()
+    encode_keras(tokenizer, korpus)
+    t_keras = time.perf_counter() - mulai
+
+    mulai = time.perf_counter()
+    encoder.encode(korpus)
+    t_encoder = time.perf_counter() - mulai
+
+    print(f"\nBenchmark {len(korpus):,} teks")
+    print(f"  texts_to_sequences + pad_sequences : {t_keras:.3f} s")
+    print(f"  SequenceEncoder.encode             : {t_encoder:.3f} s  ({t_keras / t_encoder:.1f}x)")
+
+    if not sama:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,124 @@
+"""Benchmark memori per worker: bobot & kosakata mmap bersama vs salinan per proses.
+
+Untuk setiap mode, N proses worker (default 1, 4, 8) dijalankan bersamaan;
+masing-masing memuat model + tokenizer lalu menskor satu batch teks dataset
+(agar halaman bobot yang dipakai benar-benar tersentuh), kemudian menunggu.
+Selagi semua worker hidup, dari /proc/<pid>/smaps_rollup dibaca:
+- RSS   : memori resident (halaman bersama dihitung penuh di setiap proses);
+- PSS   : halaman bersama dibagi rata ke proses yang memetakannya;
+- privat: halaman milik proses itu sendiri (Private_Clean + Private_Dirty).
+Total PSS semua worker = memori fisik yang benar-benar dipakai di host;
+"per worker tambahan" = (total PSS N worker - total PSS 1 worker) / (N - 1).
+
+Mode:
+- baseline  : interpreter + import `inference` (numpy/pandas/h5py), tanpa model;
+- keras     : backend keras (TensorFlow + model .h5);
+- numpy-h5  : backend numpy, bobot & kosakata dibaca ke heap setiap proses;
+- numpy-mmap: backend numpy dengan bobot & kosakata mmap (`python numpy_backend.py`).
+
+Jalankan dari root repository (butuh model/Model_Sentiment_LSTM.h5 & .weights):
+    python benchmark/bench_shared_weights.py [--worker 1 4 8] [--mode baseline numpy-h5 numpy-mmap keras]
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MODES = ('baseline', 'numpy-h5', 'numpy-mmap', 'keras')
+
+KODE_WORKER = """
+import json, os, sys
+sys.path.insert(0, {root!r})
+import inference
+
+mode = {mode!r}
+teks = json.loads(sys.stdin.readline())
+if mode != 'baseline':
+    if mode == 'numpy-h5':
+        from numpy_backend import NumpyLSTMModel
+        model = NumpyLSTMModel.from_h5(inference.MODEL_PATH)
+        tokenizer = inference.SequenceEncoder.from_json(inference.TOKENIZER_JSON_PATH)
+    else:
+        model, tokenizer = inference.load_model_and_tokenizer('numpy' if mode == 'numpy-mmap' else 'keras')
+    inference.predict_sentiment_batch(teks, model, tokenizer, use_cache=False)
+print(json.dumps({{'pid': os.getpid(), 'jenis_model': type(model).__name__ if mode != 'baseline' else None}}), flush=True)
+sys.stdin.readline()
+"""
+
+
+def smaps(pid):
+    nilai = {}
+    with open(f'/proc/{pid}/smaps_rollup') as f:
+        for line in f:
+            parts = line.split()
+            if len(parts) == 3 and parts[2] == 'kB':
+                nilai[parts[0].rstrip(':')] = int(parts[1]) / 1024
+    return {
+        'rss': nilai['Rss'],
+        'pss': nilai['Pss'],
+        'privat': nilai['Private_Clean'] + nilai['Private_Dirty'],
+    }
+
+
+def jalankan(mode, jumlah, teks):
+    kode = KODE_WORKER.format(root=ROOT_DIR, mode=mode)
+    env = dict(os.environ, TF_CPP_MIN_LOG_LEVEL='3')
+    proses = [subprocess.Popen([sys.executable, '-c', kode], stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                               stderr=subprocess.PIPE, text=True, env=env)
+              for _ in range(jumlah)]
+    try:
+        # Teks dikirim lewat stdin agar worker tidak ikut memuat CSV/pandas
+        for p in proses:
+            p.stdin.write(json.dumps(teks) + '\n')
+            p.stdin.flush()
+        info = []
+        for p in proses:
+            baris = p.stdout.readline()
+            if not baris:
+                return None, p.stderr.read().strip().splitlines()[-1]
+            info.append(json.loads(baris))
+        return [smaps(i['pid']) for i in info], info[0]['jenis_model']
+    finally:
+        for p in proses:
+            if p.poll() is None:
+                p.stdin.write('\n')
+                p.stdin.flush()
+        for p in proses:
+            p.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--worker', type=int, nargs='+', default=[1, 4, 8])
+    parser.add_argument('--mode', nargs='+', choices=MODES, default=list(MODES))
+    parser.add_argument('--batch', type=int, default=256, help="Jumlah teks yang diskor setiap worker.")
+    args = parser.parse_args()
+
+    import pandas as pd
+
+    teks = pd.read_csv(os.path.join(ROOT_DIR, 'data', 'Data_Lengkap_Tokenisasi.csv'),
+                       usecols=['Teks Tweet'])['Teks Tweet'].astype(str).tolist()[:args.batch]
+
+    print(f"{'mode':<11}{'worker':>7}{'RSS/worker':>12}{'PSS/worker':>12}{'privat/worker':>15}"
+          f"{'total PSS':>11}{'per worker tambahan':>21}")
+    for mode in args.mode:
+        total_satu = None
+        for jumlah in args.worker:
+            hasil, keterangan = jalankan(mode, jumlah, teks)
+            if hasil is None:
+                print(f"{mode:<11}{jumlah:>7}  dilewati ({keterangan})")
+                break
+            rata = {k: sum(h[k] for h in hasil) / len(hasil) for k in hasil[0]}
+            total = sum(h['pss'] for h in hasil)
+            if jumlah == 1:
+                total_satu = total
+            tambahan = (f"{(total - total_satu) / (jumlah - 1):.1f} MB"
+                        if total_satu is not None and jumlah > 1 else '-')
+            print(f"{mode:<11}{jumlah:>7}{rata['rss']:>9.1f} MB{rata['pss']:>9.1f} MB{rata['privat']:>12.1f} MB"
+                  f"{total:>8.0f} MB{tambahan:>21}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,171 @@
+"""Laporan paritas backend TFLite terkuantisasi vs Keras.
+
+Isi laporan:
+- ukuran file model (.h5 vs .tflite);
+- waktu muat, tambahan RSS, dan puncak memori (VmHWM) per backend, masing-masing
+  di proses Python baru (muat model + tokenizer lalu satu prediksi batch);
+- akurasi & confusion matrix pada data uji berlabel di balik
+  `model/Data_Confusion_Matrix.csv` (split 80:20 stratified, random_state=42,
+  sama dengan halaman Proses Data), untuk Keras, TFLite, dan y_pred tersimpan;
+- kesepakatan label & selisih probabilitas maksimum Keras vs TFLite;
+- latensi p50/p99 satu teks dan per batch 256 teks (tanpa cache prediksi).
+
+Jalankan dari root repository (buat model TFLite dulu dengan `python tflite_backend.py`):
+    python benchmark/bench_tflite.py [--tflite model/Model_Sentiment_LSTM.tflite] [--teks 300] [--ulang-batch 20]
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+import inference
+from inference import (
+    LABELS, MODEL_PATH, PREDICT_BATCH_SIZE, load_model, load_tokenizer, predict_sentiment,
+    predict_sentiment_batch,
+)
+
+DATA_PATH = 'data/Data_Lengkap_Tokenisasi.csv'
+CONFUSION_PATH = 'model/Data_Confusion_Matrix.csv'
+
+KODE_UKUR = """
+import gc, json, sys, time
+sys.path.insert(0, {root!r})
+import numpy as np
+import inference
+
+def status(field):
+    with open('/proc/self/status') as f:
+        for line in f:
+            if line.startswith(field + ':'):
+                return int(line.split()[1]) / 1024
+
+inference.TFLITE_MODEL_PATH = {tflite!r}
+gc.collect()
+with open('/proc/self/clear_refs', 'w') as f:
+    f.write('5')
+rss_awal = status('VmRSS')
+mulai = time.perf_counter()
+model, tokenizer = inference.load_model_and_tokenizer({backend!r})
+detik = time.perf_counter() - mulai
+padded = tokenizer.encode(['pemotongan anggaran pendidikan dana bos'] * {batch})
+model.predict(padded, verbose=0)
+gc.collect()
+print(json.dumps({{'detik': detik, 'rss_mb': status('VmRSS') - rss_awal, 'puncak_mb': status('VmHWM') - rss_awal}}))
+"""
+
+
+def ukur_memori(backend, tflite_path):
+    proses = subprocess.run(
+        [sys.executable, '-c', KODE_UKUR.format(root=ROOT_DIR, tflite=tflite_path, backend=backend,
+                                                batch=PREDICT_BATCH_SIZE)],
+        capture_output=True, text=True,
+    )
+    if proses.returncode != 0:
+        return None, proses.stderr.strip().splitlines()[-1]
+    return json.loads(proses.stdout.strip().splitlines()[-1]), None
+
+
+def data_uji():
+    """Data uji 20% (stratified, random_state=42) seperti halaman Proses Data."""
+    from sklearn.model_selection import train_test_split
+
+    df = pd.read_csv(DATA_PATH).dropna(subset=['Label'])
+    _, df_test = train_test_split(df, test_size=0.2, random_state=42, stratify=df['Label'])
+    return df_test
+
+
+def cetak_confusion(nama, y_true, y_pred):
+    from sklearn.metrics import confusion_matrix
+
+    matriks = confusion_matrix(y_true, y_pred, labels=range(len(LABELS)))
+    akurasi = float(np.mean(np.asarray(y_true) == np.asarray(y_pred)))
+    print(f"\n  {nama}: akurasi {akurasi * 100:.2f}%")
+    print('    ' + 'aktual / prediksi'.ljust(18) + ''.join(f"{label:>9}" for label in LABELS))
+    for label, baris in zip(LABELS, matriks):
+        print(f"    {label:<18}" + ''.join(f"{n:>9}" for n in baris))
+    return akurasi
+
+
+def persentil(waktu):
+    waktu = np.asarray(waktu) * 1000
+    return float(np.percentile(waktu, 50)), float(np.percentile(waktu, 99))
+
+
+def ukur_latensi(model, tokenizer, teks, jumlah, ulang_batch):
+    tunggal = []
+    for t in teks[:jumlah]:
+        mulai = time.perf_counter()
+        predict_sentiment(t, model, tokenizer, use_cache=False)
+        tunggal.append(time.perf_counter() - mulai)
+    batch = []
+    for i in range(ulang_batch):
+        awal = (i * PREDICT_BATCH_SIZE) % max(len(teks) - PREDICT_BATCH_SIZE, 1)
+        mulai = time.perf_counter()
+        predict_sentiment_batch(teks[awal:awal + PREDICT_BATCH_SIZE], model, tokenizer, use_cache=False)
+        batch.append(time.perf_counter() - mulai)
+    return persentil(tunggal), persentil(batch)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--tflite', default=inference.TFLITE_MODEL_PATH)
+    parser.add_argument('--teks', type=int, default=300, help="Jumlah request satu teks.")
+    parser.add_argument('--ulang-batch', type=int, default=20, help="Jumlah panggilan batch 256 teks.")
+    args = parser.parse_args()
+    inference.TFLITE_MODEL_PATH = args.tflite
+
+    print(f"Ukuran file: {MODEL_PATH} {os.path.getsize(MODEL_PATH) / 1024:.0f} KB, "
+          f"{args.tflite} {os.path.getsize(args.tflite) / 1024:.0f} KB")
+
+    print("\nMuat model + tokenizer di proses baru:")
+    for backend in ('keras', 'tflite'):
+        hasil, error = ukur_memori(backend, args.tflite)
+        if hasil is None:
+            print(f"  {backend:<7}: dilewati ({error})")
+            continue
+        print(f"  {backend:<7}: {hasil['detik']:6.2f} s, RSS +{hasil['rss_mb']:.1f} MB, "
+              f"puncak +{hasil['puncak_mb']:.1f} MB")
+
+    tokenizer = load_tokenizer('tflite')
+    models = {'keras': load_model('keras'), 'tflite': load_model('tflite')}
+
+    df_test = data_uji()
+    y_true = df_test['label_encoded'].astype(int).to_numpy()
+    padded = tokenizer.encode(df_test['Tweet_Final'].fillna('').astype(str).tolist())
+    probabilitas = {nama: model.predict(padded, verbose=0) for nama, model in models.items()}
+
+    print(f"\nData uji: {len(df_test)} baris", end='')
+    if os.path.exists(CONFUSION_PATH):
+        tersimpan = pd.read_csv(CONFUSION_PATH)
+        print(f"; y_true sama dengan {CONFUSION_PATH}: {np.array_equal(tersimpan['y_true'].to_numpy(), y_true)}")
+        cetak_confusion('y_pred tersimpan (Data_Confusion_Matrix.csv)', tersimpan['y_true'], tersimpan['y_pred'])
+    else:
+        print()
+    for nama, prob in probabilitas.items():
+        cetak_confusion(nama, y_true, prob.argmax(axis=1))
+
+    label_keras = probabilitas['keras'].argmax(axis=1)
+    label_tflite = probabilitas['tflite'].argmax(axis=1)
+    print(f"\nKesepakatan label Keras vs TFLite: {np.mean(label_keras == label_tflite) * 100:.2f}%; "
+          f"selisih probabilitas maksimum {np.abs(probabilitas['keras'] - probabilitas['tflite']).max():.4f}")
+
+    teks = pd.read_csv(DATA_PATH)['Teks Tweet'].dropna().astype(str).tolist()
+    print(f"\nLatensi (tanpa cache): satu teks ({args.teks} request), batch {PREDICT_BATCH_SIZE} teks "
+          f"({args.ulang_batch} panggilan)")
+    for nama, model in models.items():
+        predict_sentiment(teks[0], model, tokenizer, use_cache=False)
+        (t50, t99), (b50, b99) = ukur_latensi(model, tokenizer, teks, args.teks, args.ulang_batch)
+        print(f"  {nama:<7}: satu teks p50 {t50:7.2f} ms  p99 {t99:7.2f} ms | "
+              f"batch p50 {b50:8.2f} ms  p99 {b99:8.2f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,73 @@
+"""Benchmark grafik tren: groupby per rerun vs kueri kubus (timeseries.py).
+
+Kolom `created_at`/`Label` dari `data/Data_Lengkap_Tokenisasi.csv`
+diperbanyak 1x, 10x dan 100x. Untuk tiap ukuran diukur cara lama (parse
+tanggal + filter + groupby harian) dan kueri kubus harian/mingguan, serta
+dicek bahwa hasil harian keduanya sama persis.
+
+Jalankan dari root repository:
+    python benchmark/bench_timeseries.py
+"""
+import os
+import sys
+import time
+
+import pandas as pd
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+from timeseries import SentimentCube
+
+DATA_PATH = os.path.join('data', 'Data_Lengkap_Tokenisasi.csv')
+AWAL, AKHIR = "2025-02-01", "2025-03-31"
+ULANG = 20
+
+
+def cara_lama(df):
+    tanggal = pd.to_datetime(df['created_at']).dt.date
+    label = df['Label'].astype(str).str.lower().str.strip()
+    mask = (tanggal >= pd.Timestamp(AWAL).date()) & (tanggal <= pd.Timestamp(AKHIR).date())
+    return pd.DataFrame({'Tanggal': tanggal[mask], 'Label': label[mask]}).groupby(['Tanggal', 'Label']).size()
+
+
+def ukur(fungsi):
+    mulai = time.perf_counter()
+    for _ in range(ULANG):
+        hasil = fungsi()
+    return (time.perf_counter() - mulai) / ULANG * 1000, hasil
+
+
+def main():
+    df_asli = pd.read_csv(DATA_PATH, usecols=['created_at', 'Label'])
+    gagal = False
+
+    print(f"{'Ukuran':>10}{'groupby':>12}{'bangun kubus':>15}{'kubus harian':>15}{'kubus mingguan':>16}")
+    for kali in (1, 10, 100):
+        df = pd.concat([df_asli] * kali, ignore_index=True)
+
+        t_lama, ref = ukur(lambda: cara_lama(df))
+
+        mulai = time.perf_counter()
+        df_bersih = pd.DataFrame({'created_at': pd.to_datetime(df['created_at']),
+                                  'Label_Clean': df['Label'].astype(str).str.lower().str.strip()})
+        cube = SentimentCube.from_frame(df_bersih)
+        t_bangun = (time.perf_counter() - mulai) * 1000
+
+        t_harian, harian = ukur(lambda: cube.series(AWAL, AKHIR, 'hari'))
+        t_mingguan, _ = ukur(lambda: cube.series(AWAL, AKHIR, 'minggu'))
+
+        harian = harian[harian['Jumlah'] > 0]
+        harian = harian.set_index([harian['Tanggal'].dt.date, 'Label'])['Jumlah'].sort_index()
+        if not harian.equals(ref.sort_index().rename('Jumlah')):
+            gagal = True
+
+        print(f"{len(df):>10,}{t_lama:>10.1f}ms{t_bangun:>13.1f}ms{t_harian:>13.2f}ms{t_mingguan:>14.2f}ms")
+
+    print(f"Hasil harian kubus == groupby: {not gagal}")
+    if gagal:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
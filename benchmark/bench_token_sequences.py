@@ -0,0 +1,101 @@
+"""Benchmark artefak sequence token (.npy) vs kolom string repr di CSV lama.
+
+Kolom lama `Detail_Nilai_Token` & `Token_Sequence_Padding` dibentuk ulang dari
+artefak (format sama dengan CSV sebelumnya: "kata: id, ..." dan `str(ndarray)`)
+lalu diukur:
+- ukuran file & waktu `read_csv` dataset dengan vs tanpa kedua kolom itu;
+- waktu mendapatkan matriks N x 100 int32: parse string repr vs `np.load` (mmap);
+- waktu membentuk kolom tahap 3 untuk satu halaman (20 baris): simulasi md5
+  `get_word_id` lama atas seluruh baris vs `TokenSequences.take`.
+
+Jalankan dari root repository (artefak dibuat dulu dengan `python token_sequences.py`):
+    python benchmark/bench_token_sequences.py [--ulang 5]
+"""
+import argparse
+import hashlib
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+from dataset import DATASET_PATH
+from token_sequences import TOKEN_SEQUENCES_DIR, TokenSequences
+
+
+def terbaik(fungsi, ulang):
+    hasil = float('inf')
+    for _ in range(ulang):
+        mulai = time.perf_counter()
+        fungsi()
+        hasil = min(hasil, time.perf_counter() - mulai)
+    return hasil
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--ulang', type=int, default=5)
+    args = parser.parse_args()
+
+    sequences = TokenSequences.load(TOKEN_SEQUENCES_DIR)
+    df = pd.read_csv(DATASET_PATH, dtype=str, keep_default_na=False)
+    lama = df.copy()
+    lama['Detail_Nilai_Token'] = [
+        ", ".join(f"{w}: {i}" for w, i in zip(t.split(), ids[:n]))
+        for t, ids, n in zip(df['Tweet_Final'], sequences.sequences, sequences.lengths)
+    ]
+    lama['Token_Sequence_Padding'] = [str(np.asarray(ids)) for ids in sequences.sequences]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path_lama = os.path.join(tmp, 'lama.csv')
+        lama.to_csv(path_lama, index=False)
+        ukuran_artefak = sum(os.path.getsize(os.path.join(TOKEN_SEQUENCES_DIR, f))
+                             for f in os.listdir(TOKEN_SEQUENCES_DIR))
+        print(f"Ukuran: CSV lama {os.path.getsize(path_lama) / 1024:.0f} KB, CSV baru "
+              f"{os.path.getsize(DATASET_PATH) / 1024:.0f} KB + artefak {ukuran_artefak / 1024:.0f} KB")
+        print(f"read_csv (terbaik {args.ulang}x): lama {terbaik(lambda: pd.read_csv(path_lama), args.ulang) * 1000:.1f} ms, "
+              f"baru {terbaik(lambda: pd.read_csv(DATASET_PATH), args.ulang) * 1000:.1f} ms")
+
+    kolom = lama['Token_Sequence_Padding']
+
+    def parse_repr():
+        return np.array([np.array(s.strip('[]').split(), dtype=np.int32) for s in kolom])
+
+    def muat_artefak():
+        return np.asarray(TokenSequences.load(TOKEN_SEQUENCES_DIR).sequences)
+
+    matriks = parse_repr()
+    print(f"\nMatriks {matriks.shape[0]} x {matriks.shape[1]} int32 identik dengan artefak: "
+          f"{np.array_equal(matriks, sequences.sequences)}")
+    print(f"  parse string repr : {terbaik(parse_repr, args.ulang) * 1000:8.2f} ms")
+    print(f"  np.load artefak   : {terbaik(muat_artefak, args.ulang) * 1000:8.2f} ms")
+
+    def get_word_id(word):
+        return int(hashlib.md5(word.encode()).hexdigest(), 16) % 3000 + 1
+
+    teks = df['Tweet_Final']
+
+    def simulasi_md5():
+        teks.apply(lambda t: ", ".join([f"{w}:{get_word_id(w)}" for w in str(t).split()[:10]]))
+        teks.apply(lambda t: str(([get_word_id(w) for w in str(t).split()] + [0] * 100)[:20]) + " ...")
+
+    halaman = np.arange(20)
+
+    def halaman_artefak():
+        seq, panjang = sequences.take(halaman)
+        [", ".join(f"{w}:{i}" for w, i in zip(str(t).split(), ids[:min(n, 10)]))
+         for t, ids, n in zip(teks.iloc[halaman], seq, panjang)]
+        [str(ids[:20].tolist()) + " ..." for ids in seq]
+
+    print("\nKolom tahap 3 per rerun:")
+    print(f"  simulasi md5 seluruh baris : {terbaik(simulasi_md5, args.ulang) * 1000:8.2f} ms")
+    print(f"  artefak, satu halaman      : {terbaik(halaman_artefak, args.ulang) * 1000:8.2f} ms")
+
+
+if __name__ == '__main__':
+    main()
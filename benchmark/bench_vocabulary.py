@@ -0,0 +1,114 @@
+"""Benchmark memuat tokenizer: JSON (lama) vs kosakata biner mmap (vocabulary.py).
+
+Setiap cara dimuat di proses Python baru (setelah numpy/pandas/inference
+di-import) dan diukur:
+- waktu muat sampai encoder siap, termasuk encode pertama (dict lookup kosakata
+  biner baru dibangun saat encode pertama);
+- tambahan RSS setelah muat dan puncak memori (VmHWM) selama muat.
+Cara 'keras' (`tokenizer_from_json`, termasuk import TensorFlow) hanya diukur
+bila TensorFlow terpasang.
+Lalu hasil encode kedua encoder dibandingkan pada dataset penelitian dan
+korpus sintetis, beserta throughput encode-nya.
+
+Jalankan dari root repository (file biner dibuat dulu dengan `python vocabulary.py`):
+    python benchmark/bench_vocabulary.py [--ulang 5]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+
+KODE_UKUR = """
+import gc, json, sys, time
+sys.path.insert(0, {root!r})
+import numpy as np, pandas as pd
+from inference import SequenceEncoder, TOKENIZER_JSON_PATH, TOKENIZER_VOCAB_PATH, get_sequence_encoder
+
+def status(field):
+    with open('/proc/self/status') as f:
+        for line in f:
+            if line.startswith(field + ':'):
+                return int(line.split()[1]) / 1024
+
+gc.collect()
+with open('/proc/self/clear_refs', 'w') as f:
+    f.write('5')
+rss_awal = status('VmRSS')
+mulai = time.perf_counter()
+if {cara!r} == 'json':
+    encoder = SequenceEncoder.from_json(TOKENIZER_JSON_PATH)
+elif {cara!r} == 'biner':
+    encoder = SequenceEncoder.from_binary(TOKENIZER_VOCAB_PATH)
+else:
+    from tensorflow.keras.preprocessing.text import tokenizer_from_json
+    with open(TOKENIZER_JSON_PATH, 'r', encoding='utf-8') as f:
+        content = json.load(f)
+    encoder = get_sequence_encoder(tokenizer_from_json(content if isinstance(content, str) else json.dumps(content)))
+encoder.encode(['pemotongan anggaran pendidikan'])
+detik = time.perf_counter() - mulai
+gc.collect()
+print(json.dumps({{'detik': detik, 'rss_mb': status('VmRSS') - rss_awal, 'puncak_mb': status('VmHWM') - rss_awal}}))
+"""
+
+
+def ukur(cara, ulang):
+    hasil = []
+    for _ in range(ulang):
+        proses = subprocess.run([sys.executable, '-c', KODE_UKUR.format(root=ROOT_DIR, cara=cara)],
+                                capture_output=True, text=True)
+        if proses.returncode != 0:
+            return None, proses.stderr.strip().splitlines()[-1]
+        hasil.append(json.loads(proses.stdout.strip().splitlines()[-1]))
+    return {k: statistics.median(h[k] for h in hasil) for k in hasil[0]}, None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--ulang', type=int, default=5)
+    args = parser.parse_args()
+
+    sys.path.insert(0, ROOT_DIR)
+    sys.path.insert(0, BENCH_DIR)
+    from inference import SequenceEncoder, TOKENIZER_JSON_PATH, TOKENIZER_VOCAB_PATH, clean_text_series
+
+    print(f"Ukuran file: JSON {os.path.getsize(TOKENIZER_JSON_PATH) / 1024:.0f} KB, "
+          f"biner {os.path.getsize(TOKENIZER_VOCAB_PATH) / 1024:.0f} KB")
+    print(f"\nMuat tokenizer di proses baru (median {args.ulang}x):")
+    for cara in ('json', 'keras', 'biner'):
+        hasil, error = ukur(cara, args.ulang)
+        if hasil is None:
+            print(f"  {cara:<6}: dilewati ({error})")
+            continue
+        print(f"  {cara:<6}: {hasil['detik'] * 1000:7.2f} ms, RSS +{hasil['rss_mb']:.2f} MB, "
+              f"puncak +{hasil['puncak_mb']:.2f} MB")
+
+    import pandas as pd
+    from corpus import generate_texts
+
+    dict_encoder = SequenceEncoder.from_json(TOKENIZER_JSON_PATH)
+    mmap_encoder = SequenceEncoder.from_binary(TOKENIZER_VOCAB_PATH)
+    dataset = pd.read_csv(os.path.join(ROOT_DIR, 'data', 'Data_Lengkap_Tokenisasi.csv'))['Teks Tweet'].astype(str).tolist()
+    sintetis = clean_text_series(generate_texts(100_000)).tolist()
+
+    print("\nParitas & throughput encode:")
+    for nama, teks in (('dataset', dataset), ('sintetis 100k', sintetis)):
+        sama = (dict_encoder.encode(teks) == mmap_encoder.encode(teks)).all()
+        waktu = {}
+        for label, encoder in (('json', dict_encoder), ('biner', mmap_encoder)):
+            terbaik = float('inf')
+            for _ in range(3):
+                mulai = time.perf_counter()
+                encoder.encode(teks)
+                terbaik = min(terbaik, time.perf_counter() - mulai)
+            waktu[label] = len(teks) / terbaik
+        print(f"  {nama:<14}: identik={sama}, json {waktu['json']:,.0f} baris/s, biner {waktu['biner']:,.0f} baris/s")
+
+
+if __name__ == '__main__':
+    main()
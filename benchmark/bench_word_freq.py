@@ -0,0 +1,74 @@
+"""Benchmark WordCloud: gabung teks + `generate` vs frekuensi + `generate_from_frequencies`.
+
+Memakai kolom `Tweet_Final` dari `data/Data_Lengkap_Tokenisasi.csv` yang
+diperbanyak N kali. Juga membandingkan 100 kata teratas dengan
+`WordCloud.process_text` atas teks gabungan, dan memastikan agregasi bertahap
+per chunk memberi frekuensi yang sama persis dengan agregasi sekaligus.
+
+Jalankan dari root repository:
+    python benchmark/bench_word_freq.py [--kali 20]
+"""
+import argparse
+import os
+import sys
+import time
+
+import pandas as pd
+from wordcloud import WordCloud
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+from word_freq import WordFrequencyAggregator
+
+DATA_PATH = os.path.join('data', 'Data_Lengkap_Tokenisasi.csv')
+CHUNK = 5000
+
+
+def _wordcloud():
+    return WordCloud(width=800, height=400, background_color='white', max_words=100)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--kali', type=int, default=20)
+    args = parser.parse_args()
+
+    df = pd.read_csv(DATA_PATH)
+    teks = pd.concat([df['Tweet_Final']] * args.kali, ignore_index=True)
+    label = pd.concat([df['Label']] * args.kali, ignore_index=True)
+
+    mulai = time.perf_counter()
+    wc_lama = _wordcloud()
+    freq_lama = wc_lama.process_text(" ".join(teks.dropna().astype(str)))
+    wc_lama.generate_from_frequencies(freq_lama)
+    t_lama = time.perf_counter() - mulai
+
+    mulai = time.perf_counter()
+    freq = WordFrequencyAggregator().update('Bersih', teks)['Bersih']
+    t_hitung = time.perf_counter() - mulai
+    _wordcloud().generate_from_frequencies(freq)
+    t_baru = time.perf_counter() - mulai
+
+    # Agregasi bertahap per chunk harus identik dengan agregasi sekaligus
+    sekaligus = WordFrequencyAggregator().update('Bersih', teks).update_by_label(teks, label)
+    bertahap = WordFrequencyAggregator()
+    for awal in range(0, len(teks), CHUNK):
+        bertahap.update('Bersih', teks[awal:awal + CHUNK])
+        bertahap.update_by_label(teks[awal:awal + CHUNK], label[awal:awal + CHUNK])
+    sama = all(sekaligus[n] == bertahap[n] for n in sekaligus.names())
+    top_lama = {w for w, _ in sorted(freq_lama.items(), key=lambda x: -x[1])[:100]}
+    top_baru = {w for w, _ in freq.most_common(100)}
+
+    print(f"Jumlah teks                 : {len(teks):,} ({args.kali}x)")
+    print(f"join + generate (cara lama) : {t_lama:.2f} s")
+    print(f"frekuensi + from_frequencies: {t_baru:.2f} s (hitung frekuensi {t_hitung:.2f} s, {t_lama / t_baru:.1f}x)")
+    print(f"Top-100 sama dengan generate: {len(top_lama & top_baru)}/100")
+    print(f"Agregasi per chunk identik  : {sama}")
+
+    if not sama:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,114 @@
+"""Generator korpus tweet sintetis berbahasa Indonesia untuk benchmark.
+
+Kosakata & frekuensinya diambil dari `word_counts` di
+`model/tokenizer_sentiment.json`, dicampur kata slang dari
+`inference.slang_dict`, lalu diberi unsur khas tweet (mention, hashtag, URL,
+angka, tanda baca, huruf kapital) agar jalur `clean_text` ikut teruji.
+Hasilnya memiliki kolom yang sama dengan `data/Data_Lengkap_Tokenisasi.csv`
+yang dipakai halaman Visualisasi & Proses Data.
+
+Bisa dipakai sebagai modul (`generate_corpus`) atau dijalankan langsung:
+    python benchmark/corpus.py --baris 100000 --output /tmp/korpus.csv
+"""
+import argparse
+import json
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+from inference import TOKENIZER_JSON_PATH, clean_text_series, slang_dict
+
+LABEL = ['negatif', 'netral', 'positif']
+# Proporsi label mengikuti dataset penelitian (651 / 478 / 371)
+PROPORSI_LABEL = [0.434, 0.319, 0.247]
+PANJANG_MIN, PANJANG_MAKS = 5, 45
+PELUANG_SLANG = 0.08
+AWAL_PERIODE = pd.Timestamp('2025-02-01')
+AKHIR_PERIODE = pd.Timestamp('2025-03-31 23:59:59')
+
+
+def load_vocabulary(path=None):
+    """(kata, bobot) dari `word_counts` tokenizer; bobot = frekuensi relatif."""
+    path = path or os.path.join(ROOT_DIR, TOKENIZER_JSON_PATH)
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    if isinstance(data, str):
+        data = json.loads(data)
+    word_counts = data.get('config', data)['word_counts']
+    if isinstance(word_counts, str):
+        word_counts = json.loads(word_counts)
+    words = np.array(list(word_counts), dtype=object)
+    counts = np.array(list(word_counts.values()), dtype=np.float64)
+    return words, counts / counts.sum()
+
+
+def generate_texts(n, seed=42, vocabulary=None):
+    """`n` teks tweet mentah sintetis (list of str), deterministik untuk `seed`."""
+    rng = np.random.default_rng(seed)
+    words, weights = vocabulary or load_vocabulary()
+    slang = np.array(list(slang_dict), dtype=object)
+
+    lengths = rng.integers(PANJANG_MIN, PANJANG_MAKS + 1, n)
+    total = int(lengths.sum())
+    tokens = words[rng.choice(len(words), total, p=weights)]
+    is_slang = rng.random(total) < PELUANG_SLANG
+    tokens[is_slang] = slang[rng.integers(0, len(slang), int(is_slang.sum()))]
+    # Sebagian kata diawali huruf kapital, seperti tulisan tweet asli
+    kapital = rng.random(total) < 0.1
+    tokens[kapital] = [t.capitalize() for t in tokens[kapital]]
+
+    ends = np.cumsum(lengths)
+    texts = [' '.join(tokens[end - length:end]) for end, length in zip(ends, lengths)]
+    texts = pd.Series(texts, dtype=object)
+
+    def tambah(peluang, fungsi):
+        mask = rng.random(n) < peluang
+        texts[mask] = fungsi(texts[mask], int(mask.sum()))
+
+    usernames = np.array([f"@user{i}" for i in range(500)], dtype=object)
+    tambah(0.40, lambda t, k: usernames[rng.integers(0, len(usernames), k)] + ' ' + t)
+    tambah(0.20, lambda t, k: t + ' #' + words[rng.integers(1, 200, k)])
+    tambah(0.15, lambda t, k: t + ' https://t.co/' + pd.Series(rng.integers(10**6, 10**7, k).astype(str), index=t.index))
+    tambah(0.10, lambda t, k: t + ' ' + pd.Series(rng.integers(1, 2025, k).astype(str), index=t.index) + ' persen')
+    tambah(0.30, lambda t, k: t + np.array(['...', '???', '!!', ' 😡', ' 🙏'], dtype=object)[rng.integers(0, 5, k)])
+    return texts.tolist()
+
+
+def generate_corpus(n, seed=42, vocabulary=None):
+    """DataFrame sintetis dengan kolom seperti Data_Lengkap_Tokenisasi.csv."""
+    rng = np.random.default_rng(seed + 1)
+    texts = generate_texts(n, seed, vocabulary)
+    label_idx = rng.choice(len(LABEL), n, p=PROPORSI_LABEL)
+    detik = rng.integers(0, int((AKHIR_PERIODE - AWAL_PERIODE).total_seconds()), n)
+
+    df = pd.DataFrame({
+        'No': np.arange(1, n + 1),
+        'created_at': (AWAL_PERIODE + pd.to_timedelta(np.sort(detik), unit='s')).strftime('%Y-%m-%d %H:%M:%S'),
+        'id_str': (1_880_000_000_000_000_000 + rng.integers(0, 10**16, n)).astype(str),
+        'username': np.array([f"user{i}" for i in range(max(n // 20, 50))], dtype=object)[rng.integers(0, max(n // 20, 50), n)],
+        'Teks Tweet': texts,
+        'Label': np.array(LABEL, dtype=object)[label_idx],
+    })
+    df['Tweet_Final'] = clean_text_series(df['Teks Tweet']).to_numpy()
+    df['label_encoded'] = label_idx
+    return df
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Buat korpus tweet sintetis (CSV).")
+    parser.add_argument('--baris', type=int, default=100_000)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--output', required=True)
+    args = parser.parse_args()
+
+    generate_corpus(args.baris, args.seed).to_csv(args.output, index=False)
+    print(f"{args.baris:,} baris ditulis ke {args.output}")
+
+
+if __name__ == '__main__':
+    main()
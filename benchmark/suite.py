@@ -0,0 +1,381 @@
+"""Suite benchmark performa dengan korpus sintetis (lihat corpus.py).
+
+Tahap yang diukur untuk setiap ukuran korpus (default 1e3, 1e4, 1e5, 1e6 baris):
+- load_resources   : memuat model & tokenizer (sekali);
+- clean_text       : `clean_text_series` + latensi `clean_text` per teks;
+- tokenisasi       : `SequenceEncoder.encode` + latensi per teks;
+- predict_sentiment: latensi satu teks (tanpa cache prediksi);
+- csv_batch        : `predict_csv_stream` atas file CSV (latensi per chunk);
+- visualisasi_load : parse CSV ke cache kolumnar, muat ulang kolom Visualisasi
+                     dari cache, dan kueri satu halaman Data Explorer.
+Setiap tahap mencatat durasi, throughput (baris/detik), latensi p50/p99 bila
+relevan, serta puncak memori (VmHWM, di-reset per tahap lewat
+/proc/self/clear_refs). Durasi adalah median dari `--ulang` kali pengukuran
+(pengulangan berhenti lebih awal bila total waktunya melewati
+WAKTU_MAKS_ULANG detik); puncak memori adalah maksimumnya. Hasil disimpan
+sebagai JSON lalu dibandingkan dengan baseline (`benchmark/baseline.json`);
+keluar dengan kode 1 bila ada regresi melebihi ambang. Throughput tahap yang
+di baseline selesai kurang dari DETIK_MINIMUM_BANDING (0.25 s) tidak
+dibandingkan, dan latensi p50 baru dianggap regresi bila naik lebih dari 1 ms:
+pada durasi sesingkat itu noise jadwal CPU saja sudah melewati ambang.
+
+Baseline bergantung pada mesin: buat ulang di mesin CI/server sendiri dengan
+`--simpan-baseline` sebelum dipakai sebagai patokan.
+
+Jalankan dari root repository (tahap model butuh model/Model_Sentiment_LSTM.h5):
+    python benchmark/suite.py [--ukuran 1000 10000] [--tahap clean_text tokenisasi]
+                              [--backend numpy] [--ulang 5] [--simpan-baseline]
+"""
+import argparse
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT_DIR = os.path.dirname(BENCH_DIR)
+sys.path.insert(0, ROOT_DIR)
+
+from corpus import generate_corpus, load_vocabulary
+from dataset import DatasetCache, _caches, fetch_page, select_rows
+from inference import (
+    INFERENCE_BACKEND, ResourceLoadError, clean_text, clean_text_series, get_prediction_cache,
+    get_sequence_encoder, load_model_and_tokenizer, load_tokenizer, predict_csv_stream, predict_sentiment,
+)
+
+UKURAN_DEFAULT = (1_000, 10_000, 100_000, 1_000_000)
+TAHAP = ('load_resources', 'clean_text', 'tokenisasi', 'predict_sentiment', 'csv_batch', 'visualisasi_load')
+TAHAP_MODEL = ('load_resources', 'predict_sentiment', 'csv_batch')
+KOLOM_VISUALISASI = ['created_at', 'username', 'Teks Tweet', 'Label', 'Label_Clean', 'Tweet_Final']
+
+SAMPEL_LATENSI = 1000
+SAMPEL_PREDIKSI = 200
+CHUNK_CSV = 20_000
+ULANG_DEFAULT = 5
+WAKTU_MAKS_ULANG = 60.0
+
+BASELINE_PATH = os.path.join(BENCH_DIR, 'baseline.json')
+HASIL_DIR = os.path.join(BENCH_DIR, 'hasil')
+
+# Ambang regresi relatif per metrik, plus batas absolut agar noise kecil diabaikan
+AMBANG = {
+    'baris_per_detik': 0.20,  # turun lebih dari 20%
+    'p50_ms': 0.25,
+    'p99_ms': 0.50,
+    'puncak_mb': 0.20,
+}
+AMBANG_ABSOLUT = {'p50_ms': 1.0, 'p99_ms': 2.0, 'puncak_mb': 20.0}
+DETIK_MINIMUM_BANDING = 0.25
+
+# ==============================================================================
+# PENGUKURAN
+# ==============================================================================
+def _status_mb(field):
+    try:
+        with open('/proc/self/status') as f:
+            for line in f:
+                if line.startswith(field + ':'):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return None
+
+
+def _reset_puncak():
+    try:
+        with open('/proc/self/clear_refs', 'w') as f:
+            f.write('5')
+    except OSError:
+        pass
+
+
+def ukur(fungsi):
+    """Jalankan `fungsi()`, kembalikan (hasil, detik, puncak_mb, tambahan_mb)."""
+    _reset_puncak()
+    rss_awal = _status_mb('VmRSS')
+    mulai = time.perf_counter()
+    hasil = fungsi()
+    detik = time.perf_counter() - mulai
+    puncak = _status_mb('VmHWM')
+    tambahan = None if puncak is None or rss_awal is None else max(puncak - rss_awal, 0.0)
+    return hasil, detik, puncak, tambahan
+
+
+def ukur_berulang(fungsi, ulang, sebelum=None):
+    """`ukur` sebanyak `ulang` kali: (hasil terakhir, median detik, puncak maks, tambahan maks, n).
+
+    `sebelum()` dipanggil sebelum setiap pengukuran (di luar waktu yang diukur).
+    """
+    semua = []
+    for _ in range(max(ulang, 1)):
+        if sebelum is not None:
+            sebelum()
+        semua.append(ukur(fungsi))
+        if sum(u[1] for u in semua) > WAKTU_MAKS_ULANG:
+            break
+    puncak = [u[2] for u in semua if u[2] is not None]
+    tambahan = [u[3] for u in semua if u[3] is not None]
+    return (semua[-1][0], float(np.median([u[1] for u in semua])),
+            max(puncak) if puncak else None, max(tambahan) if tambahan else None, len(semua))
+
+
+def latensi_ms(fungsi, argumen, ulang=1):
+    """(p50, p99) dalam ms; dengan `ulang` > 1, median dari persentil tiap putaran."""
+    argumen = list(argumen)
+    persentil = []
+    for _ in range(max(ulang, 1)):
+        waktu = []
+        for arg in argumen:
+            mulai = time.perf_counter()
+            fungsi(arg)
+            waktu.append((time.perf_counter() - mulai) * 1000)
+        persentil.append((np.percentile(waktu, 50), np.percentile(waktu, 99)))
+    p50, p99 = np.median(persentil, axis=0)
+    return float(p50), float(p99)
+
+
+def metrik(baris, detik, puncak, tambahan, p50=None, p99=None, ulang=1):
+    hasil = {
+        'baris': baris,
+        'ulang': ulang,
+        'detik': round(detik, 4),
+        'baris_per_detik': round(baris / detik, 1) if detik > 0 else None,
+        'puncak_mb': None if puncak is None else round(puncak, 1),
+        'tambahan_mb': None if tambahan is None else round(tambahan, 1),
+    }
+    if p50 is not None:
+        hasil['p50_ms'] = round(p50, 4)
+        hasil['p99_ms'] = round(p99, 4)
+    return hasil
+
+# ==============================================================================
+# TAHAP
+# ==============================================================================
+def tahap_clean_text(ctx):
+    teks = ctx['df']['Teks Tweet']
+    _, detik, puncak, tambahan, ulang = ukur_berulang(lambda: clean_text_series(teks), ctx['ulang'])
+    p50, p99 = latensi_ms(clean_text, teks.iloc[:SAMPEL_LATENSI], ctx['ulang'])
+    return metrik(len(teks), detik, puncak, tambahan, p50, p99, ulang)
+
+
+def tahap_tokenisasi(ctx):
+    encoder = get_sequence_encoder(ctx['tokenizer'])
+    bersih = ctx['df']['Tweet_Final'].tolist()
+    _, detik, puncak, tambahan, ulang = ukur_berulang(lambda: encoder.encode(bersih), ctx['ulang'])
+    p50, p99 = latensi_ms(lambda t: encoder.encode([t]), bersih[:SAMPEL_LATENSI], ctx['ulang'])
+    return metrik(len(bersih), detik, puncak, tambahan, p50, p99, ulang)
+
+
+def tahap_predict_sentiment(ctx):
+    model, tokenizer = ctx['model'], ctx['tokenizer']
+    teks = ctx['df']['Teks Tweet'].iloc[:SAMPEL_PREDIKSI].tolist()
+    predict_sentiment(teks[0], model, tokenizer, use_cache=False)  # pemanasan
+
+    persentil = []
+
+    def jalankan():
+        persentil.append(latensi_ms(lambda t: predict_sentiment(t, model, tokenizer, use_cache=False), teks))
+
+    _, detik, puncak, tambahan, ulang = ukur_berulang(jalankan, ctx['ulang'])
+    p50, p99 = np.median(persentil, axis=0)
+    return metrik(len(teks), detik, puncak, tambahan, float(p50), float(p99), ulang)
+
+
+def tahap_csv_batch(ctx):
+    per_chunk = []
+    output_path = os.path.join(ctx['tmp'], 'hasil_batch.csv')
+
+    def jalankan():
+        waktu_chunk = [time.perf_counter()]
+        summary = predict_csv_stream(ctx['csv_path'], 'Teks Tweet', ctx['model'], ctx['tokenizer'], output_path,
+                                     chunksize=CHUNK_CSV, progress_callback=lambda _: waktu_chunk.append(time.perf_counter()))
+        per_chunk.extend(np.diff(waktu_chunk) * 1000)
+        return summary
+
+    # Cache prediksi dikosongkan agar setiap pengulangan benar-benar menskor ulang
+    summary, detik, puncak, tambahan, ulang = ukur_berulang(
+        jalankan, ctx['ulang'], sebelum=lambda: get_prediction_cache(ctx['model']).clear())
+    os.remove(output_path)
+    return metrik(summary['total'], detik, puncak, tambahan,
+                  float(np.percentile(per_chunk, 50)), float(np.percentile(per_chunk, 99)), ulang)
+
+
+def tahap_visualisasi_load(ctx):
+    cache_dir = os.path.join(ctx['tmp'], 'cache')
+    path = ctx['csv_path']
+
+    def dingin():
+        cache = DatasetCache(path, cache_dir)
+        return len(cache.load(KOLOM_VISUALISASI))
+
+    # Cache disk dihapus sebelum setiap pengulangan agar selalu parse CSV dari awal
+    baris, detik, puncak, tambahan, ulang = ukur_berulang(
+        dingin, ctx['ulang'], sebelum=lambda: shutil.rmtree(cache_dir, ignore_errors=True))
+    hasil = metrik(baris, detik, puncak, tambahan, ulang=ulang)
+
+    # Proses baru dengan cache di disk: hanya kolom Visualisasi yang dibaca
+    cache = DatasetCache(path, cache_dir)
+    _, detik_hangat, _, _, _ = ukur_berulang(lambda: len(cache.load(KOLOM_VISUALISASI)), ctx['ulang'])
+    _caches[path] = cache
+
+    def halaman(i):
+        rows = select_rows({'Label_Clean': 'negatif'}, sort_by='created_at', ascending=bool(i % 2), path=path)
+        return fetch_page(['created_at', 'username', 'Teks Tweet', 'Label_Clean'], rows, i + 1, 20, path)
+
+    p50, p99 = latensi_ms(halaman, range(50), ctx['ulang'])
+    hasil.update({'detik_cache_hangat': round(detik_hangat, 4), 'p50_ms': round(p50, 4), 'p99_ms': round(p99, 4)})
+    del _caches[path]
+    return hasil
+
+
+FUNGSI_TAHAP = {
+    'clean_text': tahap_clean_text,
+    'tokenisasi': tahap_tokenisasi,
+    'predict_sentiment': tahap_predict_sentiment,
+    'csv_batch': tahap_csv_batch,
+    'visualisasi_load': tahap_visualisasi_load,
+}
+
+# ==============================================================================
+# BASELINE
+# ==============================================================================
+def bandingkan(hasil, baseline):
+    """Daftar (tahap, ukuran, metrik, nilai_baseline, nilai_baru, regresi?).
+
+    Throughput tahap yang di baseline lebih cepat dari DETIK_MINIMUM_BANDING
+    dilewati (terlalu singkat untuk dibandingkan dengan stabil).
+    """
+    baris = []
+    for tahap, per_ukuran in hasil['hasil'].items():
+        for ukuran, nilai in per_ukuran.items():
+            dasar = baseline.get('hasil', {}).get(tahap, {}).get(ukuran)
+            if not dasar:
+                continue
+            for nama, ambang in AMBANG.items():
+                lama, baru = dasar.get(nama), nilai.get(nama)
+                if lama is None or baru is None:
+                    continue
+                if nama == 'baris_per_detik' and dasar.get('detik', 0) < DETIK_MINIMUM_BANDING:
+                    continue
+                if nama == 'baris_per_detik':
+                    regresi = baru < lama * (1 - ambang)
+                else:
+                    regresi = baru > lama * (1 + ambang) and baru - lama > AMBANG_ABSOLUT.get(nama, 0)
+                baris.append((tahap, ukuran, nama, lama, baru, regresi))
+    return baris
+
+
+def info_lingkungan(backend):
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT_DIR,
+                                capture_output=True, text=True).stdout.strip() or None
+    except OSError:
+        commit = None
+    return {
+        'waktu': time.strftime('%Y-%m-%d %H:%M:%S'),
+        'commit': commit,
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'pandas': pd.__version__,
+        'platform': platform.platform(),
+        'cpu': os.cpu_count(),
+        'backend': backend,
+    }
+
+# ==============================================================================
+# MAIN
+# ==============================================================================
+def main():
+    parser = argparse.ArgumentParser(description="Suite benchmark performa dengan korpus sintetis.")
+    parser.add_argument('--ukuran', type=int, nargs='+', default=list(UKURAN_DEFAULT))
+    parser.add_argument('--tahap', nargs='+', choices=TAHAP, default=list(TAHAP))
+    parser.add_argument('--backend', default=None, help="keras / numpy (default: SENTIMEN_BACKEND)")
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--ulang', type=int, default=ULANG_DEFAULT,
+                        help="Jumlah pengulangan per tahap; yang dibandingkan adalah median durasinya.")
+    parser.add_argument('--output', help="File JSON hasil (default: benchmark/hasil/suite_<waktu>.json)")
+    parser.add_argument('--baseline', default=BASELINE_PATH)
+    parser.add_argument('--simpan-baseline', action='store_true', help="Simpan hasil run ini sebagai baseline.")
+    args = parser.parse_args()
+
+    backend = args.backend or INFERENCE_BACKEND
+    hasil = {'lingkungan': info_lingkungan(backend), 'hasil': {}}
+    ctx = {'model': None, 'tokenizer': None, 'ulang': args.ulang}
+
+    butuh_model = [t for t in args.tahap if t in TAHAP_MODEL]
+    if butuh_model:
+        try:
+            (model_tokenizer, detik, puncak, tambahan) = ukur(lambda: load_model_and_tokenizer(backend))
+            ctx['model'], ctx['tokenizer'] = model_tokenizer
+            if 'load_resources' in args.tahap:
+                hasil['hasil']['load_resources'] = {'sekali': metrik(1, detik, puncak, tambahan)}
+        except ResourceLoadError as e:
+            print(f"{e} -> tahap {', '.join(butuh_model)} dilewati.", file=sys.stderr)
+            args.tahap = [t for t in args.tahap if t not in TAHAP_MODEL]
+    if 'tokenisasi' in args.tahap and ctx['tokenizer'] is None:
+        try:
+            ctx['tokenizer'] = load_tokenizer(backend)
+        except ResourceLoadError as e:
+            print(f"{e} -> tahap tokenisasi dilewati.", file=sys.stderr)
+            args.tahap.remove('tokenisasi')
+
+    vocabulary = load_vocabulary()
+    with tempfile.TemporaryDirectory() as tmp:
+        ctx['tmp'] = tmp
+        for ukuran in args.ukuran:
+            mulai = time.perf_counter()
+            ctx['df'] = generate_corpus(ukuran, args.seed, vocabulary)
+            ctx['csv_path'] = os.path.join(tmp, f'korpus_{ukuran}.csv')
+            ctx['df'].to_csv(ctx['csv_path'], index=False)
+            print(f"\n== {ukuran:,} baris (korpus dibuat dalam {time.perf_counter() - mulai:.1f} s)")
+
+            for tahap in args.tahap:
+                if tahap not in FUNGSI_TAHAP:
+                    continue
+                nilai = FUNGSI_TAHAP[tahap](ctx)
+                hasil['hasil'].setdefault(tahap, {})[str(ukuran)] = nilai
+                latensi = f", p50 {nilai['p50_ms']:.3f} ms, p99 {nilai['p99_ms']:.3f} ms" if 'p50_ms' in nilai else ""
+                memori = f", puncak {nilai['puncak_mb']:.0f} MB (+{nilai['tambahan_mb']:.0f})" if nilai['puncak_mb'] else ""
+                print(f"  {tahap:<18}{nilai['baris_per_detik'] or 0:>14,.0f} baris/s (median {nilai['ulang']}x)"
+                      f"{latensi}{memori}")
+            os.remove(ctx['csv_path'])
+
+    output = args.output or os.path.join(HASIL_DIR, time.strftime('suite_%Y%m%d-%H%M%S.json'))
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(hasil, f, indent=2, ensure_ascii=False)
+    print(f"\nHasil disimpan di {output}")
+
+    if args.simpan_baseline:
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump(hasil, f, indent=2, ensure_ascii=False)
+        print(f"Baseline diperbarui: {args.baseline}")
+        return
+
+    if not os.path.exists(args.baseline):
+        print("Baseline belum ada; jalankan dengan --simpan-baseline untuk membuatnya.")
+        return
+    with open(args.baseline, encoding='utf-8') as f:
+        baseline = json.load(f)
+
+    perbandingan = bandingkan(hasil, baseline)
+    regresi = [b for b in perbandingan if b[5]]
+    print(f"\nPerbandingan dengan baseline ({baseline['lingkungan'].get('commit')}, {baseline['lingkungan'].get('waktu')}):")
+    for tahap, ukuran, nama, lama, baru, gagal in perbandingan:
+        perubahan = (baru - lama) / lama * 100 if lama else 0.0
+        print(f"  {'REGRESI' if gagal else 'ok':<8}{tahap:<18}{ukuran:>9} {nama:<16}{lama:>14,.3f} -> {baru:>14,.3f} ({perubahan:+.1f}%)")
+    if regresi:
+        print(f"\n{len(regresi)} metrik melewati ambang regresi.")
+        sys.exit(1)
+    print("\nTidak ada regresi.")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,113 @@
+"""Skoring sentimen file CSV dari command line (tanpa Streamlit).
+
+Memakai pipeline yang sama dengan halaman "Analisis File CSV": file dibaca
+per chunk, diprediksi, lalu hasilnya langsung ditulis ke disk (kolom
+`Teks_Bersih` & `Prediksi_Sentimen` ditambahkan). Cocok untuk job terjadwal.
+
+Contoh:
+    python cli.py data/tweet_baru.csv --kolom "Teks Tweet" --format csv.gz --workers 4
+    python cli.py a.csv b.csv --output-dir hasil --format jsonl --batch-size 512
+"""
+import argparse
+import os
+import sys
+import time
+
+from inference import (
+    INFERENCE_BACKENDS, OUTPUT_FORMATS, PREDICT_BATCH_SIZE, STREAM_CHUNK_SIZE,
+    ResourceLoadError, load_model_and_tokenizer, predict_csv_stream,
+)
+
+
+def output_path_for(input_path, output_dir, fmt):
+    stem = os.path.basename(input_path)
+    for ext in ('.csv.gz', '.csv'):
+        if stem.lower().endswith(ext):
+            stem = stem[:-len(ext)]
+            break
+    return os.path.join(output_dir or os.path.dirname(input_path) or '.', f"{stem}.prediksi.{fmt}")
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Skoring sentimen file CSV dengan model LSTM.")
+    parser.add_argument('input', nargs='+', help="File CSV yang akan diskor (boleh .csv.gz).")
+    parser.add_argument('--kolom', default='Teks Tweet', help="Nama kolom teks (default: %(default)s).")
+    parser.add_argument('--format', choices=OUTPUT_FORMATS, default='csv', help="Format file hasil (default: %(default)s).")
+    parser.add_argument('--output-dir', help="Folder hasil (default: folder yang sama dengan file input).")
+    parser.add_argument('--batch-size', type=int, default=PREDICT_BATCH_SIZE, help="Ukuran mini-batch model (default: %(default)s).")
+    parser.add_argument('--chunksize', type=int, default=STREAM_CHUNK_SIZE, help="Jumlah baris per chunk baca (default: %(default)s).")
+    parser.add_argument('--workers', type=int, default=1, help="Jumlah proses worker; >1 memakai scoring_pool (default: %(default)s).")
+    parser.add_argument('--backend', choices=INFERENCE_BACKENDS, help="Backend inferensi (default: env SENTIMEN_BACKEND).")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.output_dir:
+        os.makedirs(args.output_dir, exist_ok=True)
+
+    pool = None
+    model = tokenizer = None
+    mulai = time.perf_counter()
+    try:
+        if args.workers > 1:
+            from scoring_pool import ScoringPool
+
+            pool = ScoringPool(args.workers, backend=args.backend)
+            pool.warm_up()
+        else:
+            model, tokenizer = load_model_and_tokenizer(args.backend)
+    except ResourceLoadError as e:
+        print(str(e), file=sys.stderr)
+        return 2
+    print(f"Model siap dalam {time.perf_counter() - mulai:.1f} s ({max(args.workers, 1)} proses)", file=sys.stderr)
+
+    gagal = 0
+    total_baris = 0
+    mulai_semua = time.perf_counter()
+    try:
+        for input_path in args.input:
+            output_path = output_path_for(input_path, args.output_dir, args.format)
+            mulai = time.perf_counter()
+
+            def progress(baris):
+                # Progress hanya untuk terminal interaktif, log job tetap bersih
+                if sys.stderr.isatty():
+                    print(f"\r{input_path}: {baris:,} baris", end='', file=sys.stderr, flush=True)
+
+            try:
+                summary = predict_csv_stream(
+                    input_path, args.kolom, model, tokenizer, output_path,
+                    chunksize=args.chunksize, batch_size=args.batch_size, preview_rows=0,
+                    progress_callback=progress, pool=pool, with_word_freq=False,
+                )
+            except KeyError:
+                print(f"{input_path}: kolom '{args.kolom}' tidak ditemukan.", file=sys.stderr)
+                gagal += 1
+                continue
+            except (OSError, ValueError) as e:
+                print(f"{input_path}: gagal dibaca ({e}).", file=sys.stderr)
+                gagal += 1
+                continue
+
+            durasi = time.perf_counter() - mulai
+            total_baris += summary['total']
+            label = ", ".join(f"{k}={v:,}" for k, v in sorted(summary['label_counts'].items()))
+            if sys.stderr.isatty():
+                print(file=sys.stderr)
+            print(f"{input_path} -> {output_path}", file=sys.stderr)
+            print(f"  {summary['total']:,} baris dalam {durasi:.1f} s "
+                  f"({summary['total'] / max(durasi, 1e-9):,.0f} baris/s), error {summary['errors']:,}; {label}",
+                  file=sys.stderr)
+    finally:
+        if pool is not None:
+            pool.close()
+
+    durasi = time.perf_counter() - mulai_semua
+    print(f"Total: {total_baris:,} baris dari {len(args.input) - gagal} file dalam {durasi:.1f} s "
+          f"({total_baris / max(durasi, 1e-9):,.0f} baris/s)", file=sys.stderr)
+    return 1 if gagal else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,362 @@
+"""Lapisan data bersama untuk dataset penelitian (Data_Lengkap_Tokenisasi.csv).
+
+CSV hanya di-parse sekali menjadi cache kolumnar bertipe di `data/.cache`
+(satu file pickle per kolom), lalu setiap halaman cukup meminta kolom yang
+dibutuhkan saja. Cache otomatis dibangun ulang bila isi CSV sumber berubah.
+Modul ini tidak bergantung pada Streamlit.
+"""
+import hashlib
+import json
+import os
+import math
+import pickle
+import threading
+
+import numpy as np
+import pandas as pd
+
+from perf import timed
+
+# ==============================================================================
+# 1. KONFIGURASI
+# ==============================================================================
+DATASET_PATH = 'data/Data_Lengkap_Tokenisasi.csv'
+CACHE_DIR = 'data/.cache'
+# Naikkan bila cara konversi tipe kolom di bawah ini berubah
+CACHE_FORMAT_VERSION = 1
+
+LABEL_CATEGORIES = ['negatif', 'netral', 'positif']
+
+# ==============================================================================
+# 2. KONVERSI TIPE KOLOM
+# ==============================================================================
+@timed('dataset.parse')
+def _read_source(path):
+    # id_str dibaca apa adanya sebagai teks agar tidak kehilangan presisi float
+    df = pd.read_csv(path, dtype={'id_str': str})
+
+    if 'created_at' in df.columns:
+        df['created_at'] = pd.to_datetime(df['created_at'], errors='coerce')
+    if 'Label' in df.columns:
+        df['Label'] = df['Label'].astype('category')
+        label_clean = df['Label'].astype(str).str.lower().str.strip()
+        categories = LABEL_CATEGORIES + sorted(set(label_clean.unique()) - set(LABEL_CATEGORIES))
+        df['Label_Clean'] = pd.Categorical(label_clean, categories=categories)
+    if 'label_encoded' in df.columns:
+        df['label_encoded'] = pd.to_numeric(df['label_encoded'], downcast='integer')
+    if 'username' in df.columns:
+        df['username'] = df['username'].astype('category')
+    return df
+
+# ==============================================================================
+# 3. CACHE KOLUMNAR DI DISK
+# ==============================================================================
+def _file_hash(path):
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _stat_signature(path):
+    st_ = os.stat(path)
+    return [st_.st_size, st_.st_mtime_ns]
+
+
+class DatasetCache:
+    """Cache kolumnar untuk satu file CSV sumber.
+
+    Validitas dicek lewat (ukuran, mtime) file sumber; bila berbeda, hash isi
+    file yang menentukan apakah cache perlu dibangun ulang. Kolom yang sudah
+    dibaca disimpan di memori proses sehingga pemanggilan berikutnya instan.
+    """
+
+    def __init__(self, source_path=DATASET_PATH, cache_dir=CACHE_DIR):
+        self.source_path = source_path
+        self.cache_dir = cache_dir
+        self.prefix = os.path.splitext(os.path.basename(source_path))[0]
+        self.manifest_path = os.path.join(cache_dir, self.prefix + '.manifest.json')
+        self._lock = threading.RLock()
+        self._manifest = None
+        self._columns = {}
+
+    # --- manifest -------------------------------------------------------------
+    def _read_manifest(self):
+        try:
+            with open(self.manifest_path, encoding='utf-8') as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if manifest.get('format') != CACHE_FORMAT_VERSION:
+            return None
+        return manifest
+
+    def _write_manifest(self, manifest):
+        tmp_path = self.manifest_path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, ensure_ascii=False)
+        os.replace(tmp_path, self.manifest_path)
+
+    def _is_fresh(self, manifest, signature):
+        if manifest is None:
+            return False
+        if manifest['signature'] == signature:
+            return True
+        # mtime berubah (mis. file di-copy ulang) tapi isinya bisa saja sama
+        if manifest['source_hash'] == _file_hash(self.source_path):
+            manifest['signature'] = signature
+            self._write_manifest(manifest)
+            return True
+        return False
+
+    def _ensure(self):
+        """Pastikan cache di disk sesuai dengan CSV sumber, kembalikan manifest."""
+        if not os.path.exists(self.source_path):
+            raise FileNotFoundError(self.source_path)
+
+        signature = _stat_signature(self.source_path)
+        if self._manifest is not None and self._manifest['signature'] == signature:
+            return self._manifest
+
+        with self._lock:
+            manifest = self._manifest or self._read_manifest()
+            if not self._is_fresh(manifest, signature):
+                self._columns = {}
+                manifest = self._build(signature)
+            self._manifest = manifest
+            return manifest
+
+    def _build(self, signature):
+        os.makedirs(self.cache_dir, exist_ok=True)
+        source_hash = _file_hash(self.source_path)
+        version = source_hash[:12]
+        df = _read_source(self.source_path)
+
+        files = {}
+        for i, column in enumerate(df.columns):
+            filename = f"{self.prefix}.{version}.{i:03d}.pkl"
+            # Tulis ke file sementara lalu os.replace: proses lain yang sedang
+            # membaca lewat manifest tidak pernah melihat pickle setengah jadi
+            final_path = os.path.join(self.cache_dir, filename)
+            tmp_path = f"{final_path}.{os.getpid()}.tmp"
+            df[column].to_pickle(tmp_path)
+            os.replace(tmp_path, final_path)
+            files[column] = filename
+
+        manifest = {
+            'format': CACHE_FORMAT_VERSION,
+            'source': os.path.basename(self.source_path),
+            'signature': signature,
+            'source_hash': source_hash,
+            'version': version,
+            'rows': len(df),
+            'columns': list(df.columns),
+            'files': files,
+        }
+        self._write_manifest(manifest)
+        self._remove_stale(files.values())
+        self._columns = {column: df[column] for column in df.columns}
+        return manifest
+
+    def _remove_stale(self, keep):
+        keep = set(keep)
+        for name in os.listdir(self.cache_dir):
+            if name.startswith(self.prefix + '.') and name.endswith('.pkl') and name not in keep:
+                try:
+                    os.remove(os.path.join(self.cache_dir, name))
+                except OSError:
+                    pass
+
+    # --- API ----------------------------------------------------------------
+    @property
+    def version(self):
+        return self._ensure()['version']
+
+    @property
+    def columns(self):
+        return list(self._ensure()['columns'])
+
+    def __len__(self):
+        return self._ensure()['rows']
+
+    def load(self, columns=None, rows=None):
+        """DataFrame berisi kolom yang diminta (default: semua kolom CSV + turunan).
+
+        Bila `rows` (array nomor baris) diberikan, hanya baris tersebut yang
+        diambil dari tiap kolom; index hasil = nomor baris aslinya.
+        """
+        manifest = self._ensure()
+        if columns is None:
+            columns = manifest['columns']
+        else:
+            columns = [c for c in columns if c in manifest['files']]
+
+        try:
+            data = self._read_columns(manifest, columns)
+        except (OSError, EOFError, ValueError, pickle.UnpicklingError):
+            # File kolom dihapus/terpotong oleh build proses lain: bangun ulang sekali
+            manifest = self._rebuild()
+            columns = [c for c in columns if c in manifest['files']]
+            data = self._read_columns(manifest, columns)
+
+        if rows is not None:
+            data = {column: series.iloc[rows] for column, series in data.items()}
+        if not data:
+            return pd.DataFrame(index=pd.RangeIndex(manifest['rows']) if rows is None else pd.Index(rows))
+        return pd.DataFrame(data)
+
+    def _read_columns(self, manifest, columns):
+        with self._lock:
+            for column in columns:
+                if column not in self._columns:
+                    path = os.path.join(self.cache_dir, manifest['files'][column])
+                    self._columns[column] = pd.read_pickle(path)
+            return {column: self._columns[column] for column in columns}
+
+    def _rebuild(self):
+        with self._lock:
+            self._manifest = None
+            self._columns = {}
+            self._manifest = self._build(_stat_signature(self.source_path))
+            return self._manifest
+
+    def clear_memory(self):
+        with self._lock:
+            self._columns = {}
+
+# ==============================================================================
+# 4. API MODUL
+# ==============================================================================
+_caches = {}
+_caches_lock = threading.Lock()
+
+
+def get_dataset_cache(path=DATASET_PATH):
+    with _caches_lock:
+        if path not in _caches:
+            _caches[path] = DatasetCache(path)
+        return _caches[path]
+
+
+def load_dataset(columns=None, path=DATASET_PATH):
+    """Baca dataset (atau sebagian kolomnya). FileNotFoundError bila CSV tidak ada."""
+    return get_dataset_cache(path).load(columns)
+
+
+def dataset_version(path=DATASET_PATH):
+    """Hash pendek isi CSV sumber, berubah setiap kali dataset berubah."""
+    return get_dataset_cache(path).version
+
+
+def dataset_columns(path=DATASET_PATH):
+    """Nama kolom yang tersedia (kolom CSV + turunan) tanpa membaca datanya."""
+    return get_dataset_cache(path).columns
+
+# ==============================================================================
+# 5. TABEL HASIL TRAINING (model/*.csv)
+# ==============================================================================
+_tables = {}
+_tables_lock = threading.Lock()
+
+
+def load_table(path, index_col=None):
+    """Baca CSV kecil (mis. Tabel_Performa_LSTM.csv) sekali per perubahan file."""
+    key = (path, index_col)
+    signature = _stat_signature(path)
+    with _tables_lock:
+        cached = _tables.get(key)
+        if cached is None or cached[0] != signature:
+            cached = (signature, pd.read_csv(path, index_col=index_col))
+            _tables[key] = cached
+    return cached[1].copy()
+
+# ==============================================================================
+# 6. KUERI BERHALAMAN (DATA EXPLORER)
+# ==============================================================================
+# Filter, pencarian, dan pengurutan dikerjakan pada array nomor baris; hanya
+# satu halaman dari kolom yang ditampilkan yang dibentuk menjadi DataFrame.
+_sort_orders = {}
+_sort_lock = threading.Lock()
+
+
+def _sort_order(cache, column, ascending=True):
+    """(urutan, peringkat) baris bila `column` diurutkan, sekali per versi & arah.
+
+    Sama dengan `sort_values(kind='mergesort', na_position='last')`: nilai kembar
+    tetap dalam urutan asli dan NaN/NaT di akhir, juga untuk urutan turun.
+    """
+    key = (cache.source_path, cache.version, column, ascending)
+    with _sort_lock:
+        if key not in _sort_orders:
+            values = cache.load([column])[column].reset_index(drop=True)
+            order = values.sort_values(ascending=ascending, kind='mergesort', na_position='last').index.to_numpy()
+            rank = np.empty(len(order), dtype=np.int64)
+            rank[order] = np.arange(len(order))
+            for old_key in [k for k in _sort_orders
+                            if k[0] == key[0] and k[2] == column and k[1] != key[1]]:
+                del _sort_orders[old_key]
+            _sort_orders[key] = (order, rank)
+        return _sort_orders[key]
+
+
+def _filter_mask(cache, filters):
+    mask = None
+    for column, values in (filters or {}).items():
+        if values is None:
+            continue
+        if isinstance(values, str) or not isinstance(values, (list, tuple, set)):
+            values = [values]
+        column_mask = cache.load([column])[column].isin(list(values)).to_numpy()
+        mask = column_mask if mask is None else mask & column_mask
+    return mask
+
+
+def select_rows(filters=None, search=None, search_field='Teks Tweet', sort_by=None, ascending=True, path=DATASET_PATH):
+    """Nomor baris hasil filter + pencarian + urutan, atau None (semua baris, urutan asli).
+
+    - `filters`: {kolom: nilai atau daftar nilai yang diizinkan};
+    - `search`: kueri untuk indeks terbalik kolom `search_field` (lihat search_index.py);
+    - `sort_by`: kolom pengurut (stabil, NaN/NaT di akhir).
+    """
+    from search_index import dataset_search_index
+
+    cache = get_dataset_cache(path)
+    mask = _filter_mask(cache, filters)
+
+    rows = None
+    if search and str(search).strip():
+        rows = dataset_search_index(search_field, path).search(search, mask)
+    if rows is None and mask is not None:
+        rows = np.flatnonzero(mask)
+
+    if sort_by is not None:
+        order, rank = _sort_order(cache, sort_by, ascending)
+        if rows is None:
+            rows = order
+        else:
+            rows = rows[np.argsort(rank[rows], kind='stable')]
+    return rows
+
+
+def count_rows(rows, path=DATASET_PATH):
+    """Jumlah baris hasil `select_rows` tanpa membaca kolom apa pun."""
+    return len(get_dataset_cache(path)) if rows is None else len(rows)
+
+
+def page_count(total, page_size):
+    return max(1, math.ceil(total / page_size))
+
+
+def fetch_page(columns, rows=None, page=1, page_size=20, path=DATASET_PATH):
+    """Satu halaman (mulai dari 1) berisi `columns` untuk baris hasil `select_rows`.
+
+    Index hasil = nomor baris asli di dataset.
+    """
+    cache = get_dataset_cache(path)
+    start = (page - 1) * page_size
+    if rows is None:
+        page_rows = np.arange(start, min(start + page_size, len(cache)))
+    else:
+        page_rows = np.asarray(rows[start:start + page_size])
+    return cache.load(columns, rows=page_rows)
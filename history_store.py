@@ -0,0 +1,223 @@
+"""Penyimpanan riwayat Analisis Teks berbasis SQLite.
+
+Menggantikan `data/riwayat_analisis.json` yang sebelumnya ditulis ulang
+seluruhnya setiap kali ada analisis baru. Setiap entri kini:
+- ditambahkan dengan satu INSERT (O(1)), aman dipakai banyak sesi sekaligus
+  berkat mode WAL SQLite;
+- punya ID unik yang stabil (AUTOINCREMENT), sehingga penghapusan tidak lagi
+  bergantung pada string `Waktu`;
+- bisa dicari lewat indeks FTS5 (tokenizer trigram, setara pencarian substring)
+  dan dibaca per halaman.
+File JSON lama dimigrasikan otomatis satu kali. Modul ini tidak bergantung
+pada Streamlit.
+"""
+import json
+import os
+import sqlite3
+import threading
+
+import pandas as pd
+
+HISTORY_DB_PATH = 'data/riwayat_analisis.db'
+LEGACY_JSON_PATH = 'data/riwayat_analisis.json'
+
+# Nama kolom di database -> nama kolom yang ditampilkan (sama dengan format JSON lama)
+COLUMN_MAP = {
+    'id': 'ID',
+    'waktu': 'Waktu',
+    'teks_asli': 'Teks Asli',
+    'teks_bersih': 'Teks Bersih',
+    'label': 'Label',
+    'keyakinan': 'Keyakinan (%)',
+}
+
+# Trigram FTS5 butuh minimal 3 karakter; kueri lebih pendek memakai LIKE
+_FTS_MIN_QUERY = 3
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS riwayat (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    waktu TEXT NOT NULL,
+    teks_asli TEXT NOT NULL,
+    teks_bersih TEXT,
+    label TEXT,
+    keyakinan REAL
+);
+CREATE TABLE IF NOT EXISTS meta (
+    kunci TEXT PRIMARY KEY,
+    nilai TEXT
+);
+"""
+
+_FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS riwayat_fts USING fts5(
+    teks_asli, content='riwayat', content_rowid='id', tokenize='trigram'
+);
+CREATE TRIGGER IF NOT EXISTS riwayat_ai AFTER INSERT ON riwayat BEGIN
+    INSERT INTO riwayat_fts(rowid, teks_asli) VALUES (new.id, new.teks_asli);
+END;
+CREATE TRIGGER IF NOT EXISTS riwayat_ad AFTER DELETE ON riwayat BEGIN
+    INSERT INTO riwayat_fts(riwayat_fts, rowid, teks_asli) VALUES ('delete', old.id, old.teks_asli);
+END;
+"""
+
+
+def _escape_like(text):
+    return text.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+
+
+class HistoryStore:
+    """Riwayat analisis dalam satu file SQLite. Satu koneksi per thread."""
+
+    def __init__(self, path=HISTORY_DB_PATH, legacy_json_path=LEGACY_JSON_PATH):
+        self.path = path
+        self.legacy_json_path = legacy_json_path
+        self._local = threading.local()
+        self.has_fts = False
+        self._init_db()
+
+    # --- koneksi & skema -------------------------------------------------------
+    def _conn(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            # isolation_level=None: transaksi diatur manual lewat BEGIN IMMEDIATE
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            self._local.conn = conn
+        return conn
+
+    def _init_db(self):
+        conn = self._conn()
+        conn.executescript(_SCHEMA)
+        try:
+            conn.executescript(_FTS_SCHEMA)
+            self.has_fts = True
+        except sqlite3.OperationalError:
+            # SQLite tanpa FTS5/trigram: pencarian memakai LIKE
+            self.has_fts = False
+        if self.has_fts:
+            self._backfill_fts()
+        self._migrate_legacy_json()
+
+    def _backfill_fts(self):
+        """Indeks baris yang ditulis sebelum riwayat_fts ada (database dari SQLite tanpa FTS5)."""
+        conn = self._conn()
+        if conn.execute("SELECT 1 FROM meta WHERE kunci = 'indeks_fts'").fetchone():
+            return
+
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            # Cek ulang di dalam transaksi: proses lain mungkin sudah mengisi indeks
+            if not conn.execute("SELECT 1 FROM meta WHERE kunci = 'indeks_fts'").fetchone():
+                conn.execute("INSERT INTO riwayat_fts(riwayat_fts) VALUES ('rebuild')")
+                jumlah = conn.execute("SELECT COUNT(*) FROM riwayat").fetchone()[0]
+                conn.execute("INSERT INTO meta (kunci, nilai) VALUES ('indeks_fts', ?)", (str(jumlah),))
+            conn.execute('COMMIT')
+        except Exception:
+            conn.execute('ROLLBACK')
+            raise
+
+    def _migrate_legacy_json(self):
+        conn = self._conn()
+        if conn.execute("SELECT 1 FROM meta WHERE kunci = 'migrasi_json'").fetchone():
+            return
+
+        entries = []
+        if self.legacy_json_path and os.path.exists(self.legacy_json_path):
+            try:
+                with open(self.legacy_json_path, 'r', encoding='utf-8') as f:
+                    entries = json.load(f)
+            except (OSError, ValueError):
+                entries = []
+
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            # Cek ulang di dalam transaksi: proses lain mungkin sudah memigrasikan
+            if not conn.execute("SELECT 1 FROM meta WHERE kunci = 'migrasi_json'").fetchone():
+                conn.executemany(
+                    "INSERT INTO riwayat (waktu, teks_asli, teks_bersih, label, keyakinan) VALUES (?, ?, ?, ?, ?)",
+                    [self._row_from_entry(e) for e in entries if isinstance(e, dict)]
+                )
+                conn.execute("INSERT INTO meta (kunci, nilai) VALUES ('migrasi_json', ?)", (str(len(entries)),))
+            conn.execute('COMMIT')
+        except Exception:
+            conn.execute('ROLLBACK')
+            raise
+
+    @staticmethod
+    def _row_from_entry(entry):
+        return (
+            str(entry.get('Waktu', '')),
+            str(entry.get('Teks Asli', '')),
+            entry.get('Teks Bersih'),
+            entry.get('Label'),
+            entry.get('Keyakinan (%)'),
+        )
+
+    # --- filter pencarian ----------------------------------------------------
+    def _where(self, query):
+        query = (query or '').strip()
+        if not query:
+            return '', ()
+        if self.has_fts and len(query) >= _FTS_MIN_QUERY:
+            phrase = '"' + query.replace('"', '""') + '"'
+            return 'WHERE id IN (SELECT rowid FROM riwayat_fts WHERE riwayat_fts MATCH ?)', (phrase,)
+        return "WHERE teks_asli LIKE ? ESCAPE '\\'", (f"%{_escape_like(query)}%",)
+
+    # --- API ----------------------------------------------------------------
+    def add(self, entry):
+        """Tambah satu entri (dict berformat JSON lama), kembalikan ID-nya."""
+        cur = self._conn().execute(
+            "INSERT INTO riwayat (waktu, teks_asli, teks_bersih, label, keyakinan) VALUES (?, ?, ?, ?, ?)",
+            self._row_from_entry(entry)
+        )
+        return cur.lastrowid
+
+    def count(self, query=None):
+        where, params = self._where(query)
+        return self._conn().execute(f"SELECT COUNT(*) FROM riwayat {where}", params).fetchone()[0]
+
+    def page(self, offset=0, limit=50, query=None):
+        """Entri terbaru lebih dulu, sebagai DataFrame dengan kolom `COLUMN_MAP`."""
+        where, params = self._where(query)
+        sql = f"SELECT {', '.join(COLUMN_MAP)} FROM riwayat {where} ORDER BY id DESC"
+        if limit is not None:
+            sql += " LIMIT ? OFFSET ?"
+            params = params + (int(limit), int(offset))
+        rows = self._conn().execute(sql, params).fetchall()
+        return pd.DataFrame(rows, columns=list(COLUMN_MAP.values()))
+
+    def to_dataframe(self, query=None):
+        return self.page(limit=None, query=query)
+
+    def revision(self):
+        """Penanda perubahan isi (jumlah, ID terbesar); untuk kunci cache di UI."""
+        return tuple(self._conn().execute("SELECT COUNT(*), MAX(id) FROM riwayat").fetchone())
+
+    def delete(self, ids):
+        ids = [int(i) for i in ids]
+        if not ids:
+            return 0
+        conn = self._conn()
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            cur = conn.executemany("DELETE FROM riwayat WHERE id = ?", [(i,) for i in ids])
+            conn.execute('COMMIT')
+        except Exception:
+            conn.execute('ROLLBACK')
+            raise
+        return cur.rowcount
+
+    def clear(self):
+        conn = self._conn()
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            conn.execute("DELETE FROM riwayat")
+            conn.execute('COMMIT')
+        except Exception:
+            conn.execute('ROLLBACK')
+            raise
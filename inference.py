@@ -0,0 +1,787 @@
+"""Inti pipeline inferensi sentimen tanpa ketergantungan ke Streamlit.
+
+Berisi konfigurasi, pemuatan model & tokenizer, preprocessing teks, encoding
+sekuens, cache prediksi, prediksi (tunggal, batch, kolom, dan streaming CSV).
+Dipakai oleh halaman Streamlit (lewat `utils.py`), `scoring_pool.py`,
+`micro_batcher.py`, dan CLI `cli.py`.
+"""
+import pandas as pd
+import numpy as np
+import json
+import h5py
+import re
+import pickle
+import os
+import gzip
+import hashlib
+import threading
+import weakref
+from collections import Counter, OrderedDict
+from itertools import repeat
+
+from perf import iter_timed, span, timed
+from vocabulary import MappedVocabulary, read_tokenizer_config
+from word_freq import WORD_FREQ_MAX_TERMS, WordFrequencyAggregator
+
+# ==============================================================================
+# 1. KONFIGURASI GLOBAL
+# ==============================================================================
+MAX_SEQUENCE_LENGTH = 100
+MODEL_PATH = 'model/Model_Sentiment_LSTM.h5'
+TOKENIZER_JSON_PATH = 'model/tokenizer_sentiment.json'
+TOKENIZER_PICKLE_PATH = 'model/tokenizer_sentiment.pickle'
+# Kosakata biner hasil `python vocabulary.py` (dibaca lewat mmap, lihat vocabulary.py)
+TOKENIZER_VOCAB_PATH = 'model/tokenizer_sentiment.vocab'
+# Model terkuantisasi hasil `python tflite_backend.py` (backend 'tflite')
+TFLITE_MODEL_PATH = 'model/Model_Sentiment_LSTM.tflite'
+# Bobot mmap bersama antar proses hasil `python numpy_backend.py` (backend 'numpy')
+MODEL_WEIGHTS_PATH = 'model/Model_Sentiment_LSTM.weights'
+LABELS = ['Negatif', 'Netral', 'Positif']
+PREDICT_BATCH_SIZE = 256
+BUCKET_LENGTH_STEP = 8
+# Ukuran batch & panjang token yang dijalankan saat warm-up model Keras:
+# satu teks (Analisis Teks), micro-batch, dan mini-batch CSV
+WARM_UP_BATCH_SIZES = (1, 32, PREDICT_BATCH_SIZE)
+WARM_UP_LENGTHS = (BUCKET_LENGTH_STEP, MAX_SEQUENCE_LENGTH)
+# Bentuk input tetap (signature) di dalam model TFLite: ukuran batch x panjang
+# token (kelipatan BUCKET_LENGTH_STEP). Interpreter TFLite tidak lebih cepat
+# per baris pada batch besar, jadi cukup batch 1 & 32 dengan panjang rapat.
+TFLITE_BATCH_SIZES = (1, 32)
+TFLITE_SEQUENCE_LENGTHS = (16, 24, 32, 48, 64, MAX_SEQUENCE_LENGTH)
+
+# Backend inferensi: 'keras' (TensorFlow), 'numpy' (tanpa TensorFlow, lihat
+# numpy_backend.py), atau 'tflite' (model terkuantisasi, lihat tflite_backend.py).
+# Bisa diganti lewat environment SENTIMEN_BACKEND.
+INFERENCE_BACKENDS = ('keras', 'numpy', 'tflite')
+INFERENCE_BACKEND = os.environ.get('SENTIMEN_BACKEND', 'keras')
+PREDICTION_CACHE_SIZE = int(os.environ.get('SENTIMEN_CACHE_SIZE', 50000))
+STREAM_CHUNK_SIZE = 20000
+STREAM_PREVIEW_ROWS = 1000
+# Format file hasil streaming (ditentukan dari ekstensi output_path)
+OUTPUT_FORMATS = ('csv', 'csv.gz', 'jsonl', 'jsonl.gz')
+
+# ==============================================================================
+# 2. PATCHING MODEL
+# ==============================================================================
+def recursive_fix_config(config):
+    """Memperbaiki konfigurasi model agar bisa dibaca di berbagai versi TF"""
+    if isinstance(config, list):
+        return [recursive_fix_config(x) for x in config]
+    if isinstance(config, dict):
+        if 'batch_shape' in config:
+            config['batch_input_shape'] = config.pop('batch_shape')
+        if 'dtype' in config:
+            if isinstance(config['dtype'], dict) or 'Policy' in str(config['dtype']):
+                config['dtype'] = 'float32'
+        for key, value in config.items():
+            config[key] = recursive_fix_config(value)
+    return config
+
+# ==============================================================================
+# 3. LOAD RESOURCES (MODEL & TOKENIZER)
+# ==============================================================================
+# TensorFlow sengaja di-import di dalam fungsi agar halaman non-ML (Beranda,
+# Visualisasi, Proses Data) tidak ikut menunggu import TensorFlow.
+class ResourceLoadError(Exception):
+    """Model atau tokenizer gagal dimuat. Pesan sudah siap ditampilkan ke user."""
+
+def load_model(backend=None):
+    backend = backend or INFERENCE_BACKEND
+    if backend not in INFERENCE_BACKENDS:
+        raise ResourceLoadError(f"❌ Backend inferensi tidak dikenal: {backend}")
+
+    if backend == 'tflite':
+        if not os.path.exists(TFLITE_MODEL_PATH):
+            raise ResourceLoadError(f"❌ File model TFLite tidak ditemukan di: {TFLITE_MODEL_PATH} "
+                                    "(buat dengan `python tflite_backend.py`)")
+        from tflite_backend import TFLiteModel
+        try:
+            with span('model.warm_up'):
+                return TFLiteModel(TFLITE_MODEL_PATH).warm_up()
+        except Exception as e:
+            raise ResourceLoadError(f"❌ Gagal memuat model (backend TFLite): {e}") from e
+
+    if backend == 'numpy' and os.path.exists(MODEL_WEIGHTS_PATH):
+        # Bobot mmap dipakai bersama semua proses di host ini (page cache).
+        # File rusak/usang -> kembali membaca .h5 di bawah.
+        from numpy_backend import NumpyLSTMModel
+        try:
+            model = NumpyLSTMModel.from_mapped(MODEL_WEIGHTS_PATH)
+        except (OSError, ValueError, KeyError):
+            model = None
+        if model is not None and not model.is_stale(MODEL_PATH):
+            return model
+
+    if not os.path.exists(MODEL_PATH):
+        raise ResourceLoadError(f"❌ File model tidak ditemukan di: {MODEL_PATH}")
+
+    if backend == 'numpy':
+        from numpy_backend import NumpyLSTMModel
+        try:
+            return NumpyLSTMModel.from_h5(MODEL_PATH)
+        except Exception as e:
+            raise ResourceLoadError(f"❌ Gagal memuat model (backend NumPy): {e}") from e
+
+    from keras_backend import CompiledKerasModel
+
+    model = load_keras_model()
+    try:
+        with span('model.warm_up'):
+            return CompiledKerasModel(model).warm_up(WARM_UP_BATCH_SIZES, WARM_UP_LENGTHS)
+    except Exception:
+        # tf.function gagal (mis. layer kustom): tetap layani lewat model.predict
+        return model
+
+def load_keras_model():
+    """Model Keras asli dari MODEL_PATH (tanpa pembungkus tf.function)."""
+    import tensorflow as tf
+
+    try:
+        return tf.keras.models.load_model(MODEL_PATH, compile=False)
+    except Exception:
+        try:
+            with h5py.File(MODEL_PATH, mode='r') as f:
+                model_config_str = f.attrs.get('model_config')
+                if isinstance(model_config_str, bytes):
+                    model_config_str = model_config_str.decode('utf-8')
+                
+                model_config_dict = json.loads(model_config_str)
+                fixed_config = recursive_fix_config(model_config_dict)
+                
+                model = tf.keras.models.model_from_json(json.dumps(fixed_config))
+                model.load_weights(MODEL_PATH)
+                return model
+        except Exception as e:
+            raise ResourceLoadError(f"❌ Gagal memuat model: {e}") from e
+
+def load_tokenizer(backend=None):
+    backend = backend or INFERENCE_BACKEND
+    try:
+        if os.path.exists(TOKENIZER_VOCAB_PATH):
+            # Inferensi cukup memakai SequenceEncoder, untuk backend mana pun.
+            # File biner rusak/usang -> kembali ke tokenizer JSON di bawah.
+            try:
+                encoder = SequenceEncoder.from_binary(TOKENIZER_VOCAB_PATH)
+            except (OSError, ValueError, KeyError):
+                encoder = None
+            if encoder is not None and not encoder.vocabulary.is_stale(TOKENIZER_JSON_PATH):
+                return encoder
+        if backend in ('numpy', 'tflite') and os.path.exists(TOKENIZER_JSON_PATH):
+            # Cukup word_index & konfigurasi tokenizer, tanpa TensorFlow
+            return SequenceEncoder.from_json(TOKENIZER_JSON_PATH)
+        if os.path.exists(TOKENIZER_JSON_PATH):
+            from tensorflow.keras.preprocessing.text import tokenizer_from_json
+
+            with open(TOKENIZER_JSON_PATH, 'r', encoding='utf-8') as f:
+                content = f.read()
+                try:
+                    parsed_json = json.loads(content)
+                    if isinstance(parsed_json, str):
+                        input_tokenizer = parsed_json
+                    else:
+                        input_tokenizer = json.dumps(parsed_json)
+                except:
+                    input_tokenizer = content
+                return tokenizer_from_json(input_tokenizer)
+        elif os.path.exists(TOKENIZER_PICKLE_PATH):
+            with open(TOKENIZER_PICKLE_PATH, 'rb') as handle:
+                return pickle.load(handle)
+    except Exception as e:
+        raise ResourceLoadError(f"❌ Gagal memuat tokenizer: {e}") from e
+
+    raise ResourceLoadError("❌ File Tokenizer tidak ditemukan.")
+
+def load_model_and_tokenizer(backend=None):
+    """Muat model & tokenizer; melempar `ResourceLoadError` bila gagal."""
+    with span('load_resources'):
+        return load_model(backend), load_tokenizer(backend)
+
+class ResourceLoader:
+    """Memuat model & tokenizer di thread latar belakang (sekali per proses).
+
+    `state` bernilai 'loading', 'ready', atau 'failed'. Hanya halaman yang
+    butuh model yang memanggil `wait()`, halaman lain bisa langsung dirender.
+    """
+
+    def __init__(self, backend=None):
+        self.backend = backend
+        self.state = 'loading'
+        self.model = None
+        self.tokenizer = None
+        self.error = None
+        self._done = threading.Event()
+        self._thread = threading.Thread(target=self._run, name='resource-loader', daemon=True)
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def _run(self):
+        try:
+            self.model, self.tokenizer = load_model_and_tokenizer(self.backend)
+            self.state = 'ready'
+        except Exception as e:
+            self.error = str(e) if isinstance(e, ResourceLoadError) else f"❌ Gagal memuat model: {e}"
+            self.state = 'failed'
+        finally:
+            self._done.set()
+
+    def wait(self, timeout=None):
+        self._done.wait(timeout)
+        return self.state
+
+# ==============================================================================
+# 4. PREPROCESSING TEKS
+# ==============================================================================
+slang_dict = {
+    'bgt': 'banget', 'yg': 'yang', 'gak': 'tidak', 'ga': 'tidak',
+    'kalo': 'kalau', 'kl': 'kalau', 'dr': 'dari', 'krn': 'karena',
+    'jd': 'jadi', 'sdh': 'sudah', 'aja': 'saja', 'dgn': 'dengan',
+    'tdk': 'tidak', 'tp': 'tapi', 'sy': 'saya', 'utk': 'untuk',
+    'd': 'di', 'blm': 'belum', 'jgn': 'jangan', 'gw': 'saya',
+    'lo': 'kamu', 'sm': 'sama', 'tau': 'tahu', 'kpn': 'kapan',
+    'bs': 'bisa', 'lbh': 'lebih', 'kmrn': 'kemarin',
+    'nggak': 'tidak', 'enggak': 'tidak', 'gk': 'tidak',
+    'kaga': 'tidak', 'tak': 'tidak', 'g': 'tidak',
+    'bener': 'benar', 'bnr': 'benar', 'msh': 'masih',
+    'udah': 'sudah', 'sprt': 'seperti', 'opr': 'operasional',
+    'tlg': 'tolong', 'bkn': 'bukan', 'aq': 'aku', 'km': 'kamu', 'dlm': 'dalam'
+}
+
+# Pola regex dikompilasi sekali saat modul dimuat. Mention & hashtag digabung
+# dalam satu pola; angka dan tanda baca hanya diproses pada token yang bukan
+# huruf murni, sehingga sebagian besar kata cukup dicek dengan `str.isalpha`.
+_URL_PATTERN = re.compile(r'http\S+|www\S+')
+_MENTION_HASHTAG_PATTERN = re.compile(r'[@#]\w+')
+_MENTION_PATTERN = re.compile(r'@\w+')
+_DIGIT_PATTERN = re.compile(r'\d+')
+_WORD_PATTERN = re.compile(r'\w+')
+_SEPARATOR = ' \x00 '
+
+def _normalize_tokens(text, slang_get=slang_dict.get, digit_sub=_DIGIT_PATTERN.sub, word_findall=_WORD_PATTERN.findall):
+    words = []
+    append = words.append
+    for token in text.split():
+        if token.isalpha():
+            append(slang_get(token, token))
+        else:
+            for word in word_findall(digit_sub('', token)):
+                append(slang_get(word, word))
+    return " ".join(words)
+
+def clean_text(text):
+    if not isinstance(text, str): return ""
+    text = _URL_PATTERN.sub('', text.lower())
+    text = _MENTION_HASHTAG_PATTERN.sub('', text)
+    return _normalize_tokens(text)
+
+@timed('clean_text')
+def clean_text_series(texts):
+    """Versi kolom dari `clean_text` untuk pandas Series (atau list) sekaligus.
+
+    Seluruh teks digabung menjadi satu string sehingga lowercase serta
+    penghapusan URL, mention dan hashtag cukup dijalankan sekali untuk satu
+    kolom. Hasilnya identik dengan memanggil `clean_text` per baris.
+    """
+    index = texts.index if isinstance(texts, pd.Series) else None
+    values = [t if isinstance(t, str) else "" for t in texts]
+    if not values:
+        return pd.Series(values, index=index, dtype=object)
+
+    blob = _SEPARATOR.join(values)
+    if blob.count('\x00') != len(values) - 1:
+        # Teks asli mengandung karakter pemisah, proses per baris saja
+        return pd.Series([clean_text(t) for t in values], index=index, dtype=object)
+
+    blob = _URL_PATTERN.sub('', blob.lower())
+    blob = _MENTION_HASHTAG_PATTERN.sub('', blob)
+    return pd.Series([_normalize_tokens(t) for t in blob.split(_SEPARATOR)], index=index, dtype=object)
+
+# ==============================================================================
+# 5. ENCODING SEKUENS (PENGGANTI texts_to_sequences + pad_sequences)
+# ==============================================================================
+KERAS_DEFAULT_FILTERS = '!"#$%&()*+,-./:;<=>?@[\\]^_`{|}~\t\n'
+
+class SequenceEncoder:
+    """Encoder beku yang dibangun dari `word_index` tokenizer Keras.
+
+    Mengikuti aturan `Tokenizer.texts_to_sequences` (batas `num_words` dan
+    token `<OOV>`) lalu menulis ID token langsung ke array `int32` berukuran
+    (N, maxlen) dengan padding & truncating 'post', tanpa list perantara.
+    `word_index` boleh berupa dict atau `MappedVocabulary` (kosakata biner).
+    """
+
+    def __init__(self, word_index, num_words=None, oov_token=None,
+                 filters=KERAS_DEFAULT_FILTERS, lower=True, split=' '):
+        self.num_words = num_words
+        self.oov_token = oov_token
+        self.oov_index = word_index.get(oov_token) if oov_token is not None else None
+        self.lower = lower
+        self.split = split
+        self.filters = filters
+        if isinstance(word_index, MappedVocabulary):
+            # Kosakata mmap sudah dibatasi num_words; dict lookup baru dibuat
+            # saat encode pertama (lihat `lookup`)
+            self.vocabulary = word_index
+            self._lookup = None
+        else:
+            self.vocabulary = None
+            # Kata dengan ID >= num_words dibuang dari lookup, sehingga otomatis
+            # jatuh ke <OOV> (atau dilewati jika tokenizer tidak memakai OOV)
+            self._lookup = {
+                word: idx for word, idx in word_index.items()
+                if not num_words or idx < num_words
+            }
+
+    @property
+    def lookup(self):
+        if self._lookup is None:
+            self._lookup = self.vocabulary.to_dict()
+        return self._lookup
+
+    @classmethod
+    def from_tokenizer(cls, tokenizer):
+        return cls(
+            tokenizer.word_index,
+            num_words=tokenizer.num_words,
+            oov_token=tokenizer.oov_token,
+            filters=tokenizer.filters,
+            lower=tokenizer.lower,
+            split=tokenizer.split,
+        )
+
+    @classmethod
+    def from_json(cls, path):
+        """Bangun encoder langsung dari file JSON tokenizer Keras (tanpa TensorFlow)."""
+        config = read_tokenizer_config(path)
+        return cls(
+            config['word_index'],
+            num_words=config.get('num_words'),
+            oov_token=config.get('oov_token'),
+            filters=config.get('filters', KERAS_DEFAULT_FILTERS),
+            lower=config.get('lower', True),
+            split=config.get('split', ' '),
+        )
+
+    @classmethod
+    def from_binary(cls, path):
+        """Bangun encoder dari kosakata biner (vocabulary.py) yang dibaca lewat mmap."""
+        vocabulary = MappedVocabulary(path)
+        config = vocabulary.config
+        return cls(
+            vocabulary,
+            num_words=config['num_words'],
+            oov_token=config['oov_token'],
+            filters=config['filters'],
+            lower=config['lower'],
+            split=config['split'],
+        )
+
+    @timed('tokenisasi')
+    def encode(self, texts, maxlen=MAX_SEQUENCE_LENGTH):
+        texts = [t if isinstance(t, str) else "" for t in texts]
+        sequences = np.zeros((len(texts), maxlen), dtype=np.int32)
+        if not texts:
+            return sequences
+
+        # Lowercase & filter dijalankan sekali untuk seluruh batch
+        rows = self._normalize('\x00'.join(texts)).split('\x00')
+        if len(rows) != len(texts):
+            rows = [self._normalize(t) for t in texts]
+
+        lookup_get = self.lookup.get
+        oov_index = self.oov_index
+        split = self.split
+        flat_ids = []
+        lengths = np.zeros(len(rows), dtype=np.int64)
+        for row, text in enumerate(rows):
+            words = [w for w in text.split(split) if w]
+            if oov_index is not None:
+                ids = list(map(lookup_get, words[:maxlen], repeat(oov_index)))
+            else:
+                ids = [i for i in map(lookup_get, words) if i is not None][:maxlen]
+            flat_ids.extend(ids)
+            lengths[row] = len(ids)
+
+        sequences[np.arange(maxlen) < lengths[:, None]] = flat_ids
+        return sequences
+
+    def word_ids(self, text, maxlen=MAX_SEQUENCE_LENGTH):
+        """Pasangan (kata, ID) satu teks, persis sama dengan baris hasil `encode`.
+
+        Kata dipecah dengan aturan tokenizer (filter & split), bukan spasi saja,
+        sehingga "gara-gara" menjadi dua kata dan kata di luar `num_words`
+        (tanpa `<OOV>`) ikut dilewati seperti di `encode`.
+        """
+        text = self._normalize(text if isinstance(text, str) else "")
+        lookup_get = self.lookup.get
+        pairs = []
+        for word in text.split(self.split):
+            if not word:
+                continue
+            idx = lookup_get(word, self.oov_index)
+            if idx is not None:
+                pairs.append((word, idx))
+                if len(pairs) == maxlen:
+                    break
+        return pairs
+
+    def _normalize(self, text):
+        if self.lower:
+            text = text.lower()
+        # str.replace per karakter filter jauh lebih cepat daripada str.translate
+        # untuk teks non-ASCII, dan karakter yang tidak muncul langsung dilewati
+        for char in self.filters:
+            if char in text:
+                text = text.replace(char, self.split)
+        return text
+
+_encoder_cache = weakref.WeakKeyDictionary()
+
+def get_sequence_encoder(tokenizer):
+    """Ambil `SequenceEncoder` untuk tokenizer ini (dibangun sekali lalu di-cache)."""
+    if isinstance(tokenizer, SequenceEncoder):
+        return tokenizer
+    encoder = _encoder_cache.get(tokenizer)
+    if encoder is None:
+        encoder = SequenceEncoder.from_tokenizer(tokenizer)
+        _encoder_cache[tokenizer] = encoder
+    return encoder
+
+# ==============================================================================
+# 6. CACHE PREDIKSI (LRU)
+# ==============================================================================
+class PredictionCache:
+    """Cache LRU hasil prediksi dengan key hash dari output `clean_text`.
+
+    Setiap entri berisi (label, confidence, probabilitas). Isi cache otomatis
+    dikosongkan jika file model (`MODEL_PATH`) berubah (mtime/ukuran).
+    """
+
+    def __init__(self, maxsize=PREDICTION_CACHE_SIZE, model_path=MODEL_PATH):
+        self.maxsize = maxsize
+        self.model_path = model_path
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+        self._model_signature = self._read_model_signature()
+
+    @staticmethod
+    def key(cleaned_text):
+        return hashlib.blake2b(cleaned_text.encode('utf-8'), digest_size=16).digest()
+
+    def _read_model_signature(self):
+        try:
+            stat = os.stat(self.model_path)
+            return stat.st_mtime_ns, stat.st_size
+        except OSError:
+            return None
+
+    def _check_model(self):
+        signature = self._read_model_signature()
+        if signature != self._model_signature:
+            self._data.clear()
+            self._model_signature = signature
+
+    def get_many(self, keys):
+        """Ambil entri untuk setiap key (None jika belum ada di cache)."""
+        with self._lock:
+            self._check_model()
+            results = []
+            for key in keys:
+                entry = self._data.get(key)
+                if entry is None:
+                    self.misses += 1
+                else:
+                    self._data.move_to_end(key)
+                    self.hits += 1
+                results.append(entry)
+            return results
+
+    def put_many(self, keys, probabilities):
+        with self._lock:
+            for key, probs in zip(keys, probabilities):
+                # Salin baris agar array batch yang besar tidak ikut tertahan di memori
+                probs = np.array(probs, dtype='float32')
+                label_idx = int(np.argmax(probs))
+                self._data[key] = (LABELS[label_idx], float(probs[label_idx] * 100), probs)
+                self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {
+            'size': len(self._data),
+            'maxsize': self.maxsize,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / total if total else 0.0,
+        }
+
+# Satu cache per objek model, sehingga backend/model berbeda tidak saling bercampur
+_prediction_caches = weakref.WeakKeyDictionary()
+
+def get_prediction_cache(model):
+    cache = _prediction_caches.get(model)
+    if cache is None:
+        cache = PredictionCache()
+        _prediction_caches[model] = cache
+    return cache
+
+# ==============================================================================
+# 7. PREDIKSI
+# ==============================================================================
+def predict_sentiment(text, model, tokenizer, use_cache=True):
+    if not text or not model or not tokenizer:
+        return "Error", 0.0, [0, 0, 0], text
+
+    with span('clean_text'):
+        cleaned_text = clean_text(text)
+
+    cache = get_prediction_cache(model) if use_cache else None
+    if cache is not None:
+        key = cache.key(cleaned_text)
+        entry = cache.get_many([key])[0]
+        if entry is not None:
+            label, confidence, prediction = entry
+            return label, confidence, prediction.copy(), cleaned_text
+
+    padded = get_sequence_encoder(tokenizer).encode([cleaned_text])
+    
+    # Lewat _predict_padded agar padding di belakang teks ikut dipotong
+    prediction = _predict_padded(model, padded, 1)[0]
+    if cache is not None:
+        cache.put_many([key], [prediction])
+    
+    label_idx = np.argmax(prediction)
+    label = LABELS[label_idx]
+    confidence = prediction[label_idx] * 100
+    
+    return label, confidence, prediction, cleaned_text
+
+def _predict_padded(model, padded, batch_size, bucket_by_length=True, progress_callback=None):
+    """Jalankan `model.predict` per mini-batch atas matriks hasil padding.
+
+    Dengan `bucket_by_length`, baris diurutkan berdasarkan jumlah token lalu
+    setiap mini-batch hanya dipotong sampai panjang token terpanjangnya
+    (dibulatkan ke kelipatan `BUCKET_LENGTH_STEP` agar jumlah bentuk input
+    tetap sedikit). Karena model memakai `mask_zero=True` dengan padding
+    'post', timestep yang dibuang memang selalu di-mask, sehingga hasilnya
+    sama dengan padding penuh. Prediksi dikembalikan ke urutan semula.
+    """
+    total, maxlen = padded.shape
+    probabilities = np.zeros((total, len(LABELS)), dtype='float32')
+
+    if bucket_by_length:
+        lengths = np.count_nonzero(padded, axis=1)
+        order = np.argsort(lengths, kind='stable')
+    else:
+        order = np.arange(total)
+
+    for start in range(0, total, batch_size):
+        end = min(start + batch_size, total)
+        idx = order[start:end]
+        width = maxlen
+        if bucket_by_length:
+            width = -(-max(int(lengths[idx[-1]]), 1) // BUCKET_LENGTH_STEP) * BUCKET_LENGTH_STEP
+            width = min(width, maxlen)
+
+        with span('model.predict'):
+            try:
+                probabilities[idx] = model.predict(padded[idx, :width], verbose=0)
+            except ValueError:
+                if width == maxlen:
+                    raise
+                # Model dengan panjang input tetap: kembali ke padding penuh
+                bucket_by_length = False
+                probabilities[idx] = model.predict(padded[idx], verbose=0)
+
+        if progress_callback is not None:
+            progress_callback(end, total)
+
+    return probabilities
+
+def predict_sentiment_batch(texts, model, tokenizer, batch_size=PREDICT_BATCH_SIZE,
+                            bucket_by_length=True, use_cache=True, progress_callback=None):
+    """Prediksi sentimen banyak teks sekaligus (list, Series, atau iterable).
+
+    Semua teks dibersihkan, di-encode dan di-padding menjadi satu matriks,
+    lalu `model.predict` dijalankan per mini-batch berukuran `batch_size`
+    (dikelompokkan per panjang token jika `bucket_by_length`). Dengan
+    `use_cache`, teks yang sudah ada di cache prediksi (atau muncul berulang
+    di batch ini) tidak dikirim lagi ke model.
+    `progress_callback(selesai, total)` dipanggil setiap satu mini-batch selesai.
+    Mengembalikan (labels, confidences, probabilities, cleaned_texts).
+    """
+    if isinstance(texts, pd.Series):
+        texts = texts.tolist()
+    else:
+        texts = list(texts)
+
+    cleaned_texts = clean_text_series(texts).tolist()
+    total = len(cleaned_texts)
+    encoder = get_sequence_encoder(tokenizer)
+
+    cache = get_prediction_cache(model) if use_cache else None
+    if cache is None:
+        probabilities = _predict_padded(model, encoder.encode(cleaned_texts), batch_size,
+                                        bucket_by_length, progress_callback)
+    else:
+        probabilities = np.zeros((total, len(LABELS)), dtype='float32')
+        keys = [cache.key(t) for t in cleaned_texts]
+
+        # Baris yang belum ada di cache dikelompokkan per key, jadi teks
+        # duplikat di dalam batch cukup diprediksi sekali
+        pending = {}
+        for row, (key, entry) in enumerate(zip(keys, cache.get_many(keys))):
+            if entry is None:
+                pending.setdefault(key, []).append(row)
+            else:
+                probabilities[row] = entry[2]
+
+        if pending:
+            pending_keys = list(pending)
+            padded = encoder.encode([cleaned_texts[pending[k][0]] for k in pending_keys])
+            offset = total - len(pending_keys)
+
+            def report(done, _):
+                if progress_callback is not None:
+                    progress_callback(offset + done, total)
+
+            new_probabilities = _predict_padded(model, padded, batch_size, bucket_by_length, report)
+            for key, probs in zip(pending_keys, new_probabilities):
+                probabilities[pending[key]] = probs
+            cache.put_many(pending_keys, new_probabilities)
+        elif progress_callback is not None and total:
+            progress_callback(total, total)
+
+    label_idx = np.argmax(probabilities, axis=1)
+    labels = [LABELS[i] for i in label_idx]
+    confidences = probabilities[np.arange(total), label_idx] * 100
+
+    return labels, confidences, probabilities, cleaned_texts
+
+
+# ==============================================================================
+# 8. ANALISIS KOLOM & STREAMING CSV
+# ==============================================================================
+def predict_text_column(texts, model, tokenizer, batch_size=PREDICT_BATCH_SIZE, progress_callback=None):
+    """Prediksi satu kolom teks dengan aturan halaman Analisis File CSV.
+
+    Teks kosong langsung diberi label 'Netral' tanpa dikirim ke model, dan
+    jika prediksi gagal seluruh baris berisi teks ditandai 'Error'.
+    Mengembalikan (labels, cleaned_texts, error_count) sebagai Series.
+    """
+    texts = texts.fillna("").astype(str)
+    mask_isi = texts.str.strip() != ""
+    texts_isi = texts[mask_isi]
+    skipped = len(texts) - len(texts_isi)
+
+    labels = pd.Series("Netral", index=texts.index, dtype=object)
+    cleaned = pd.Series("", index=texts.index, dtype=object)
+    error_count = 0
+
+    def report(done, _):
+        if progress_callback is not None:
+            progress_callback(skipped + done, len(texts))
+
+    try:
+        lbls, _, _, clns = predict_sentiment_batch(texts_isi, model, tokenizer, batch_size=batch_size, progress_callback=report)
+        labels[mask_isi] = lbls
+        cleaned[mask_isi] = clns
+    except Exception:
+        labels[mask_isi] = "Error"
+        cleaned[mask_isi] = "GAGAL DIPROSES"
+        error_count = len(texts_isi)
+
+    return labels, cleaned, error_count
+
+def strip_links(texts):
+    """Teks mentah tanpa URL dan mention, untuk frekuensi kata 'Mentah'.
+
+    ID t.co dan @username hampir selalu unik, sehingga tanpa ini Counter
+    'Mentah' terus bertambah seiring jumlah baris. Kata hashtag dipertahankan
+    (seperti `WordCloud.generate`, tanda '#' saja yang hilang).
+    """
+    texts = pd.Series(texts, dtype=object).dropna().astype(str)
+    return texts.str.replace(_URL_PATTERN, ' ', regex=True).str.replace(_MENTION_PATTERN, ' ', regex=True)
+
+def update_word_freq(word_freq, raw_texts, cleaned, labels):
+    """Tambah frekuensi kata hasil analisis batch: 'Mentah', 'Bersih' dan per label."""
+    word_freq.update('Mentah', strip_links(raw_texts))
+    word_freq.update('Bersih', cleaned)
+    word_freq.update_by_label(cleaned[labels.isin(LABELS)], labels[labels.isin(LABELS)])
+    return word_freq
+
+def write_output_chunk(chunk, output_path, first):
+    """Tulis/tambahkan satu chunk hasil ke file. Format mengikuti ekstensi:
+    `.csv` atau `.jsonl` (satu objek JSON per baris), opsional `.gz`.
+    """
+    if output_path.endswith(('.jsonl', '.jsonl.gz')):
+        opener = gzip.open if output_path.endswith('.gz') else open
+        with opener(output_path, 'wt' if first else 'at', encoding='utf-8') as f:
+            if len(chunk):
+                f.write(chunk.to_json(orient='records', lines=True, force_ascii=False, date_format='iso').rstrip('\n') + '\n')
+    else:
+        chunk.to_csv(output_path, mode='w' if first else 'a', header=first, index=False)
+
+def predict_csv_stream(source, text_col, model, tokenizer, output_path, chunksize=STREAM_CHUNK_SIZE,
+                       batch_size=PREDICT_BATCH_SIZE, preview_rows=STREAM_PREVIEW_ROWS, progress_callback=None,
+                       pool=None, with_word_freq=True):
+    """Analisis file CSV besar per chunk dengan memori yang tetap datar.
+
+    File dibaca per `chunksize` baris, setiap chunk diprediksi sebagai satu
+    batch lalu langsung ditambahkan ke `output_path` (format & kompresi
+    mengikuti ekstensi, lihat `write_output_chunk`). Yang disimpan di memori
+    hanya agregat: jumlah per label, frekuensi kata (`WordFrequencyAggregator`
+    yang dipangkas ke `WORD_FREQ_MAX_TERMS` kata per grup, dilewati bila
+    `with_word_freq=False`), dan `preview_rows` baris pertama.
+    `progress_callback(total_baris)` dipanggil setiap satu chunk selesai.
+    Bila `pool` (`scoring_pool.ScoringPool`) diberikan, tiap chunk diskor
+    paralel oleh proses worker-nya.
+    """
+    summary = {
+        'total': 0,
+        'errors': 0,
+        'label_counts': Counter(),
+        'word_freq': WordFrequencyAggregator(max_terms=WORD_FREQ_MAX_TERMS),
+        'preview': None,
+    }
+    previews = []
+
+    for i, chunk in enumerate(iter_timed('csv.parse', pd.read_csv(source, chunksize=chunksize))):
+        if text_col not in chunk.columns:
+            raise KeyError(text_col)
+
+        if pool is not None:
+            labels, cleaned, error_count = pool.predict_text_column(chunk[text_col], batch_size=batch_size)
+        else:
+            labels, cleaned, error_count = predict_text_column(chunk[text_col], model, tokenizer, batch_size=batch_size)
+        chunk['Teks_Bersih'] = cleaned
+        chunk['Prediksi_Sentimen'] = labels
+        write_output_chunk(chunk, output_path, first=i == 0)
+
+        summary['total'] += len(chunk)
+        summary['errors'] += error_count
+        summary['label_counts'].update(labels.value_counts().to_dict())
+
+        if with_word_freq:
+            update_word_freq(summary['word_freq'], chunk[text_col], cleaned, labels)
+
+        preview_sisa = preview_rows - sum(len(p) for p in previews)
+        if preview_sisa > 0:
+            previews.append(chunk.head(preview_sisa))
+
+        if progress_callback is not None:
+            progress_callback(summary['total'])
+
+    summary['preview'] = pd.concat(previews) if previews else pd.DataFrame()
+    return summary
@@ -0,0 +1,184 @@
+"""Layanan inferensi lokal yang menggabungkan request teks tunggal menjadi batch.
+
+Setiap klik "Analisis Sekarang" sebelumnya menjalankan `model.predict` sendiri
+untuk tensor (1, 100), sehingga overhead per panggilan mendominasi saat banyak
+user memakai halaman Analisis Teks bersamaan. `MicroBatcher` menampung request
+dari semua sesi Streamlit di satu antrian; thread latar belakang mengirim satu
+batch ke `predict_sentiment_batch` begitu ukurannya mencapai `max_batch_size`
+atau request tertua sudah menunggu `max_delay_ms`. Setiap pemanggil menerima
+hasilnya sendiri lewat `concurrent.futures.Future`.
+
+`get_micro_batcher(model, tokenizer)` memberi satu batcher per objek model
+(seperti `inference.get_prediction_cache`), sehingga model yang dimuat ulang
+atau backend lain otomatis mendapat batcher baru.
+"""
+import os
+import queue
+import threading
+import time
+import weakref
+from collections import Counter, deque
+from concurrent.futures import Future, TimeoutError
+
+import numpy as np
+
+MICRO_BATCH_SIZE = int(os.environ.get('SENTIMEN_MICRO_BATCH', 32))
+MICRO_BATCH_DELAY_MS = float(os.environ.get('SENTIMEN_MICRO_BATCH_MS', 10))
+# Jumlah sampel latensi terakhir yang dipakai untuk p50/p99
+LATENCY_WINDOW = 10000
+
+_STOP = object()
+
+
+class MicroBatcher:
+    """Antrian + thread yang memproses request teks tunggal secara batch.
+
+    `predict(text)` mengembalikan tuple yang sama dengan `inference.predict_sentiment`:
+    (label, confidence, probabilitas, teks_bersih).
+
+    Model hanya dirujuk lewat weakref: batcher tidak menahan model lama di
+    memori, dan thread-nya berhenti sendiri begitu model itu dibebaskan.
+    """
+
+    def __init__(self, model, tokenizer, max_batch_size=MICRO_BATCH_SIZE, max_delay_ms=MICRO_BATCH_DELAY_MS):
+        self._model = weakref.ref(model) if model is not None else (lambda: None)
+        self.tokenizer = tokenizer
+        self.max_batch_size = max(1, int(max_batch_size))
+        self.max_delay = max_delay_ms / 1000
+        self._queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._batch_sizes = Counter()
+        self._latencies = deque(maxlen=LATENCY_WINDOW)
+        self._requests = 0
+        self._thread = threading.Thread(target=self._run, name='micro-batcher', daemon=True)
+        self._thread.start()
+        if model is not None:
+            weakref.finalize(model, self._queue.put, _STOP)
+
+    @property
+    def model(self):
+        return self._model()
+
+    # --- API ----------------------------------------------------------------
+    def submit(self, text):
+        """Masukkan satu teks ke antrian, kembalikan Future berisi hasil prediksi."""
+        future = Future()
+        if not text or not self.model or not self.tokenizer:
+            # Sama dengan predict_sentiment: input kosong tidak dikirim ke model
+            future.set_result(("Error", 0.0, [0, 0, 0], text))
+            return future
+        self._queue.put((text, future, time.perf_counter()))
+        return future
+
+    def predict(self, text, timeout=None):
+        """Hasil prediksi `text`; `concurrent.futures.TimeoutError` bila melewati `timeout` detik."""
+        future = self.submit(text)
+        try:
+            return future.result(timeout)
+        except TimeoutError:
+            # Request yang belum diambil thread pemroses tidak perlu diskor lagi
+            future.cancel()
+            raise
+
+    def stats(self):
+        with self._lock:
+            latencies = np.array(self._latencies) * 1000
+            batches = sum(self._batch_sizes.values())
+            return {
+                'queue_depth': self._queue.qsize(),
+                'requests': self._requests,
+                'batches': batches,
+                'mean_batch_size': self._requests / batches if batches else 0.0,
+                'batch_size_histogram': dict(sorted(self._batch_sizes.items())),
+                'p50_ms': float(np.percentile(latencies, 50)) if len(latencies) else 0.0,
+                'p99_ms': float(np.percentile(latencies, 99)) if len(latencies) else 0.0,
+            }
+
+    def reset_stats(self):
+        with self._lock:
+            self._batch_sizes.clear()
+            self._latencies.clear()
+            self._requests = 0
+
+    def close(self, timeout=None):
+        self._queue.put(_STOP)
+        self._thread.join(timeout)
+
+    # --- thread pemroses -------------------------------------------------------
+    def _collect(self):
+        """Ambil satu batch: tunggu request pertama, lalu isi sampai penuh atau tenggat habis."""
+        first = self._queue.get()
+        if first is _STOP:
+            return None
+        batch = [first]
+        deadline = first[2] + self.max_delay
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.perf_counter()
+            try:
+                item = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is _STOP:
+                self._queue.put(_STOP)
+                break
+            batch.append(item)
+        return batch
+
+    def _predict(self, texts):
+        from inference import predict_sentiment_batch
+
+        # Rujukan kuat ke model hanya selama satu batch
+        model = self.model
+        if model is None:
+            raise RuntimeError("Model micro-batcher sudah dibebaskan")
+        return predict_sentiment_batch(texts, model, self.tokenizer, batch_size=len(texts))
+
+    def _run(self):
+        while True:
+            batch = self._collect()
+            if batch is None:
+                return
+
+            # Request yang sudah dibatalkan pemanggilnya (timeout) dibuang
+            batch = [item for item in batch if item[1].set_running_or_notify_cancel()]
+            if not batch:
+                continue
+            texts = [text for text, _, _ in batch]
+            try:
+                labels, confidences, probabilities, cleaned = self._predict(texts)
+            except Exception as e:
+                for _, future, _ in batch:
+                    future.set_exception(e)
+                continue
+
+            selesai = time.perf_counter()
+            for i, (_, future, submitted) in enumerate(batch):
+                future.set_result((labels[i], float(confidences[i]), probabilities[i], cleaned[i]))
+
+            with self._lock:
+                self._batch_sizes[len(batch)] += 1
+                self._requests += len(batch)
+                self._latencies.extend(selesai - submitted for _, _, submitted in batch)
+
+
+_batchers = weakref.WeakKeyDictionary()
+_batchers_lock = threading.Lock()
+
+
+def get_micro_batcher(model, tokenizer, create=True):
+    """MicroBatcher bersama untuk `model` (semua sesi), atau None bila tidak ada.
+
+    Batcher dibuat ulang bila tokenizer-nya berbeda. Dengan `create=False`
+    hanya batcher yang sudah ada yang dikembalikan (tanpa memulai thread).
+    """
+    if model is None:
+        return None
+    with _batchers_lock:
+        batcher = _batchers.get(model)
+        if batcher is not None and batcher.tokenizer is not tokenizer:
+            batcher.close(timeout=0)
+            batcher = None
+        if batcher is None and create:
+            batcher = MicroBatcher(model, tokenizer)
+            _batchers[model] = batcher
+        return batcher
@@ -0,0 +1,274 @@
+"""Mesin inferensi LSTM murni NumPy, dibaca langsung dari bobot file .h5 Keras.
+
+Mendukung arsitektur model skripsi ini: Embedding (mask_zero) -> LSTM ->
+Dense -> Dense (Softmax), termasuk layer Dropout/SpatialDropout1D yang
+tidak berpengaruh saat inferensi. Tidak meng-import TensorFlow sama sekali.
+
+Bobot juga bisa diekspor ke satu file datar yang dibaca lewat `mmap`
+read-only (`NumpyLSTMModel.from_mapped`), sehingga beberapa proses Streamlit /
+worker di satu host memakai satu salinan fisik bobot di page cache:
+
+    magic 'SWEIGHT1' | panjang header (uint32) | header JSON | padding
+    data  : array float32 little-endian, masing-masing rata 64 byte
+
+Header menyimpan class_name & config setiap layer, posisi/bentuk bobotnya,
+serta sha1 file .h5 sumber untuk mendeteksi file yang usang.
+
+Ekspor ulang setiap kali model berubah (sekaligus kosakata biner tokenizer):
+    python numpy_backend.py [--h5 model/Model_Sentiment_LSTM.h5] [--output model/Model_Sentiment_LSTM.weights]
+"""
+import argparse
+import json
+import mmap
+import os
+import struct
+
+import h5py
+import numpy as np
+
+from vocabulary import file_digest
+
+WEIGHTS_MAGIC = b'SWEIGHT1'
+_ALIGN = 64
+
+# Layer yang hanya aktif saat training
+_PASSTHROUGH_LAYERS = {'InputLayer', 'Dropout', 'SpatialDropout1D', 'GaussianNoise', 'GaussianDropout'}
+
+
+def _sigmoid(x):
+    return 0.5 * (np.tanh(0.5 * x) + 1.0)
+
+
+def _hard_sigmoid(x):
+    return np.clip(0.2 * x + 0.5, 0.0, 1.0)
+
+
+def _relu(x):
+    return np.maximum(x, 0.0)
+
+
+def _softmax(x):
+    e = np.exp(x - x.max(axis=-1, keepdims=True))
+    return e / e.sum(axis=-1, keepdims=True)
+
+
+def _linear(x):
+    return x
+
+
+ACTIVATIONS = {
+    'linear': _linear,
+    None: _linear,
+    'relu': _relu,
+    'tanh': np.tanh,
+    'sigmoid': _sigmoid,
+    'hard_sigmoid': _hard_sigmoid,
+    'softmax': _softmax,
+}
+
+
+def _activation(name):
+    if isinstance(name, dict):
+        # Format Keras 3: {"module": ..., "class_name": ..., "config": ...}
+        name = name.get('config', {}).get('name', name.get('class_name'))
+    if name not in ACTIVATIONS:
+        raise ValueError(f"Aktivasi '{name}' belum didukung oleh backend NumPy.")
+    return ACTIVATIONS[name]
+
+
+def _aligned(offset):
+    return offset + (-offset % _ALIGN)
+
+
+def _read_h5_layers(path):
+    """[(class_name, config, bobot float32)] untuk setiap layer yang dipakai saat inferensi."""
+    with h5py.File(path, mode='r') as f:
+        model_config = f.attrs.get('model_config')
+        if isinstance(model_config, bytes):
+            model_config = model_config.decode('utf-8')
+        config = json.loads(model_config)
+        weights_group = f['model_weights'] if 'model_weights' in f else f
+
+        layer_configs = config['config']
+        if isinstance(layer_configs, dict):
+            layer_configs = layer_configs['layers']
+
+        layers = []
+        for layer in layer_configs:
+            class_name = layer['class_name']
+            layer_cfg = layer['config']
+            if class_name in _PASSTHROUGH_LAYERS:
+                continue
+
+            group = weights_group[layer_cfg['name']]
+            weight_names = [n.decode('utf-8') if isinstance(n, bytes) else n for n in group.attrs['weight_names']]
+            weights = [np.asarray(group[n], dtype=np.float32) for n in weight_names]
+            layers.append((class_name, layer_cfg, weights))
+
+    return layers
+
+
+def export_weights(h5_path, output_path):
+    """Tulis bobot model .h5 ke file datar untuk `NumpyLSTMModel.from_mapped`; kembalikan ukurannya."""
+    header_layers, arrays, offset = [], [], 0
+    for class_name, cfg, weights in _read_h5_layers(h5_path):
+        entries = []
+        for w in weights:
+            entries.append({'shape': list(w.shape), 'offset': offset})
+            arrays.append((offset, np.ascontiguousarray(w, dtype='<f4')))
+            offset = _aligned(offset + w.nbytes)
+        header_layers.append({'class_name': class_name, 'config': cfg, 'weights': entries})
+
+    header = json.dumps({'layers': header_layers, 'source_sha1': file_digest(h5_path)}).encode('utf-8')
+    prefix = WEIGHTS_MAGIC + struct.pack('<I', len(header)) + header
+    prefix += b'\x00' * (_aligned(len(prefix)) - len(prefix))
+
+    tmp_path = output_path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(prefix)
+        for start, array in arrays:
+            f.write(b'\x00' * (len(prefix) + start - f.tell()))
+            f.write(array.tobytes())
+    os.replace(tmp_path, output_path)
+    return os.path.getsize(output_path)
+
+
+class NumpyLSTMModel:
+    """Forward pass Embedding -> LSTM -> Dense tervektorisasi per batch.
+
+    Antarmuka `predict(x, verbose=0)` sama dengan model Keras sehingga bisa
+    langsung dipakai oleh `inference.predict_sentiment` dan turunannya.
+    """
+
+    def __init__(self, layers, source_digest=None):
+        self.layers = layers
+        # sha1 file .h5 sumber (hanya untuk model dari file bobot mmap)
+        self.source_digest = source_digest
+
+    @classmethod
+    def from_h5(cls, path):
+        return cls([cls._build_layer(*layer) for layer in _read_h5_layers(path)])
+
+    @classmethod
+    def from_mapped(cls, path):
+        """Model dengan bobot berupa view read-only atas file hasil `export_weights`."""
+        with open(path, 'rb') as f:
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if buffer[:len(WEIGHTS_MAGIC)] != WEIGHTS_MAGIC:
+            raise ValueError(f"{path} bukan file bobot mmap")
+
+        offset = len(WEIGHTS_MAGIC)
+        (header_len,) = struct.unpack_from('<I', buffer, offset)
+        offset += 4
+        header = json.loads(buffer[offset:offset + header_len].decode('utf-8'))
+        data_start = _aligned(offset + header_len)
+
+        layers = []
+        for layer in header['layers']:
+            weights = [
+                np.frombuffer(buffer, dtype='<f4', count=int(np.prod(w['shape'])),
+                              offset=data_start + w['offset']).reshape(w['shape'])
+                for w in layer['weights']
+            ]
+            layers.append(cls._build_layer(layer['class_name'], layer['config'], weights))
+        return cls(layers, source_digest=header['source_sha1'])
+
+    def is_stale(self, h5_path):
+        """True bila file .h5 sumber berubah sejak bobot mmap diekspor."""
+        if self.source_digest is None:
+            return False
+        try:
+            return file_digest(h5_path) != self.source_digest
+        except OSError:
+            return False
+
+    @staticmethod
+    def _build_layer(class_name, cfg, weights):
+        if class_name == 'Embedding':
+            return ('embedding', {'embeddings': weights[0], 'mask_zero': cfg.get('mask_zero', False)})
+        if class_name == 'LSTM':
+            if cfg.get('return_sequences') or cfg.get('go_backwards') or cfg.get('stateful'):
+                raise ValueError("Konfigurasi LSTM ini belum didukung oleh backend NumPy.")
+            kernel, recurrent_kernel = weights[0], weights[1]
+            bias = weights[2] if cfg.get('use_bias', True) else np.zeros(kernel.shape[1], dtype=np.float32)
+            return ('lstm', {
+                'kernel': kernel,
+                'recurrent_kernel': recurrent_kernel,
+                'bias': bias,
+                'units': recurrent_kernel.shape[0],
+                'activation': _activation(cfg.get('activation', 'tanh')),
+                'recurrent_activation': _activation(cfg.get('recurrent_activation', 'sigmoid')),
+            })
+        if class_name == 'Dense':
+            bias = weights[1] if cfg.get('use_bias', True) else 0.0
+            return ('dense', {'kernel': weights[0], 'bias': bias, 'activation': _activation(cfg.get('activation'))})
+        raise ValueError(f"Layer '{class_name}' belum didukung oleh backend NumPy.")
+
+    def predict(self, x, batch_size=None, verbose=0):
+        x = np.asarray(x)
+        mask = None
+        for kind, params in self.layers:
+            if kind == 'embedding':
+                if params['mask_zero']:
+                    mask = x != 0
+                x = params['embeddings'][x]
+            elif kind == 'lstm':
+                x = self._lstm(x, mask, params)
+                mask = None
+            else:
+                x = params['activation'](x @ params['kernel'] + params['bias'])
+        return x
+
+    @staticmethod
+    def _lstm(x, mask, params):
+        batch, timesteps, _ = x.shape
+        units = params['units']
+        activation = params['activation']
+        recurrent_activation = params['recurrent_activation']
+        recurrent_kernel = params['recurrent_kernel']
+
+        # Proyeksi input untuk semua timestep sekaligus: (B, T, 4U)
+        projected = x @ params['kernel'] + params['bias']
+        h = np.zeros((batch, units), dtype=np.float32)
+        c = np.zeros((batch, units), dtype=np.float32)
+
+        for t in range(timesteps):
+            z = projected[:, t] + h @ recurrent_kernel
+            # Urutan gate Keras: input, forget, cell, output
+            i = recurrent_activation(z[:, :units])
+            f = recurrent_activation(z[:, units:2 * units])
+            g = activation(z[:, 2 * units:3 * units])
+            o = recurrent_activation(z[:, 3 * units:])
+            c_new = f * c + i * g
+            h_new = o * activation(c_new)
+
+            if mask is None:
+                h, c = h_new, c_new
+            else:
+                # Posisi padding (ID 0) tidak mengubah state, sama seperti masking Keras
+                step = mask[:, t:t + 1]
+                h = np.where(step, h_new, h)
+                c = np.where(step, c_new, c)
+
+        return h
+
+
+def main():
+    from inference import KERAS_DEFAULT_FILTERS, MODEL_PATH, MODEL_WEIGHTS_PATH, TOKENIZER_JSON_PATH, TOKENIZER_VOCAB_PATH
+    from vocabulary import compile_vocabulary
+
+    parser = argparse.ArgumentParser(description="Ekspor bobot model & kosakata tokenizer ke file mmap bersama.")
+    parser.add_argument('--h5', default=MODEL_PATH)
+    parser.add_argument('--output', default=MODEL_WEIGHTS_PATH)
+    parser.add_argument('--tanpa-kosakata', action='store_true', help="Jangan build ulang kosakata biner.")
+    args = parser.parse_args()
+
+    size = export_weights(args.h5, args.output)
+    print(f"Bobot ditulis ke {args.output} ({size / 1024:.1f} KB)")
+    if not args.tanpa_kosakata:
+        total = compile_vocabulary(TOKENIZER_JSON_PATH, TOKENIZER_VOCAB_PATH, KERAS_DEFAULT_FILTERS)
+        print(f"{total:,} kata ditulis ke {TOKENIZER_VOCAB_PATH}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,189 @@
+"""Instrumentasi waktu ringan untuk jalur panas dashboard.
+
+Tahap yang mahal (memuat model, `clean_text`, tokenisasi, `model.predict`,
+parsing CSV, render WordCloud, pembuatan grafik Plotly, dan setiap fungsi
+`render_*`) dibungkus span bernama:
+
+    with span('model.predict'):
+        ...
+
+    @timed('render_visualisasi')
+    def render_visualisasi(): ...
+
+Durasi dikumpulkan per nama span (jumlah, total, dan `SPAN_WINDOW` sampel
+terakhir untuk persentil), lalu bisa dilihat di halaman "Performa" atau
+diekspor sebagai JSON / format teks Prometheus.
+
+Instrumentasi aktif bila env `SENTIMEN_PERF=1`. Saat nonaktif, `span`
+mengembalikan context manager kosong yang sama dan fungsi `timed` hanya
+mengecek satu flag, sehingga biayanya praktis nol.
+"""
+import functools
+import json
+import os
+import threading
+import time
+from collections import deque
+
+import numpy as np
+
+PERF_ENABLED = os.environ.get('SENTIMEN_PERF', '').lower() in ('1', 'true', 'yes')
+# Jumlah sampel durasi terakhir per span yang dipakai untuk persentil
+SPAN_WINDOW = 4096
+PERCENTILES = (50, 90, 99)
+
+
+class _NoopSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+class _Span:
+    __slots__ = ('registry', 'name', 'start')
+
+    def __init__(self, registry, name):
+        self.registry = registry
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.registry.record(self.name, time.perf_counter() - self.start)
+        return False
+
+
+class _SpanStats:
+    __slots__ = ('count', 'total', 'max', 'samples')
+
+    def __init__(self, window):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.samples = deque(maxlen=window)
+
+
+class PerfRegistry:
+    """Kumpulan statistik span; aman dipakai bersamaan dari banyak thread/sesi."""
+
+    def __init__(self, enabled=PERF_ENABLED, window=SPAN_WINDOW):
+        self.enabled = enabled
+        self.window = window
+        self._lock = threading.Lock()
+        self._spans = {}
+
+    # --- pencatatan ------------------------------------------------------------
+    def span(self, name):
+        return _Span(self, name) if self.enabled else _NOOP_SPAN
+
+    def record(self, name, seconds):
+        with self._lock:
+            stats = self._spans.get(name)
+            if stats is None:
+                stats = self._spans[name] = _SpanStats(self.window)
+            stats.count += 1
+            stats.total += seconds
+            stats.max = max(stats.max, seconds)
+            stats.samples.append(seconds)
+
+    def timed(self, name=None):
+        """Decorator: catat setiap panggilan fungsi sebagai span `name`."""
+        def decorator(fn):
+            span_name = name or fn.__name__
+
+            @functools.wraps(fn)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return fn(*args, **kwargs)
+                start = time.perf_counter()
+                try:
+                    return fn(*args, **kwargs)
+                finally:
+                    self.record(span_name, time.perf_counter() - start)
+            return wrapper
+        return decorator
+
+    def iter_timed(self, name, iterable):
+        """Bungkus iterator (mis. reader CSV per chunk): setiap `next()` dicatat."""
+        if not self.enabled:
+            yield from iterable
+            return
+        iterator = iter(iterable)
+        while True:
+            start = time.perf_counter()
+            try:
+                item = next(iterator)
+            except StopIteration:
+                return
+            self.record(name, time.perf_counter() - start)
+            yield item
+
+    # --- agregasi & ekspor ---------------------------------------------------------
+    def snapshot(self):
+        """{nama_span: {count, total_s, mean_ms, p50_ms, p90_ms, p99_ms, max_ms}}."""
+        with self._lock:
+            items = [(name, s.count, s.total, s.max, np.array(s.samples)) for name, s in self._spans.items()]
+
+        result = {}
+        for name, count, total, maximum, samples in sorted(items):
+            entry = {
+                'count': count,
+                'total_s': total,
+                'mean_ms': total / count * 1000 if count else 0.0,
+            }
+            for p in PERCENTILES:
+                entry[f'p{p}_ms'] = float(np.percentile(samples, p)) * 1000 if len(samples) else 0.0
+            entry['max_ms'] = maximum * 1000
+            result[name] = entry
+        return result
+
+    def reset(self):
+        with self._lock:
+            self._spans.clear()
+
+    def to_json(self, indent=2):
+        return json.dumps({'enabled': self.enabled, 'window': self.window, 'spans': self.snapshot()}, indent=indent)
+
+    def to_prometheus(self, prefix='sentimen'):
+        """Format teks eksposisi Prometheus (tipe summary, satuan detik)."""
+        metric = f'{prefix}_span_seconds'
+        lines = [
+            f'# HELP {metric} Durasi span instrumentasi dashboard sentimen.',
+            f'# TYPE {metric} summary',
+        ]
+        for name, entry in self.snapshot().items():
+            label = name.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+            for p in PERCENTILES:
+                lines.append(f'{metric}{{span="{label}",quantile="{p / 100:g}"}} {entry[f"p{p}_ms"] / 1000:.9g}')
+            lines.append(f'{metric}_sum{{span="{label}"}} {entry["total_s"]:.9g}')
+            lines.append(f'{metric}_count{{span="{label}"}} {entry["count"]}')
+        return '\n'.join(lines) + '\n'
+
+
+# Registry bersama satu proses; fungsi modul di bawah mendelegasikan ke sini
+registry = PerfRegistry()
+
+span = registry.span
+timed = registry.timed
+iter_timed = registry.iter_timed
+snapshot = registry.snapshot
+reset = registry.reset
+to_json = registry.to_json
+to_prometheus = registry.to_prometheus
+
+
+def set_enabled(enabled):
+    registry.enabled = bool(enabled)
+
+
+def is_enabled():
+    return registry.enabled
@@ -0,0 +1,126 @@
+"""Skoring batch multi-proses untuk file CSV yang sangat besar.
+
+Satu proses Python hanya memakai satu core untuk preprocessing (regex) dan
+sebagian besar inferensi. `ScoringPool` membagi kolom teks menjadi beberapa
+shard lalu menskornya di beberapa proses worker sekaligus. Setiap worker
+memuat model & tokenizer sekali saat start (logika yang sama dengan
+`load_resources`), lalu hasil tiap shard digabung kembali sesuai urutan
+baris aslinya. Dengan backend numpy dan file bobot mmap (`python
+numpy_backend.py`), bobot & kosakata semua worker berbagi satu salinan fisik.
+
+Jumlah worker default diambil dari env `SENTIMEN_WORKERS`.
+"""
+import math
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+import pandas as pd
+
+SCORING_WORKERS = int(os.environ.get('SENTIMEN_WORKERS', 1))
+# Shard minimal agar overhead kirim-terima antar proses tetap kecil
+MIN_SHARD_ROWS = 1000
+# Beberapa shard per worker supaya beban merata & progress bar tetap bergerak
+SHARDS_PER_WORKER = 4
+
+# ==============================================================================
+# SISI WORKER
+# ==============================================================================
+_worker_model = None
+_worker_tokenizer = None
+_worker_error = None
+
+
+def _init_worker(backend):
+    global _worker_model, _worker_tokenizer, _worker_error
+    from inference import ResourceLoadError, load_model_and_tokenizer
+
+    try:
+        _worker_model, _worker_tokenizer = load_model_and_tokenizer(backend)
+    except ResourceLoadError as e:
+        # Jangan biarkan initializer gagal (pool jadi "broken"); laporkan saat shard pertama
+        _worker_error = str(e)
+
+
+def _worker_ready():
+    from inference import ResourceLoadError
+
+    if _worker_error is not None:
+        raise ResourceLoadError(_worker_error)
+    return os.getpid()
+
+
+def _score_shard(texts, batch_size):
+    from inference import predict_text_column
+
+    _worker_ready()
+    labels, cleaned, error_count = predict_text_column(pd.Series(texts, dtype=object), _worker_model,
+                                                       _worker_tokenizer, batch_size=batch_size)
+    return labels.tolist(), cleaned.tolist(), error_count
+
+# ==============================================================================
+# SISI PROSES UTAMA
+# ==============================================================================
+class ScoringPool:
+    """Pool proses worker yang masing-masing memegang satu salinan model.
+
+    Dipakai sebagai pengganti `inference.predict_text_column` (tanda tangan dan
+    nilai kembalian sama). Proses dibuat dengan metode 'spawn' karena
+    TensorFlow tidak aman di-fork setelah thread-nya berjalan.
+    """
+
+    def __init__(self, workers=SCORING_WORKERS, backend=None):
+        self.workers = max(1, int(workers))
+        self.backend = backend
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context('spawn'),
+            initializer=_init_worker,
+            initargs=(backend,),
+        )
+
+    def warm_up(self):
+        """Tunggu semua worker selesai memuat model. ResourceLoadError bila gagal."""
+        futures = [self._executor.submit(_worker_ready) for _ in range(self.workers * SHARDS_PER_WORKER)]
+        return sorted({f.result() for f in futures})
+
+    def _shards(self, total):
+        n_shards = min(math.ceil(total / MIN_SHARD_ROWS), self.workers * SHARDS_PER_WORKER)
+        return np.array_split(np.arange(total), max(n_shards, 1))
+
+    def predict_text_column(self, texts, batch_size=None, progress_callback=None):
+        """Sama seperti `inference.predict_text_column`, tetapi dibagi ke semua worker."""
+        from inference import PREDICT_BATCH_SIZE
+
+        texts = texts.fillna("").astype(str)
+        values = texts.tolist()
+        shards = [idx for idx in self._shards(len(values)) if len(idx)]
+
+        futures = {
+            self._executor.submit(_score_shard, values[idx[0]:idx[-1] + 1], batch_size or PREDICT_BATCH_SIZE): i
+            for i, idx in enumerate(shards)
+        }
+        results = [None] * len(shards)
+        done = 0
+        for future in as_completed(futures):
+            i = futures[future]
+            results[i] = future.result()
+            done += len(shards[i])
+            if progress_callback is not None:
+                progress_callback(done, len(values))
+
+        # Gabung kembali sesuai urutan baris asli
+        labels = pd.Series([l for r in results for l in r[0]], index=texts.index, dtype=object)
+        cleaned = pd.Series([c for r in results for c in r[1]], index=texts.index, dtype=object)
+        error_count = sum(r[2] for r in results)
+        return labels, cleaned, error_count
+
+    def close(self):
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
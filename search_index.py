@@ -0,0 +1,197 @@
+"""Indeks terbalik (inverted index) untuk pencarian tweet di Data Explorer.
+
+Menggantikan `str.contains(..., case=False)` yang memindai seluruh kolom
+setiap rerun. Setiap kolom teks diindeks sekali per versi dataset menjadi:
+- `vocab`    : daftar kata unik yang terurut (untuk pencarian prefix);
+- `offsets`  : posisi awal daftar baris tiap kata di `postings` (format CSR);
+- `postings` : nomor baris (int32, terurut) yang memuat kata tersebut.
+Indeks disimpan sebagai .npz di folder cache dataset.
+
+Sintaks kueri: kata dipisah spasi dan semuanya harus ada (AND), huruf besar/
+kecil diabaikan, dan akhiran `*` berarti prefix (`pendidik*`).
+"""
+import bisect
+import os
+import re
+import threading
+
+import numpy as np
+import pandas as pd
+
+_TOKEN_RE = re.compile(r'\w+')
+# Saat build, '\n' ikut ditangkap sebagai penanda pergantian baris
+_CHUNK_TOKEN_RE = re.compile(r'\w+|\n')
+BUILD_CHUNK_SIZE = 100_000
+# Postings yang lebih panjang dari n_docs / rasio ini diproses lewat bitmap
+_BITMAP_RATIO = 64
+
+# Kolom dataset yang bisa dicari
+SEARCH_FIELDS = ('Teks Tweet', 'Tweet_Final')
+
+# Teks bantuan untuk kotak pencarian di UI
+BANTUAN_CARI = "Semua kata harus muncul (tidak peka huruf besar/kecil). Akhiri kata dengan * untuk mencari awalan, contoh: pendidik*"
+
+
+def parse_query(query):
+    """Pecah kueri menjadi daftar (kata, is_prefix)."""
+    terms = []
+    for part in str(query or '').lower().split():
+        is_prefix = part.endswith('*')
+        tokens = _TOKEN_RE.findall(part)
+        for i, token in enumerate(tokens):
+            # Hanya potongan terakhir yang mewarisi tanda '*'
+            terms.append((token, is_prefix and i == len(tokens) - 1))
+    return terms
+
+
+class SearchIndex:
+    def __init__(self, vocab, offsets, postings, n_docs):
+        self.vocab = vocab
+        self.offsets = offsets
+        self.postings = postings
+        self.n_docs = n_docs
+        self._term_ids = {term: i for i, term in enumerate(vocab)}
+
+    @classmethod
+    def build(cls, texts, chunksize=BUILD_CHUNK_SIZE):
+        """Bangun indeks dari Series/list teks (baris ke-i = dokumen i).
+
+        Diproses per `chunksize` baris agar memori tetap terbatas: setiap chunk
+        digabung menjadi satu string (dipisah baris baru) lalu di-tokenisasi dengan
+        satu pemanggilan regex. Pasangan (kata, baris) disandikan menjadi satu
+        int64 sehingga `np.unique` sekaligus membuang duplikat dan mengurutkan
+        postings per kata.
+        """
+        texts = pd.Series(texts, dtype=object).reset_index(drop=True)
+        n_docs = len(texts)
+        term_ids = {}
+        keys = []
+
+        for start in range(0, n_docs, chunksize):
+            chunk = texts.iloc[start:start + chunksize].fillna('').astype(str).str.replace('\n', ' ', regex=False)
+            tokens = np.array(_CHUNK_TOKEN_RE.findall('\n'.join(chunk).lower()), dtype=object)
+            is_break = tokens == '\n'
+            rows = start + np.cumsum(is_break)[~is_break]
+            codes, uniques = pd.factorize(tokens[~is_break])
+            global_ids = np.array([term_ids.setdefault(term, len(term_ids)) for term in uniques], dtype=np.int64)
+            keys.append(global_ids[codes] * n_docs + rows)
+
+        vocab = sorted(term_ids)
+        rank = np.empty(len(vocab), dtype=np.int64)
+        rank[[term_ids[term] for term in vocab]] = np.arange(len(vocab))
+
+        keys = np.concatenate(keys) if keys else np.zeros(0, dtype=np.int64)
+        terms, rows = np.divmod(keys, max(n_docs, 1))
+        keys = np.unique(rank[terms] * n_docs + rows)
+        terms, rows = np.divmod(keys, max(n_docs, 1))
+
+        offsets = np.zeros(len(vocab) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(terms, minlength=len(vocab)), out=offsets[1:])
+        return cls(vocab, offsets, rows.astype(np.int32), n_docs)
+
+    # --- akses postings -------------------------------------------------------
+    def _postings(self, term_id):
+        return self.postings[self.offsets[term_id]:self.offsets[term_id + 1]]
+
+    def _term_rows(self, term, is_prefix):
+        if not is_prefix:
+            term_id = self._term_ids.get(term)
+            return self.postings[:0] if term_id is None else self._postings(term_id)
+
+        lo = bisect.bisect_left(self.vocab, term)
+        hi = bisect.bisect_left(self.vocab, term + '\U0010ffff', lo)
+        if hi - lo == 1:
+            return self._postings(lo)
+        if hi == lo:
+            return self.postings[:0]
+        merged = self.postings[self.offsets[lo]:self.offsets[hi]]
+        if len(merged) > self.n_docs // _BITMAP_RATIO:
+            bitmap = np.zeros(self.n_docs, dtype=bool)
+            bitmap[merged] = True
+            return np.flatnonzero(bitmap).astype(np.int32)
+        return np.unique(merged)
+
+    def _intersect(self, small, large):
+        if len(small) == 0 or len(large) == 0:
+            return small[:0]
+        if len(large) > self.n_docs // _BITMAP_RATIO:
+            # Daftar besar: bitmap sepanjang dokumen lebih murah daripada pencarian biner
+            bitmap = np.zeros(self.n_docs, dtype=bool)
+            bitmap[large] = True
+            return small[bitmap[small]]
+        # O(|small| log |large|)
+        pos = np.searchsorted(large, small)
+        pos[pos == len(large)] = 0
+        return small[large[pos] == small]
+
+    # --- API ----------------------------------------------------------------
+    def search(self, query, row_mask=None):
+        """Nomor baris (terurut) yang cocok dengan kueri, atau None bila kueri kosong.
+
+        `row_mask` (array bool sepanjang dokumen) dipakai untuk filter tambahan,
+        misalnya label sentimen.
+        """
+        terms = parse_query(query)
+        if not terms:
+            if row_mask is None:
+                return None
+            return np.flatnonzero(row_mask).astype(np.int32)
+
+        lists = sorted((self._term_rows(term, is_prefix) for term, is_prefix in terms), key=len)
+        rows = lists[0]
+        for other in lists[1:]:
+            rows = self._intersect(rows, other)
+            if len(rows) == 0:
+                break
+        if row_mask is not None:
+            rows = rows[row_mask[rows]]
+        return rows
+
+    # --- persistensi -----------------------------------------------------------
+    def save(self, path):
+        tmp_path = path + '.tmp.npz'
+        # Kosakata disimpan sebagai satu blob UTF-8 (kata tidak pernah memuat '\n')
+        vocab = np.frombuffer('\n'.join(self.vocab).encode('utf-8'), dtype=np.uint8)
+        np.savez(tmp_path, vocab=vocab, offsets=self.offsets, postings=self.postings, n_docs=np.int64(self.n_docs))
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path) as data:
+            blob = data['vocab'].tobytes().decode('utf-8')
+            vocab = blob.split('\n') if blob else []
+            return cls(vocab, data['offsets'], data['postings'], int(data['n_docs']))
+
+# ==============================================================================
+# INDEKS DATASET PENELITIAN
+# ==============================================================================
+_dataset_indexes = {}
+_dataset_lock = threading.Lock()
+
+
+def dataset_search_index(field='Teks Tweet', path=None):
+    """Indeks untuk satu kolom dataset, dibangun sekali per versi dataset."""
+    from dataset import DATASET_PATH, get_dataset_cache
+
+    if field not in SEARCH_FIELDS:
+        raise ValueError(f"Kolom '{field}' tidak diindeks.")
+
+    cache = get_dataset_cache(path or DATASET_PATH)
+    version = cache.version
+    key = (cache.source_path, field, version)
+    with _dataset_lock:
+        if key not in _dataset_indexes:
+            slug = re.sub(r'\W+', '_', field)
+            path = os.path.join(cache.cache_dir, f"{cache.prefix}.index.{slug}.{version}.npz")
+            try:
+                index = SearchIndex.load(path)
+            except (OSError, ValueError, KeyError):
+                index = SearchIndex.build(cache.load([field])[field])
+                for name in os.listdir(cache.cache_dir):
+                    if name.startswith(f"{cache.prefix}.index.{slug}."):
+                        os.remove(os.path.join(cache.cache_dir, name))
+                index.save(path)
+            for old_key in [k for k in _dataset_indexes if k[:2] == key[:2]]:
+                del _dataset_indexes[old_key]
+            _dataset_indexes[key] = index
+        return _dataset_indexes[key]
@@ -0,0 +1,46 @@
+"""Fixture bersama untuk uji kesamaan output (pytest).
+
+Jalankan dari root repository:
+    python -m pytest tests
+"""
+import os
+import sys
+
+import pandas as pd
+import pytest
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+os.chdir(ROOT_DIR)
+
+DATA_PATH = os.path.join('data', 'Data_Lengkap_Tokenisasi.csv')
+
+
+@pytest.fixture(scope='session')
+def teks_dataset():
+    return pd.read_csv(DATA_PATH)['Teks Tweet'].fillna('').tolist()
+
+
+@pytest.fixture(scope='session')
+def tokenizer():
+    from inference import TOKENIZER_JSON_PATH, SequenceEncoder
+
+    return SequenceEncoder.from_json(TOKENIZER_JSON_PATH)
+
+
+@pytest.fixture(scope='session')
+def model_keras(tokenizer):
+    """Model berarsitektur sama dengan model penelitian (Embedding mask_zero -> LSTM -> Dense)
+    dengan bobot acak, sehingga uji tidak membutuhkan `model/Model_Sentiment_LSTM.h5`."""
+    tf = pytest.importorskip('tensorflow')
+    from inference import LABELS
+
+    tf.keras.utils.set_random_seed(42)
+    model = tf.keras.Sequential([
+        # Panjang input bebas agar `_predict_padded` benar-benar memotong per bucket
+        tf.keras.layers.Embedding(tokenizer.num_words, 32, mask_zero=True),
+        tf.keras.layers.LSTM(32),
+        tf.keras.layers.Dense(len(LABELS), activation='softmax'),
+    ])
+    model.build((None, None))
+    return model
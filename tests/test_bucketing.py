@@ -0,0 +1,51 @@
+"""Bucketing per panjang token vs padding penuh (100) di `predict_sentiment_batch`."""
+import numpy as np
+
+from inference import BUCKET_LENGTH_STEP, MAX_SEQUENCE_LENGTH, predict_sentiment_batch
+
+TOLERANSI = 1e-5
+
+
+class ModelPencatat:
+    """Meneruskan `predict` ke model Keras sambil mencatat lebar input tiap mini-batch."""
+
+    def __init__(self, model):
+        self.model = model
+        self.lebar = []
+
+    def predict(self, x, verbose=0):
+        self.lebar.append(x.shape[1])
+        return self.model.predict(x, verbose=verbose)
+
+
+def test_bucketing_sama_dengan_padding_penuh(teks_dataset, model_keras, tokenizer):
+    teks = teks_dataset[:600] + ['', 'dana bos', 'kata ' * 150]
+    model = ModelPencatat(model_keras)
+
+    _, _, prob_penuh, _ = predict_sentiment_batch(
+        teks, model, tokenizer, batch_size=64, bucket_by_length=False, use_cache=False)
+    assert set(model.lebar) == {MAX_SEQUENCE_LENGTH}
+
+    model.lebar.clear()
+    _, _, prob_bucket, _ = predict_sentiment_batch(
+        teks, model, tokenizer, batch_size=64, bucket_by_length=True, use_cache=False)
+    # Bucketing benar-benar memotong input, dengan lebar kelipatan BUCKET_LENGTH_STEP
+    assert min(model.lebar) < MAX_SEQUENCE_LENGTH
+    assert all(w % BUCKET_LENGTH_STEP == 0 or w == MAX_SEQUENCE_LENGTH for w in model.lebar)
+
+    np.testing.assert_allclose(prob_bucket, prob_penuh, rtol=0, atol=TOLERANSI)
+
+
+def test_bucketing_kembali_ke_padding_penuh_untuk_input_tetap(teks_dataset, model_keras, tokenizer):
+    class ModelPanjangTetap(ModelPencatat):
+        def predict(self, x, verbose=0):
+            if x.shape[1] != MAX_SEQUENCE_LENGTH:
+                raise ValueError("panjang input harus 100")
+            return super().predict(x, verbose=verbose)
+
+    teks = teks_dataset[:100]
+    _, _, prob_penuh, _ = predict_sentiment_batch(
+        teks, model_keras, tokenizer, bucket_by_length=False, use_cache=False)
+    _, _, prob_bucket, _ = predict_sentiment_batch(
+        teks, ModelPanjangTetap(model_keras), tokenizer, bucket_by_length=True, use_cache=False)
+    np.testing.assert_allclose(prob_bucket, prob_penuh, rtol=0, atol=TOLERANSI)
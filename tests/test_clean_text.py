@@ -0,0 +1,63 @@
+"""Golden output `clean_text` / `clean_text_series` terhadap implementasi lama."""
+import random
+import re
+
+import pandas as pd
+import pytest
+
+from inference import clean_text, clean_text_series, slang_dict
+
+
+def clean_text_lama(text):
+    """Salinan implementasi `clean_text` sebelum dioptimasi (referensi golden output)."""
+    if not isinstance(text, str): return ""
+    text = text.lower()
+    text = re.sub(r'http\S+|www\S+|https\S+', '', text, flags=re.MULTILINE)
+    text = re.sub(r'@\w+', '', text)
+    text = re.sub(r'#\w+', '', text)
+    text = re.sub(r'\d+', '', text)
+    text = re.sub(r'[^\w\s]', ' ', text)
+    text = re.sub(r'\s+', ' ', text).strip()
+
+    words = text.split()
+    normalized_words = [slang_dict.get(w, w) for w in words]
+    return " ".join(normalized_words)
+
+
+def teks_acak(n, seed=42):
+    """Teks acak berisi potongan yang rawan beda hasil (URL di dalam mention, angka, simbol)."""
+    rng = random.Random(seed)
+    potongan = ['http', 'https://', 'www', 'www.', '@', '#', '1', '23', ' ', '\n', '\t', '.', ',', '!',
+                '_', 'yg', 'gk', 'd', 'g', 'Tak', 'BGT', 'dana', 'bos', 'é', 'Σ', 'ß', ' ', '😊', '/']
+    return ["".join(rng.choice(potongan) for _ in range(rng.randint(0, 25))) for _ in range(n)]
+
+
+KASUS_KHUSUS = [
+    None, float('nan'), 123, '', '   ', 'ada\x00pemisah',
+    'Dana BOS dipotong lagi!! https://t.co/abc @kemdikbud #PendidikanGratis',
+    'gk ngerti yg dimaksud 2025... www.contoh.id/x?y=1',
+    '@user_1https://t.co/x tetap_ada ΣΣ ß',
+]
+
+
+@pytest.mark.parametrize('text', KASUS_KHUSUS)
+def test_clean_text_kasus_khusus(text):
+    assert clean_text(text) == clean_text_lama(text)
+
+
+def test_clean_text_sama_dengan_implementasi_lama(teks_dataset):
+    teks = teks_dataset + teks_acak(5000)
+    beda = [t for t in teks if clean_text(t) != clean_text_lama(t)]
+    assert beda == []
+
+
+def test_clean_text_series_sama_dengan_implementasi_lama(teks_dataset):
+    teks = teks_dataset + KASUS_KHUSUS + teks_acak(2000, seed=7)
+    assert clean_text_series(pd.Series(teks)).tolist() == [clean_text_lama(t) for t in teks]
+
+
+def test_clean_text_series_mempertahankan_index():
+    seri = pd.Series(['Gk tau @a', None, 'BGT 123'], index=[10, 5, 7])
+    hasil = clean_text_series(seri)
+    assert hasil.index.tolist() == [10, 5, 7]
+    assert hasil.tolist() == [clean_text_lama(t) for t in seri]
@@ -0,0 +1,51 @@
+"""Probabilitas backend NumPy (`NumpyLSTMModel`) vs model Keras yang sama."""
+import numpy as np
+import pytest
+
+from inference import MAX_SEQUENCE_LENGTH, predict_sentiment_batch
+from numpy_backend import NumpyLSTMModel, export_weights
+
+TOLERANSI = 1e-5
+
+
+@pytest.fixture(scope='module')
+def path_h5(model_keras, tmp_path_factory):
+    path = str(tmp_path_factory.mktemp('model') / 'model.h5')
+    model_keras.save(path, save_format='h5')
+    return path
+
+
+def sequence_acak(tokenizer, jumlah=256, seed=0):
+    """ID token acak dengan panjang beragam dan padding 'post' (ID 0), termasuk baris kosong."""
+    rng = np.random.default_rng(seed)
+    x = rng.integers(1, tokenizer.num_words, size=(jumlah, MAX_SEQUENCE_LENGTH), dtype=np.int32)
+    panjang = rng.integers(0, MAX_SEQUENCE_LENGTH + 1, size=jumlah)
+    x[np.arange(MAX_SEQUENCE_LENGTH) >= panjang[:, None]] = 0
+    return x
+
+
+@pytest.mark.parametrize('lebar', [8, 24, MAX_SEQUENCE_LENGTH])
+def test_predict_sama_dengan_keras(model_keras, path_h5, tokenizer, lebar):
+    x = sequence_acak(tokenizer)[:, :lebar]
+    prob_keras = model_keras.predict(x, verbose=0)
+    prob_np = NumpyLSTMModel.from_h5(path_h5).predict(x)
+    np.testing.assert_allclose(prob_np, prob_keras, rtol=0, atol=TOLERANSI)
+
+
+def test_bobot_mmap_sama_dengan_h5(path_h5, tokenizer, tmp_path):
+    path_bobot = str(tmp_path / 'model.weights')
+    export_weights(path_h5, path_bobot)
+    mapped = NumpyLSTMModel.from_mapped(path_bobot)
+    x = sequence_acak(tokenizer, seed=1)
+    np.testing.assert_array_equal(mapped.predict(x), NumpyLSTMModel.from_h5(path_h5).predict(x))
+    assert not mapped.is_stale(path_h5)
+
+
+@pytest.mark.parametrize('bucket_by_length', [False, True])
+def test_predict_sentiment_batch_sama_dengan_keras(teks_dataset, model_keras, path_h5, tokenizer, bucket_by_length):
+    teks = teks_dataset[:300]
+    _, _, prob_keras, _ = predict_sentiment_batch(
+        teks, model_keras, tokenizer, bucket_by_length=bucket_by_length, use_cache=False)
+    _, _, prob_np, _ = predict_sentiment_batch(
+        teks, NumpyLSTMModel.from_h5(path_h5), tokenizer, bucket_by_length=bucket_by_length, use_cache=False)
+    np.testing.assert_allclose(prob_np, prob_keras, rtol=0, atol=TOLERANSI)
@@ -0,0 +1,36 @@
+"""Artefak sequence token & pasangan kata:ID untuk halaman Proses Data tahap 3."""
+import json
+
+import numpy as np
+import pytest
+
+import inference
+import token_sequences
+from inference import TOKENIZER_JSON_PATH, SequenceEncoder
+
+
+def test_word_ids_sejajar_dengan_encode(teks_dataset, tokenizer):
+    teks = teks_dataset + ['gara-gara covid', 'kata_langka_sekali dana', '', None]
+    sequences = tokenizer.encode(teks)
+    for text, row in zip(teks, sequences):
+        pasangan = tokenizer.word_ids(text)
+        assert [i for _, i in pasangan] == row[row != 0].tolist()
+    assert tokenizer.word_ids('gara-gara covid', maxlen=2) == [
+        ('gara', tokenizer.lookup['gara']), ('gara', tokenizer.lookup['gara'])]
+
+
+def test_encoder_dari_tokenizer_keras(monkeypatch):
+    # Hanya ada tokenizer pickle: load_tokenizer mengembalikan Tokenizer Keras tanpa `encode`
+    text = pytest.importorskip('tensorflow').keras.preprocessing.text
+    with open(TOKENIZER_JSON_PATH, encoding='utf-8') as f:
+        isi = json.load(f)
+    # File JSON penelitian berisi string JSON (ter-encode dua kali)
+    tokenizer_keras = text.tokenizer_from_json(isi if isinstance(isi, str) else json.dumps(isi))
+    monkeypatch.setattr(inference, 'load_tokenizer', lambda backend=None: tokenizer_keras)
+    monkeypatch.setattr(token_sequences, '_encoders', {})
+
+    encoder = token_sequences.get_token_encoder()
+    assert isinstance(encoder, SequenceEncoder)
+    hasil = token_sequences.build_token_sequences(encoder)
+    np.testing.assert_array_equal(
+        hasil.sequences, token_sequences.build_token_sequences(SequenceEncoder.from_json(TOKENIZER_JSON_PATH)).sequences)
@@ -0,0 +1,210 @@
+"""Backend inferensi TFLite terkuantisasi untuk node CPU.
+
+Konversi (sekali, setiap model .h5 berubah) menghasilkan satu file .tflite
+dengan beberapa signature `batch_<n>_len_<l>`, masing-masing berbentuk tetap
+int32 [n x l]. Bentuk tetap diperlukan agar LSTM ber-mask dikonversi ke op
+builtin TFLite saja (bentuk dinamis membutuhkan op TensorList / Flex yang
+hanya tersedia di TensorFlow penuh); bobot tetap disimpan sekali dan dipakai
+bersama semua signature. Beberapa panjang token dipertahankan agar mini-batch
+yang dipotong per panjang (`inference._predict_padded`) tidak selalu
+menjalankan LSTM sebanyak MAX_SEQUENCE_LENGTH langkah.
+
+Kuantisasi:
+- 'dynamic' : bobot int8, aktivasi float (tanpa data kalibrasi);
+- 'int8'    : bobot & aktivasi int8, dikalibrasi dengan sampel sequence
+              dari dataset penelitian (input token & output tetap int32/float).
+
+Saat runtime `TFLiteModel` memakai `tflite_runtime` bila terpasang (tanpa
+TensorFlow), atau `tf.lite.Interpreter` sebagai gantinya.
+
+Build ulang setiap kali model berubah:
+    python tflite_backend.py [--kuantisasi dynamic|int8] [--output model/Model_Sentiment_LSTM.tflite]
+"""
+import argparse
+import os
+import re
+import shutil
+import tempfile
+import threading
+
+import numpy as np
+
+TFLITE_QUANTIZATIONS = ('dynamic', 'int8')
+_SIGNATURE_PATTERN = re.compile(r'^batch_(\d+)_len_(\d+)$')
+
+
+def _fixed_shape_model(keras_model, batch_size, length):
+    """Model berinput [batch_size x length] yang memakai ulang layer & bobot model asli.
+
+    Model Sequential skripsi ini dideklarasikan dengan input (None, 100);
+    menyusun ulang layer-nya di atas Input baru membuat panjang token lain
+    bisa dikonversi (mask dari Embedding tetap diteruskan ke LSTM).
+    """
+    import tensorflow as tf
+
+    if not isinstance(keras_model, tf.keras.Sequential):
+        return keras_model
+    inputs = tf.keras.Input(shape=(length,), batch_size=batch_size, dtype='int32')
+    outputs = inputs
+    for layer in keras_model.layers:
+        outputs = layer(outputs)
+    return tf.keras.Model(inputs, outputs)
+
+
+def convert_model(keras_model, output_path, batch_sizes, lengths, quantization='dynamic',
+                  representative_data=None):
+    """Konversi model Keras ke TFLite terkuantisasi; kembalikan ukuran file (byte)."""
+    import tensorflow as tf
+
+    if quantization not in TFLITE_QUANTIZATIONS:
+        raise ValueError(f"Kuantisasi tidak dikenal: {quantization}")
+    if quantization == 'int8' and representative_data is None:
+        raise ValueError("Kuantisasi int8 membutuhkan representative_data")
+
+    module = tf.Module()
+    module.model = keras_model
+    signatures = {}
+    for batch_size in sorted(set(batch_sizes)):
+        for length in sorted(set(lengths)):
+            model = _fixed_shape_model(keras_model, batch_size, length)
+            forward = tf.function(
+                lambda x: {'probabilitas': model(x, training=False)},
+                input_signature=[tf.TensorSpec([batch_size, length], tf.int32, name='token')],
+            )
+            signatures[f'batch_{batch_size}_len_{length}'] = forward.get_concrete_function()
+
+    saved_dir = tempfile.mkdtemp(prefix='sentimen_tflite_')
+    try:
+        tf.saved_model.save(module, saved_dir, signatures=signatures)
+        converter = tf.lite.TFLiteConverter.from_saved_model(saved_dir, signature_keys=list(signatures))
+        converter.optimizations = [tf.lite.Optimize.DEFAULT]
+        if quantization == 'int8':
+            samples = np.asarray(representative_data, dtype=np.int32)
+
+            def representative_dataset():
+                # Setiap signature dikalibrasi dengan sampel yang sama, dipotong per bentuk input
+                for key, forward in signatures.items():
+                    batch_size, length = forward.inputs[0].shape
+                    for start in range(0, len(samples), batch_size):
+                        rows = samples[start:start + batch_size, :length]
+                        yield key, {'token': np.resize(rows, (batch_size, length))}
+
+            converter.representative_dataset = representative_dataset
+        content = converter.convert()
+    finally:
+        shutil.rmtree(saved_dir, ignore_errors=True)
+
+    tmp_path = output_path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(content)
+    os.replace(tmp_path, output_path)
+    return len(content)
+
+
+def _load_interpreter(path, num_threads=None):
+    try:
+        from tflite_runtime.interpreter import Interpreter
+    except ImportError:
+        import tensorflow as tf
+
+        Interpreter = tf.lite.Interpreter
+    return Interpreter(model_path=path, num_threads=num_threads)
+
+
+class TFLiteModel:
+    """Antarmuka `predict(x, verbose=0)` sama dengan model Keras / NumpyLSTMModel.
+
+    Baris dipotong ke ukuran batch terbesar yang muat; sisa baris memakai
+    batch terkecil yang cukup (baris kosong ditambahkan) bila pemborosannya
+    tidak lebih dari jumlah baris aslinya. Setiap potongan memakai signature
+    dengan panjang terkecil yang memuat token terakhirnya (kolom token 0 di
+    kanan dibuang/ditambah, di-mask model). Input yang lebih lebar dari semua
+    signature melempar `ValueError`.
+    """
+
+    def __init__(self, path, num_threads=None):
+        self.path = path
+        self.interpreter = _load_interpreter(path, num_threads)
+        self._runners = {}
+        for key in self.interpreter.get_signature_list():
+            match = _SIGNATURE_PATTERN.match(key)
+            if match:
+                shape = (int(match.group(1)), int(match.group(2)))
+                self._runners[shape] = self.interpreter.get_signature_runner(key)
+        if not self._runners:
+            raise ValueError(f"{path} tidak memiliki signature 'batch_<n>_len_<l>'")
+        self.batch_sizes = sorted({b for b, _ in self._runners})
+        self.lengths = sorted({length for _, length in self._runners})
+        self.maxlen = self.lengths[-1]
+        runner = next(iter(self._runners.values()))
+        self.num_labels = int(runner.get_output_details()['probabilitas']['shape'][1])
+        # Interpreter TFLite tidak thread-safe (ResourceLoader, MicroBatcher)
+        self._lock = threading.Lock()
+
+    def warm_up(self):
+        """Alokasikan tensor setiap signature dengan satu panggilan kosong."""
+        for batch_size, length in self._runners:
+            self.predict(np.zeros((batch_size, length), dtype=np.int32))
+        return self
+
+    def _pick_batch_size(self, remaining):
+        fitting = [b for b in self.batch_sizes if b <= remaining]
+        larger = [b for b in self.batch_sizes if b >= remaining]
+        if larger and (not fitting or larger[0] - remaining <= remaining):
+            return larger[0]
+        return fitting[-1]
+
+    def _pick_length(self, width):
+        return next(length for length in self.lengths if length >= width)
+
+    def predict(self, x, batch_size=None, verbose=0):
+        x = np.asarray(x, dtype=np.int32)
+        if x.ndim != 2 or x.shape[1] > self.maxlen:
+            raise ValueError(f"Model TFLite membutuhkan input [batch, <= {self.maxlen}], diterima {list(x.shape)}")
+
+        output = np.empty((len(x), self.num_labels), dtype=np.float32)
+        start = 0
+        with self._lock:
+            while start < len(x):
+                size = self._pick_batch_size(len(x) - start)
+                chunk = x[start:start + size]
+                used = np.flatnonzero(chunk.any(axis=0))
+                length = self._pick_length(int(used[-1]) + 1 if len(used) else 1)
+                chunk = chunk[:, :length]
+                if chunk.shape != (size, length):
+                    chunk = np.pad(chunk, ((0, size - chunk.shape[0]), (0, length - chunk.shape[1])))
+                result = self._runners[size, length](token=chunk)['probabilitas']
+                end = min(start + size, len(x))
+                output[start:end] = result[:end - start]
+                start = end
+        return output
+
+
+def main():
+    from inference import (
+        TFLITE_BATCH_SIZES, TFLITE_MODEL_PATH, TFLITE_SEQUENCE_LENGTHS, load_keras_model, load_tokenizer,
+    )
+
+    parser = argparse.ArgumentParser(description="Konversi model LSTM Keras ke TFLite terkuantisasi.")
+    parser.add_argument('--kuantisasi', choices=TFLITE_QUANTIZATIONS, default='dynamic')
+    parser.add_argument('--output', default=TFLITE_MODEL_PATH)
+    parser.add_argument('--dataset', default='data/Data_Lengkap_Tokenisasi.csv',
+                        help="Sumber sampel kalibrasi int8 (kolom Tweet_Final).")
+    parser.add_argument('--sampel', type=int, default=300, help="Jumlah sampel kalibrasi int8.")
+    args = parser.parse_args()
+
+    representative_data = None
+    if args.kuantisasi == 'int8':
+        import pandas as pd
+
+        texts = pd.read_csv(args.dataset, usecols=['Tweet_Final'])['Tweet_Final'].dropna().astype(str)
+        texts = texts.sample(min(args.sampel, len(texts)), random_state=42).tolist()
+        representative_data = load_tokenizer('numpy').encode(texts)
+
+    size = convert_model(load_keras_model(), args.output, TFLITE_BATCH_SIZES, TFLITE_SEQUENCE_LENGTHS,
+                         quantization=args.kuantisasi, representative_data=representative_data)
+    print(f"Model TFLite ({args.kuantisasi}) ditulis ke {args.output} ({size / 1024:.1f} KB)")
+
+
+if __name__ == '__main__':
+    main()
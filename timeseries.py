@@ -0,0 +1,196 @@
+"""Kubus jumlah tweet (waktu x label) untuk grafik tren sentimen.
+
+Jumlah tweet disimpan per jam sebagai matriks (jam x label) beserta prefix
+sum-nya. Total di rentang waktu apa pun cukup dihitung dari selisih dua
+baris prefix sum, sehingga kueri harian/mingguan hanya bergantung pada
+jumlah bucket yang diminta, bukan jumlah tweet. Baris baru bisa ditambahkan
+secara bertahap lewat `update` tanpa membangun ulang kubus.
+"""
+import os
+import threading
+
+import numpy as np
+import pandas as pd
+
+# Resolusi yang tersedia -> frekuensi Period pandas
+RESOLUTIONS = {
+    'jam': 'H',
+    'hari': 'D',
+    'minggu': 'W-SUN',  # minggu Senin-Minggu
+}
+
+
+def _hour_index(timestamps):
+    values = pd.to_datetime(pd.Series(timestamps)).to_numpy(dtype='datetime64[ns]')
+    return values.astype('datetime64[h]').astype(np.int64)
+
+
+class SentimentCube:
+    """Matriks jumlah per jam x label dengan prefix sum untuk kueri rentang O(1)."""
+
+    def __init__(self, labels=()):
+        self.labels = list(labels)
+        self.start_hour = None
+        self.counts = np.zeros((0, len(self.labels)), dtype=np.int64)
+        self._prefix = None
+        self._dirty_from = 0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_frame(cls, df, time_col='created_at', label_col='Label_Clean', labels=None):
+        if labels is None and isinstance(df[label_col].dtype, pd.CategoricalDtype):
+            labels = list(df[label_col].cat.categories)
+        cube = cls(labels or [])
+        cube.update(df[time_col], df[label_col])
+        return cube
+
+    # --- pembaruan ------------------------------------------------------------
+    def update(self, timestamps, labels):
+        """Tambahkan baris baru (timestamp, label). Baris tanpa waktu/label diabaikan."""
+        hours = _hour_index(timestamps)
+        labels = pd.Series(labels, dtype=object).reset_index(drop=True)
+        valid = (hours != np.iinfo(np.int64).min) & labels.notna().to_numpy()
+        hours = hours[valid]
+        labels = labels[valid]
+        if len(hours) == 0:
+            return self
+
+        with self._lock:
+            for label in pd.unique(labels):
+                if label not in self.labels:
+                    self.labels.append(label)
+                    self.counts = np.hstack([self.counts, np.zeros((len(self.counts), 1), dtype=np.int64)])
+            codes = pd.Categorical(labels, categories=self.labels).codes
+
+            lo, hi = int(hours.min()), int(hours.max())
+            if self.start_hour is None:
+                self.start_hour = lo
+                self.counts = np.zeros((hi - lo + 1, len(self.labels)), dtype=np.int64)
+                self._dirty_from = 0
+            else:
+                if lo < self.start_hour:
+                    pad = np.zeros((self.start_hour - lo, len(self.labels)), dtype=np.int64)
+                    self.counts = np.vstack([pad, self.counts])
+                    self.start_hour = lo
+                    self._dirty_from = 0
+                end_hour = self.start_hour + len(self.counts)
+                if hi >= end_hour:
+                    pad = np.zeros((hi - end_hour + 1, len(self.labels)), dtype=np.int64)
+                    self.counts = np.vstack([self.counts, pad])
+
+            rows = hours - self.start_hour
+            np.add.at(self.counts, (rows, codes), 1)
+            self._dirty_from = min(self._dirty_from, int(rows.min())) if self._prefix is not None else 0
+        return self
+
+    def _prefix_sum(self):
+        """Prefix sum (n_jam + 1, n_label); hanya bagian yang berubah dihitung ulang."""
+        with self._lock:
+            n = len(self.counts)
+            prefix = self._prefix
+            if prefix is None or prefix.shape != (n + 1, len(self.labels)):
+                prefix = np.zeros((n + 1, len(self.labels)), dtype=np.int64)
+                np.cumsum(self.counts, axis=0, out=prefix[1:])
+            elif self._dirty_from < n:
+                i = self._dirty_from
+                prefix[i + 1:] = prefix[i] + np.cumsum(self.counts[i:], axis=0)
+            self._prefix = prefix
+            self._dirty_from = n
+            return prefix
+
+    # --- kueri ---------------------------------------------------------------
+    @property
+    def time_range(self):
+        """(awal, akhir) data dalam Timestamp, atau None bila kubus kosong."""
+        if self.start_hour is None:
+            return None
+        start = pd.Timestamp(np.datetime64(self.start_hour, 'h'))
+        return start, start + pd.Timedelta(hours=len(self.counts) - 1)
+
+    def _rows(self, timestamps):
+        hours = np.asarray(timestamps, dtype='datetime64[ns]').astype('datetime64[h]').astype(np.int64)
+        return np.clip(hours - self.start_hour, 0, len(self.counts))
+
+    def totals(self, start, end):
+        """Jumlah per label untuk [start, end) sebagai Series."""
+        if self.start_hour is None:
+            return pd.Series(0, index=self.labels, dtype=np.int64)
+        prefix = self._prefix_sum()
+        a, b = self._rows([pd.Timestamp(start), pd.Timestamp(end)])
+        return pd.Series(prefix[b] - prefix[a], index=self.labels)
+
+    def series(self, start, end, resolution='hari'):
+        """Jumlah per bucket x label untuk rentang tanggal [start, end] (inklusif).
+
+        Mengembalikan DataFrame panjang dengan kolom Tanggal, Label, Jumlah.
+        """
+        if resolution not in RESOLUTIONS:
+            raise ValueError(f"Resolusi tidak dikenal: {resolution}")
+
+        start = pd.Timestamp(start)
+        end = pd.Timestamp(end)
+        if end.normalize() == end:
+            # Tanggal akhir tanpa jam berarti seluruh hari itu ikut dihitung
+            end = end + pd.Timedelta(days=1)
+
+        periods = pd.period_range(start, end - pd.Timedelta(hours=1), freq=RESOLUTIONS[resolution])
+        if self.start_hour is None or len(periods) == 0:
+            return pd.DataFrame(columns=['Tanggal', 'Label', 'Jumlah'])
+
+        bucket_start = periods.start_time.to_numpy()
+        lo = np.maximum(bucket_start, start.to_datetime64())
+        hi = np.minimum(periods.end_time.to_numpy() + np.timedelta64(1, 'ns'), end.to_datetime64())
+
+        prefix = self._prefix_sum()
+        jumlah = prefix[self._rows(hi)] - prefix[self._rows(lo)]
+
+        df = pd.DataFrame(jumlah, columns=self.labels)
+        df.insert(0, 'Tanggal', lo)
+        return df.melt(id_vars='Tanggal', var_name='Label', value_name='Jumlah')
+
+    # --- persistensi -----------------------------------------------------------
+    def save(self, path):
+        tmp_path = path + '.tmp.npz'
+        np.savez(tmp_path, counts=self.counts, start_hour=np.int64(self.start_hour or 0),
+                 empty=self.start_hour is None, labels=np.array(self.labels, dtype=object))
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path, allow_pickle=True) as data:
+            cube = cls(data['labels'].tolist())
+            cube.counts = data['counts']
+            cube.start_hour = None if bool(data['empty']) else int(data['start_hour'])
+        return cube
+
+# ==============================================================================
+# KUBUS DATASET PENELITIAN
+# ==============================================================================
+_dataset_cube = {}
+_dataset_lock = threading.Lock()
+
+
+def dataset_cube():
+    """Kubus tren dari dataset penelitian, dibangun sekali per versi dataset.
+
+    Disimpan di folder cache dataset sehingga restart aplikasi tidak perlu
+    membaca ulang kolom `created_at`.
+    """
+    from dataset import get_dataset_cache
+
+    cache = get_dataset_cache()
+    version = cache.version
+    with _dataset_lock:
+        if version not in _dataset_cube:
+            path = os.path.join(cache.cache_dir, f"{cache.prefix}.cube.{version}.npz")
+            try:
+                cube = SentimentCube.load(path)
+            except (OSError, ValueError, KeyError):
+                cube = SentimentCube.from_frame(cache.load(['created_at', 'Label_Clean']))
+                for name in os.listdir(cache.cache_dir):
+                    if name.startswith(f"{cache.prefix}.cube."):
+                        os.remove(os.path.join(cache.cache_dir, name))
+                cube.save(path)
+            _dataset_cube.clear()
+            _dataset_cube[version] = cube
+        return _dataset_cube[version]
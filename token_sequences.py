@@ -0,0 +1,177 @@
+"""Sequence token dataset penelitian sebagai array biner (.npy) yang siap pakai.
+
+Dulu ID token disimpan di CSV sebagai string repr Python (`Detail_Nilai_Token`,
+`Token_Sequence_Padding`) yang membengkakkan file dan harus di-parse ulang
+setiap kali dipakai. Artefak di `data/token_sequences/` menggantikannya:
+
+    sequences.npy : N x MAX_SEQUENCE_LENGTH int32 (padding & truncating 'post')
+    lengths.npy   : N int32, jumlah token bukan-padding per baris
+    row_ids.npy   : N int64, nomor baris dataset (index `select_rows`/`fetch_page`)
+    manifest.json : versi dataset & tokenizer sumber, untuk mendeteksi artefak usang
+
+Pipeline pembuatnya tervektorisasi per kolom: `Tweet_Final` (atau
+`clean_text_series(Teks Tweet)` bila kolom itu kosong) langsung di-encode
+sekaligus oleh `SequenceEncoder` menjadi satu matriks. File dibaca dengan
+`np.load(mmap_mode='r')`, sehingga hanya baris yang dipakai yang dimuat.
+
+Build ulang setiap kali dataset atau tokenizer berubah:
+    python token_sequences.py [--dataset data/Data_Lengkap_Tokenisasi.csv] [--output data/token_sequences]
+"""
+import argparse
+import json
+import os
+import threading
+
+import numpy as np
+
+from dataset import DATASET_PATH, dataset_version, load_dataset
+from perf import timed
+from vocabulary import file_digest
+
+TOKEN_SEQUENCES_DIR = 'data/token_sequences'
+FORMAT_VERSION = 1
+_ARRAYS = ('sequences', 'lengths', 'row_ids')
+
+
+def _tokenizer_signature():
+    """Identitas tokenizer yang dipakai inferensi (sha1 file JSON sumbernya)."""
+    from inference import TOKENIZER_JSON_PATH
+
+    try:
+        return file_digest(TOKENIZER_JSON_PATH)
+    except OSError:
+        return None
+
+
+class TokenSequences:
+    """Sequence token, panjang, dan nomor baris dataset (array biasa atau mmap)."""
+
+    def __init__(self, sequences, lengths, row_ids, manifest, from_artifact=False):
+        self.sequences = sequences
+        self.lengths = lengths
+        self.row_ids = row_ids
+        self.manifest = manifest
+        # False bila di-encode di memori karena artefak di disk tidak ada/usang
+        self.from_artifact = from_artifact
+
+    @classmethod
+    def load(cls, directory=TOKEN_SEQUENCES_DIR):
+        with open(os.path.join(directory, 'manifest.json'), encoding='utf-8') as f:
+            manifest = json.load(f)
+        if manifest.get('format') != FORMAT_VERSION:
+            raise ValueError(f"Format artefak {directory} tidak dikenal")
+        arrays = [np.load(os.path.join(directory, f'{name}.npy'), mmap_mode='r') for name in _ARRAYS]
+        return cls(*arrays, manifest, from_artifact=True)
+
+    def __len__(self):
+        return len(self.row_ids)
+
+    def is_stale(self, path=DATASET_PATH):
+        """True bila dataset atau tokenizer berubah sejak artefak dibuat."""
+        return (self.manifest.get('dataset_version') != dataset_version(path)
+                or self.manifest.get('tokenizer') != _tokenizer_signature())
+
+    def take(self, rows):
+        """(sequences, lengths) untuk nomor baris dataset `rows`."""
+        positions = np.searchsorted(self.row_ids, np.asarray(rows))
+        return np.asarray(self.sequences[positions]), np.asarray(self.lengths[positions])
+
+    def save(self, directory=TOKEN_SEQUENCES_DIR):
+        os.makedirs(directory, exist_ok=True)
+        for name in _ARRAYS:
+            tmp_path = os.path.join(directory, f'{name}.tmp.npy')
+            np.save(tmp_path, getattr(self, name))
+            os.replace(tmp_path, os.path.join(directory, f'{name}.npy'))
+        # Manifest ditulis terakhir: artefak setengah jadi terdeteksi usang
+        tmp_path = os.path.join(directory, 'manifest.json.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.manifest, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, os.path.join(directory, 'manifest.json'))
+
+
+@timed('token_sequences.build')
+def build_token_sequences(encoder, path=DATASET_PATH):
+    """Encode seluruh dataset sekaligus menjadi `TokenSequences` (di memori)."""
+    from inference import MAX_SEQUENCE_LENGTH, clean_text_series
+
+    df = load_dataset(['Teks Tweet', 'Tweet_Final'], path)
+    if 'Tweet_Final' in df.columns:
+        texts = df['Tweet_Final']
+        if 'Teks Tweet' in df.columns and texts.isna().any():
+            missing = texts.isna() & df['Teks Tweet'].notna()
+            texts = texts.where(~missing, clean_text_series(df['Teks Tweet'][missing]))
+    else:
+        texts = clean_text_series(df['Teks Tweet'])
+
+    sequences = encoder.encode(texts.tolist(), maxlen=MAX_SEQUENCE_LENGTH)
+    lengths = np.count_nonzero(sequences, axis=1).astype(np.int32)
+    row_ids = np.arange(len(sequences), dtype=np.int64)
+    manifest = {
+        'format': FORMAT_VERSION,
+        'source': os.path.basename(path),
+        'dataset_version': dataset_version(path),
+        'tokenizer': _tokenizer_signature(),
+        'rows': len(sequences),
+        'maxlen': MAX_SEQUENCE_LENGTH,
+    }
+    return TokenSequences(sequences, lengths, row_ids, manifest)
+
+
+_loaded = {}
+_loaded_lock = threading.Lock()
+_encoders = {}
+_encoders_lock = threading.Lock()
+
+
+def get_token_encoder():
+    """`SequenceEncoder` tokenizer inferensi, sekali per versi tokenizer.
+
+    `load_tokenizer` bisa mengembalikan `Tokenizer` Keras (hanya ada file
+    pickle), jadi selalu dibungkus `get_sequence_encoder`.
+    """
+    key = _tokenizer_signature()
+    with _encoders_lock:
+        if key not in _encoders:
+            from inference import get_sequence_encoder, load_tokenizer
+
+            _encoders.clear()
+            _encoders[key] = get_sequence_encoder(load_tokenizer('numpy'))
+        return _encoders[key]
+
+
+def get_token_sequences(path=DATASET_PATH, directory=TOKEN_SEQUENCES_DIR):
+    """Artefak sequence token untuk dataset saat ini, sekali per versi dataset.
+
+    Artefak di disk dipakai bila masih sesuai; bila tidak ada/usang, sequence
+    di-encode di memori dengan tokenizer inferensi (`from_artifact` = False).
+    """
+    key = (path, directory, dataset_version(path), _tokenizer_signature())
+    with _loaded_lock:
+        if key not in _loaded:
+            try:
+                sequences = TokenSequences.load(directory)
+                if sequences.is_stale(path):
+                    sequences = None
+            except (OSError, ValueError, KeyError):
+                sequences = None
+            if sequences is None:
+                sequences = build_token_sequences(get_token_encoder(), path)
+            _loaded.clear()
+            _loaded[key] = sequences
+        return _loaded[key]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Encode dataset menjadi artefak sequence token (.npy).")
+    parser.add_argument('--dataset', default=DATASET_PATH)
+    parser.add_argument('--output', default=TOKEN_SEQUENCES_DIR)
+    args = parser.parse_args()
+
+    sequences = build_token_sequences(get_token_encoder(), args.dataset)
+    sequences.save(args.output)
+    size = sum(os.path.getsize(os.path.join(args.output, f'{name}.npy')) for name in _ARRAYS)
+    print(f"{len(sequences):,} sequence ditulis ke {args.output} ({size / 1024:.1f} KB)")
+
+
+if __name__ == '__main__':
+    main()
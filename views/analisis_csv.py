@@ -1,17 +1,122 @@
 import streamlit as st
 import pandas as pd
 import plotly.express as px
-import altair as alt 
+import altair as alt
 from wordcloud import WordCloud
 import matplotlib.pyplot as plt
 import numpy as np
+import atexit
+import os
+import shutil
+import tempfile
+import time
 
-from utils import predict_sentiment
+from inference import ResourceLoadError, predict_text_column, predict_csv_stream, update_word_freq
+from word_freq import WordFrequencyAggregator
+from scoring_pool import SCORING_WORKERS, ScoringPool
+from perf import span, timed
 
+KOLOM_WAJIB = "Teks Tweet"
+# File di atas ukuran ini otomatis diproses dengan Mode Streaming
+BATAS_STREAMING_MB = 50
+# File hasil Mode Streaming yang lebih tua dari ini dianggap milik sesi yang ditinggalkan
+UMUR_MAKS_FILE_STREAM_DETIK = 6 * 3600
+
+@st.cache_resource(max_entries=1)
+def get_scoring_pool(workers):
+    # Pool lama ikut dimatikan saat jumlah worker diganti (executor di-GC)
+    return ScoringPool(workers)
+
+@st.cache_resource
+def get_direktori_stream():
+    # Direktori sementara milik proses ini, dihapus seluruhnya saat proses berhenti
+    path = tempfile.mkdtemp(prefix="sentimen_stream_")
+    atexit.register(shutil.rmtree, path, ignore_errors=True)
+    return path
+
+def sapu_file_stream(direktori, umur_maks=UMUR_MAKS_FILE_STREAM_DETIK):
+    # Hapus file hasil sesi lain yang sudah lama ditinggalkan
+    batas = time.time() - umur_maks
+    for nama in os.listdir(direktori):
+        path = os.path.join(direktori, nama)
+        try:
+            if os.path.getmtime(path) < batas:
+                os.remove(path)
+        except OSError:
+            pass
+
+def hapus_file_stream():
+    stream = st.session_state.get('batch_stream')
+    if stream and os.path.exists(stream['path']):
+        os.remove(stream['path'])
+    st.session_state['batch_stream'] = None
+
+def tampilkan_statistik(count_res):
+    warna_map = pd.DataFrame({
+        'Sentimen': ['Positif', 'Netral', 'Negatif'],
+        'Warna': ['#00CC96', '#808495', '#FF4B4B']
+    })
+    chart_data = count_res.merge(warna_map, on='Sentimen')
+
+    col_stat1, col_stat2 = st.columns(2)
+
+    with col_stat1:
+        st.caption("Distribusi Jumlah")
+        c = alt.Chart(chart_data).mark_bar().encode(
+            x=alt.X('Sentimen', sort=['Negatif', 'Netral', 'Positif']),
+            y='Jumlah',
+            color=alt.Color('Sentimen', scale=alt.Scale(domain=['Positif', 'Netral', 'Negatif'], range=['#00CC96', '#808495', '#FF4B4B']), legend=None),
+            tooltip=['Sentimen', 'Jumlah']
+        ).properties(height=350)
+        st.altair_chart(c, use_container_width=True)
+
+    with col_stat2:
+        st.caption("Proporsi Persentase")
+        with span('plotly.pie_sentimen'):
+            fig_pie = px.pie(count_res, names='Sentimen', values='Jumlah', hole=0.4,
+                             color='Sentimen', color_discrete_map={'Negatif':'#FF4B4B', 'Netral':'#808495', 'Positif':'#00CC96'})
+            st.plotly_chart(fig_pie, use_container_width=True)
+
+def tampilkan_wordcloud(wc):
+    wc_array = np.array(wc.to_image())
+
+    fig_wc, ax = plt.subplots(figsize=(10, 5))
+    ax.imshow(wc_array, interpolation='bilinear')
+    ax.axis("off")
+    st.pyplot(fig_wc)
+
+# Pilihan WordCloud -> (nama grup di WordFrequencyAggregator, colormap)
+PILIHAN_WC = {
+    "1. Data Mentah": ("Mentah", "cividis"),
+    "2. Data Bersih (Preprocessed)": ("Bersih", "viridis"),
+    "3. Sentimen NEGATIF": ("Negatif", "Reds"),
+    "4. Sentimen NETRAL": ("Netral", "Greys"),
+    "5. Sentimen POSITIF": ("Positif", "Greens"),
+}
+
+def tampilkan_wordcloud_frekuensi(word_freq, key):
+    # WordCloud langsung dari frekuensi kata yang dihitung saat analisis
+    sent_choice = st.selectbox("Pilih Kategori Teks (Langsung Berubah):", list(PILIHAN_WC), key=key)
+    grup, tema_warna = PILIHAN_WC[sent_choice]
+    freq = word_freq[grup]
+
+    if not freq:
+        st.warning("⚠️ Tidak ada data untuk kategori ini di file Anda.")
+        return
+
+    with st.spinner("Menggambar WordCloud..."):
+        with span('wordcloud'):
+            wc = WordCloud(width=800, height=400, background_color='white', colormap=tema_warna, max_words=100).generate_from_frequencies(freq)
+            tampilkan_wordcloud(wc)
+
+    csv_freq = word_freq.to_frame(grup).to_csv(index=False).encode('utf-8')
+    st.download_button(f"📥 Download Frekuensi Kata (WordFreq_{grup}.csv)", data=csv_freq, file_name=f"WordFreq_{grup}.csv", mime="text/csv", key=f"{key}_download")
+
+@timed('render_analisis_csv')
 def render_analisis_csv(model, tokenizer):
     st.title("📂 Analisis File CSV (Batch)")
     st.markdown("Unggah file data (CSV) yang berisi ribuan komentar, dan biarkan AI menganalisis sentimennya secara massal.")
-    
+
     st.info("💡 **Panduan Upload:** Pastikan file CSV Anda memiliki kolom bernama **Teks Tweet** yang berisi teks/opini. Jika namanya berbeda, mohon ubah terlebih dahulu di Excel.")
 
     # 1. INISIALISASI SESSION STATE
@@ -19,87 +124,143 @@ def render_analisis_csv(model, tokenizer):
         st.session_state['batch_results'] = None
     if 'original_text_col' not in st.session_state:
         st.session_state['original_text_col'] = None
+    if 'batch_stream' not in st.session_state:
+        st.session_state['batch_stream'] = None
+    if 'batch_word_freq' not in st.session_state:
+        st.session_state['batch_word_freq'] = None
 
     # ==============================================================================
     # 2. AREA UPLOAD FILE
     # ==============================================================================
     uploaded_file = st.file_uploader("Upload File CSV di sini:")
-    
+
     if uploaded_file is None:
         st.session_state['batch_results'] = None
         st.session_state['original_text_col'] = None
+        st.session_state['batch_word_freq'] = None
+        hapus_file_stream()
 
     if uploaded_file is not None:
         # --- VALIDASI EKSTENSI (MEMENUHI TEST CASE 2) ---
         if not uploaded_file.name.lower().endswith('.csv'):
             st.error("❌ **Error:** Format file tidak didukung! Sistem hanya dapat memproses file berekstensi **.csv**.")
             return # Menghentikan proses agar tidak lanjut ke bawah
-            
+
+        ukuran_mb = uploaded_file.size / (1024 * 1024)
+        mode_streaming = st.checkbox(
+            "⚡ Mode Streaming (untuk file sangat besar)",
+            value=ukuran_mb > BATAS_STREAMING_MB,
+            help="File dibaca dan dianalisis per potongan (chunk). Hasil langsung ditulis ke file sementara, sehingga pemakaian memori tetap kecil berapa pun ukuran file-nya."
+        )
+
         try:
-            df_upload = pd.read_csv(uploaded_file)
-            
-            # --- VALIDASI 1: Cek apakah file kosong ---
-            if df_upload.empty:
-                st.error("❌ File CSV yang Anda unggah kosong (0 baris). Silakan periksa kembali file Anda.")
-                return
+            if mode_streaming:
+                # Hanya header yang dibaca untuk validasi, isi file diproses per chunk
+                kolom_file = pd.read_csv(uploaded_file, nrows=0).columns
+                uploaded_file.seek(0)
+            else:
+                with span('csv.parse'):
+                    df_upload = pd.read_csv(uploaded_file)
+                kolom_file = df_upload.columns
+
+                # --- VALIDASI 1: Cek apakah file kosong ---
+                if df_upload.empty:
+                    st.error("❌ File CSV yang Anda unggah kosong (0 baris). Silakan periksa kembali file Anda.")
+                    return
 
             # --- VALIDASI 2: VALIDASI KOLOM KETAT (STRICT) ---
-            KOLOM_WAJIB = "Teks Tweet"
-            
             # Cek apakah kolom wajib ada (case-sensitive)
-            if KOLOM_WAJIB not in df_upload.columns:
+            if KOLOM_WAJIB not in kolom_file:
                 st.error(f"❌ **Error Format:** File CSV Anda tidak memiliki kolom bernama **'{KOLOM_WAJIB}'**.")
                 st.warning(f"Perbaiki file Anda: Buka di Excel, ubah nama kolom yang berisi teks opini menjadi '{KOLOM_WAJIB}', simpan kembali sebagai CSV, lalu unggah ulang.")
                 return
 
             st.markdown("---")
             st.subheader("⚙️ Konfigurasi Analisis")
-            
+
             text_col = KOLOM_WAJIB
-            st.success(f"✅ Kolom target **'{text_col}'** ditemukan! Total Data: **{len(df_upload)} baris**.")
+            if mode_streaming:
+                st.success(f"✅ Kolom target **'{text_col}'** ditemukan! Ukuran File: **{ukuran_mb:,.1f} MB** (diproses per chunk).")
+            else:
+                st.success(f"✅ Kolom target **'{text_col}'** ditemukan! Total Data: **{len(df_upload)} baris**.")
+
+            jumlah_cpu = os.cpu_count() or 1
+            jumlah_worker = st.number_input(
+                "Jumlah Proses Worker", min_value=1, max_value=jumlah_cpu, value=min(max(SCORING_WORKERS, 1), jumlah_cpu), step=1,
+                help="Lebih dari 1: data dibagi ke beberapa proses yang masing-masing memuat model sendiri (butuh memori tambahan per proses). Cocok untuk file yang sangat besar."
+            )
 
             if st.button("🚀 Mulai Proses Analisis", type="primary", use_container_width=True):
                 with st.spinner('🤖 AI sedang memproses... Mohon tunggu.'):
-                    # Membersihkan nilai NaN sebelum diproses
-                    df_upload[text_col] = df_upload[text_col].fillna("")
-                    
-                    results_label, results_clean = [], []
                     my_bar = st.progress(0, text="Memproses data...")
-                    total_data = len(df_upload)
-                    error_count = 0
-                    
-                    for i, row in df_upload.iterrows():
-                        teks = str(row[text_col])
-                        
-                        # Lewati jika teks kosong untuk mempercepat
-                        if not teks.strip():
-                            results_label.append("Netral")
-                            results_clean.append("")
+
+                    pool = None
+                    if jumlah_worker > 1:
+                        my_bar.progress(0, text=f"Menyiapkan {jumlah_worker} proses worker...")
+                        pool = get_scoring_pool(int(jumlah_worker))
+                        pool.warm_up()
+
+                    if mode_streaming:
+                        hapus_file_stream()
+                        st.session_state['batch_results'] = None
+
+                        direktori_stream = get_direktori_stream()
+                        sapu_file_stream(direktori_stream)
+                        fd, output_path = tempfile.mkstemp(prefix="Hasil_Analisis_Batch_", suffix=".csv.gz", dir=direktori_stream)
+                        os.close(fd)
+
+                        def update_progress_stream(total_baris):
+                            persen = min(uploaded_file.tell() / max(uploaded_file.size, 1), 1.0)
+                            my_bar.progress(persen, text=f"Selesai: {total_baris:,} baris ({int(persen*100)}% file)")
+
+                        summary = predict_csv_stream(uploaded_file, text_col, model, tokenizer, output_path, progress_callback=update_progress_stream, pool=pool)
+
+                        if summary['total'] == 0:
+                            os.remove(output_path)
+                            st.error("❌ File CSV yang Anda unggah kosong (0 baris). Silakan periksa kembali file Anda.")
+                            return
+
+                        my_bar.progress(1.0, text=f"Selesai: {summary['total']:,} baris (100%)")
+                        st.session_state['batch_stream'] = {'path': output_path, 'summary': summary}
+                        st.session_state['original_text_col'] = text_col
+                        error_count = summary['errors']
+                    else:
+                        hapus_file_stream()
+                        total_data = len(df_upload)
+
+                        def update_progress(selesai, total):
+                            persen = selesai / total
+                            my_bar.progress(persen, text=f"Selesai: {selesai} dari {total} data ({int(persen*100)}%)")
+
+                        # Teks kosong otomatis dilewati (label Netral) tanpa dikirim ke model
+                        if pool is not None:
+                            results_label, results_clean, error_count = pool.predict_text_column(
+                                df_upload[text_col], progress_callback=update_progress
+                            )
                         else:
-                            try:
-                                lbl, conf, _, cln = predict_sentiment(teks, model, tokenizer)
-                                results_label.append(lbl) 
-                                results_clean.append(cln)
-                            except Exception as e:
-                                results_label.append("Error")
-                                results_clean.append("GAGAL DIPROSES")
-                                error_count += 1
-                        
-                        persen = (i + 1) / total_data
-                        my_bar.progress(persen, text=f"Selesai: {i+1} dari {total_data} data ({int(persen*100)}%)")
-                    
-                    # Simpan hasil ke DataFrame
-                    df_upload['Teks_Bersih'] = results_clean
-                    df_upload['Prediksi_Sentimen'] = results_label
-                    
-                    st.session_state['batch_results'] = df_upload
-                    st.session_state['original_text_col'] = text_col 
-                    
+                            results_label, results_clean, error_count = predict_text_column(
+                                df_upload[text_col], model, tokenizer, progress_callback=update_progress
+                            )
+                        my_bar.progress(1.0, text=f"Selesai: {total_data} dari {total_data} data (100%)")
+
+                        # Simpan hasil ke DataFrame
+                        df_upload[text_col] = df_upload[text_col].fillna("")
+                        df_upload['Teks_Bersih'] = results_clean
+                        df_upload['Prediksi_Sentimen'] = results_label
+
+                        st.session_state['batch_results'] = df_upload
+                        st.session_state['batch_word_freq'] = update_word_freq(
+                            WordFrequencyAggregator(), df_upload[text_col], results_clean, results_label
+                        )
+                        st.session_state['original_text_col'] = text_col
+
                     if error_count > 0:
                         st.warning(f"⚠️ Analisis selesai, namun ada **{error_count} baris yang gagal diproses** (ditandai dengan label 'Error').")
                     else:
                         st.success("✅ Semua data berhasil dianalisis tanpa masalah!")
 
+        except ResourceLoadError as e:
+            st.error(str(e))
         except pd.errors.EmptyDataError:
             st.error("❌ **Error:** File CSV kosong atau format rusak.")
         except pd.errors.ParserError:
@@ -114,94 +275,73 @@ def render_analisis_csv(model, tokenizer):
         st.markdown("---")
         df_final = st.session_state['batch_results'].copy()
         df_final.index = range(1, len(df_final) + 1)
-        kolom_asli = st.session_state['original_text_col']
 
         df_final['Prediksi_Sentimen'] = df_final['Prediksi_Sentimen'].astype(str).str.strip().str.title()
-        
+
         tab1, tab2, tab3 = st.tabs(["📋 Tabel Hasil", "📊 Statistik & Grafik", "☁️ WordCloud"])
-        
+
         # --- TAB 1: TABEL HASIL ---
         with tab1:
             st.subheader("📋 Pratinjau Data Hasil Analisis")
             st.dataframe(df_final, use_container_width=True)
-            
+
             st.write("")
             csv = df_final.to_csv(index=False).encode('utf-8')
             st.download_button("📥 Download Hasil Lengkap (CSV)", data=csv, file_name="Hasil_Analisis_Batch.csv", mime="text/csv")
-        
+
         # --- TAB 2: STATISTIK & GRAFIK ---
         with tab2:
             st.subheader("📊 Statistik Sentimen Data Baru")
             count_res = df_final['Prediksi_Sentimen'].value_counts().reset_index()
             count_res.columns = ['Sentimen', 'Jumlah']
-            
-            warna_map = pd.DataFrame({
-                'Sentimen': ['Positif', 'Netral', 'Negatif'],
-                'Warna': ['#00CC96', '#808495', '#FF4B4B']
-            })
-            chart_data = count_res.merge(warna_map, on='Sentimen')
-
-            col_stat1, col_stat2 = st.columns(2)
-            
-            with col_stat1:
-                st.caption("Distribusi Jumlah")
-                c = alt.Chart(chart_data).mark_bar().encode(
-                    x=alt.X('Sentimen', sort=['Negatif', 'Netral', 'Positif']),
-                    y='Jumlah',
-                    color=alt.Color('Sentimen', scale=alt.Scale(domain=['Positif', 'Netral', 'Negatif'], range=['#00CC96', '#808495', '#FF4B4B']), legend=None),
-                    tooltip=['Sentimen', 'Jumlah']
-                ).properties(height=350)
-                st.altair_chart(c, use_container_width=True)
-                
-            with col_stat2:
-                st.caption("Proporsi Persentase")
-                fig_pie = px.pie(count_res, names='Sentimen', values='Jumlah', hole=0.4, 
-                                 color='Sentimen', color_discrete_map={'Negatif':'#FF4B4B', 'Netral':'#808495', 'Positif':'#00CC96'})
-                st.plotly_chart(fig_pie, use_container_width=True)
+            tampilkan_statistik(count_res)
 
         # --- TAB 3: WORDCLOUD ---
         with tab3:
             st.subheader("☁️ WordCloud: Representasi Visual Teks")
-            
-            pilihan_wc = [
-                "1. Data Mentah", 
-                "2. Data Bersih (Preprocessed)", 
-                "3. Sentimen NEGATIF", 
-                "4. Sentimen NETRAL", 
-                "5. Sentimen POSITIF"
-            ]
-            sent_choice = st.selectbox("Pilih Kategori Teks (Langsung Berubah):", pilihan_wc)
-
-            filter_sentimen = df_final['Prediksi_Sentimen'].str.lower()
-            text_wc = ""
-            tema_warna = 'viridis'
-
-            if "Mentah" in sent_choice:
-                text_wc = " ".join(df_final[kolom_asli].astype(str))
-                tema_warna = "cividis" 
-            elif "Bersih" in sent_choice:
-                text_wc = " ".join(df_final['Teks_Bersih'].astype(str))
-                tema_warna = "viridis" 
-            elif "NEGATIF" in sent_choice:
-                text_wc = " ".join(df_final[filter_sentimen == 'negatif']['Teks_Bersih'].astype(str))
-                tema_warna = "Reds" 
-            elif "NETRAL" in sent_choice:
-                text_wc = " ".join(df_final[filter_sentimen == 'netral']['Teks_Bersih'].astype(str))
-                tema_warna = "Greys" 
-            elif "POSITIF" in sent_choice:
-                text_wc = " ".join(df_final[filter_sentimen == 'positif']['Teks_Bersih'].astype(str))
-                tema_warna = "Greens" 
-            
-            # TAMPILKAN WORDCLOUD
-            if not text_wc.strip():
-                st.warning("⚠️ Tidak ada data untuk kategori ini di file Anda.")
+
+            tampilkan_wordcloud_frekuensi(st.session_state['batch_word_freq'], key="wc_batch")
+
+    # ==============================================================================
+    # 4. AREA HASIL MODE STREAMING (HANYA AGREGAT DI MEMORI)
+    # ==============================================================================
+    elif st.session_state['batch_stream'] is not None:
+        st.markdown("---")
+        stream = st.session_state['batch_stream']
+        summary = stream['summary']
+
+        tab1, tab2, tab3 = st.tabs(["📋 Tabel Hasil", "📊 Statistik & Grafik", "☁️ WordCloud"])
+
+        # --- TAB 1: PRATINJAU & DOWNLOAD ---
+        with tab1:
+            st.subheader("📋 Pratinjau Data Hasil Analisis")
+            st.caption(f"Menampilkan {len(summary['preview']):,} baris pertama dari total **{summary['total']:,} baris**. Hasil lengkap tersedia pada file unduhan (CSV terkompresi gzip).")
+            df_preview = summary['preview'].copy()
+            df_preview.index = range(1, len(df_preview) + 1)
+            st.dataframe(df_preview, use_container_width=True)
+
+            st.write("")
+            if os.path.exists(stream['path']):
+                # st.download_button membaca seluruh file ke memori (MediaFileManager) setiap
+                # kali dirender, jadi file hasil baru dimuat setelah diminta dan hanya untuk
+                # render itu saja; rerun berikutnya tidak menahannya lagi di RAM.
+                ukuran_hasil_mb = os.path.getsize(stream['path']) / (1024 * 1024)
+                if st.button(f"📦 Siapkan Unduhan ({ukuran_hasil_mb:,.1f} MB)", key="siapkan_unduhan_stream"):
+                    with open(stream['path'], 'rb') as f:
+                        st.download_button("📥 Download Hasil Lengkap (CSV.GZ)", data=f.read(), file_name="Hasil_Analisis_Batch.csv.gz", mime="application/gzip")
+                    st.caption("Tombol unduhan hanya berlaku sekali. Klik **Siapkan Unduhan** lagi bila perlu mengunduh ulang.")
+                st.caption("Untuk file berukuran sangat besar, skor langsung dari terminal tanpa melewati browser: `python cli.py data.csv --format csv.gz`.")
             else:
-                with st.spinner("Menggambar WordCloud..."):
-                    wc = WordCloud(width=800, height=400, background_color='white', colormap=tema_warna, max_words=100).generate(text_wc)
-                    wc_image = wc.to_image() 
-                    wc_array = np.array(wc_image)
-                    
-                    fig_wc, ax = plt.subplots(figsize=(10, 5))
-                    ax.imshow(wc_array, interpolation='bilinear')
-                    ax.axis("off")
-                    st.pyplot(fig_wc)
\ No newline at end of file
+                st.warning("⚠️ File hasil sementara sudah tidak tersedia. Silakan proses ulang file Anda.")
+
+        # --- TAB 2: STATISTIK DARI AGREGAT ---
+        with tab2:
+            st.subheader("📊 Statistik Sentimen Data Baru")
+            count_res = pd.DataFrame(list(summary['label_counts'].items()), columns=['Sentimen', 'Jumlah'])
+            tampilkan_statistik(count_res)
+
+        # --- TAB 3: WORDCLOUD DARI FREKUENSI KATA ---
+        with tab3:
+            st.subheader("☁️ WordCloud: Representasi Visual Teks")
+
+            tampilkan_wordcloud_frekuensi(summary['word_freq'], key="wc_stream")
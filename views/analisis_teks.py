@@ -1,24 +1,25 @@
 import streamlit as st
-import pandas as pd
 from datetime import datetime
-import json
-import os
+import math
+from concurrent.futures import TimeoutError as FutureTimeoutError
 
-from utils import predict_sentiment 
+from history_store import HistoryStore
+from micro_batcher import get_micro_batcher
+from perf import timed
 
-HISTORY_FILE = 'data/riwayat_analisis.json'
+BARIS_PER_HALAMAN = 50
+# Batas tunggu hasil micro-batcher agar halaman tidak menggantung bila thread-nya macet
+BATAS_TUNGGU_PREDIKSI_DETIK = 30
 
-def load_history():
-    if os.path.exists(HISTORY_FILE):
-        with open(HISTORY_FILE, 'r', encoding='utf-8') as f:
-            try: return json.load(f)
-            except: return []
-    return []
+@st.cache_resource
+def get_history_store():
+    # Satu objek untuk semua sesi; SQLite (WAL) menangani penulisan bersamaan
+    return HistoryStore()
 
-def save_history(data):
-    os.makedirs('data', exist_ok=True)
-    with open(HISTORY_FILE, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=4)
+@st.cache_data(max_entries=8)
+def export_history_csv(revisi, q):
+    # `revisi` hanya kunci cache: CSV dibuat ulang hanya bila isi riwayat berubah
+    return get_history_store().to_dataframe(q).drop(columns=['ID']).to_csv(index=False).encode('utf-8')
 
 # ==============================================================================
 # Fungsi Clear sekarang menghapus Teks DAN Hasil Prediksi
@@ -30,13 +31,14 @@ def clear_input():
 # ==============================================================================
 # RENDER HALAMAN UTAMA
 # ==============================================================================
+@timed('render_analisis_teks')
 def render_analisis_teks(model, tokenizer):
     st.title("💬 Analisis Sentimen (Single Text)")
     st.markdown("Ketikkan kalimat opini terkait kebijakan efisiensi anggaran pendidikan, dan biarkan AI memprediksi sentimennya secara *real-time*.")
 
+    history_store = get_history_store()
+
     # 1. INISIALISASI SESSION STATE
-    if 'history_analisis' not in st.session_state:
-        st.session_state['history_analisis'] = load_history()
     if 'latest_result' not in st.session_state:
         st.session_state['latest_result'] = None
     if 'show_confirm' not in st.session_state:
@@ -72,8 +74,17 @@ def render_analisis_teks(model, tokenizer):
 
     if btn_analisis:
         if input_text.strip():
+            # Request dari semua sesi digabung menjadi batch oleh satu thread per model (micro_batcher.py)
+            batcher = get_micro_batcher(model, tokenizer)
+            if batcher is None:
+                st.error("❌ Model belum tersedia, prediksi tidak dapat dilakukan.")
+                return
             with st.spinner('🤖 Model LSTM sedang memproses teks...'):
-                label, confidence, probs, clean_txt = predict_sentiment(input_text, model, tokenizer)
+                try:
+                    label, confidence, probs, clean_txt = batcher.predict(input_text, timeout=BATAS_TUNGGU_PREDIKSI_DETIK)
+                except FutureTimeoutError:
+                    st.error(f"❌ Model tidak merespons dalam {BATAS_TUNGGU_PREDIKSI_DETIK} detik. Silakan coba lagi.")
+                    return
                 
                 probabilitas_bersih = [float(p) for p in probs]
 
@@ -92,8 +103,7 @@ def render_analisis_teks(model, tokenizer):
                     "Label": label,
                     "Keyakinan (%)": round(confidence, 2)
                 }
-                st.session_state['history_analisis'].append(new_entry)
-                save_history(st.session_state['history_analisis'])
+                history_store.add(new_entry)
         else:
             st.warning("⚠️ Mohon masukkan teks terlebih dahulu.")
 
@@ -135,24 +145,27 @@ def render_analisis_teks(model, tokenizer):
     # ==============================================================================
     st.subheader("📚 Riwayat Analisis")
 
-    if len(st.session_state['history_analisis']) > 0:
-        # 1. Siapkan Data
-        df_history = pd.DataFrame(st.session_state['history_analisis'])
-        df_display = df_history.iloc[::-1].reset_index(drop=True) 
-        
-        if 'Pilih' not in df_display.columns:
-            df_display.insert(0, "Pilih", False)
-
-        # 2. Filter & Select All
+    if history_store.count() > 0:
+        # 1. Filter & Select All
         c_search, c_all = st.columns([3, 1])
         with c_search:
             q = st.text_input("Cari:", placeholder="Filter riwayat...", label_visibility="collapsed")
         with c_all:
-            if st.checkbox("Pilih Semua"):
-                df_display['Pilih'] = True
+            pilih_semua = st.checkbox("Pilih Semua")
 
-        if q:
-            df_display = df_display[df_display['Teks Asli'].str.contains(q, case=False, na=False)]
+        # 2. Siapkan Data (hanya satu halaman yang dibaca dari database)
+        total_data = history_store.count(q)
+        total_halaman = max(1, math.ceil(total_data / BARIS_PER_HALAMAN))
+
+        c_nav, c_stat = st.columns([1, 3])
+        with c_nav:
+            halaman = st.number_input("Halaman", min_value=1, max_value=total_halaman, step=1)
+        with c_stat:
+            st.write("")
+            st.caption(f"Menampilkan **{total_data}** Data (Halaman {halaman} dari {total_halaman})")
+
+        df_display = history_store.page((halaman - 1) * BARIS_PER_HALAMAN, BARIS_PER_HALAMAN, q)
+        df_display.insert(0, "Pilih", pilih_semua)
 
         # 3. Tabel Editor
         with st.container():
@@ -160,6 +173,7 @@ def render_analisis_teks(model, tokenizer):
                 df_display,
                 column_config={
                     "Pilih": st.column_config.CheckboxColumn("Hapus?", width="small", default=False),
+                    "ID": None,
                     "Waktu": st.column_config.TextColumn("Waktu", disabled=True),
                     "Teks Asli": st.column_config.TextColumn("Teks Tweet", disabled=True),
                     "Label": st.column_config.TextColumn("Prediksi", disabled=True),
@@ -167,7 +181,7 @@ def render_analisis_teks(model, tokenizer):
                 },
                 hide_index=True,
                 use_container_width=True,
-                key="history_editor"
+                key=f"history_editor_{halaman}_{q}"
             )
 
         # 4. Tombol Aksi (LAYOUT BARU)
@@ -181,7 +195,7 @@ def render_analisis_teks(model, tokenizer):
 
         with col_del_1:
             if st.button(f"🗑️ Hapus ({count}) Item", type="primary", disabled=count==0, use_container_width=True):
-                st.session_state['rows_to_delete'] = selected_rows['Waktu'].tolist()
+                st.session_state['rows_to_delete'] = selected_rows['ID'].tolist()
                 st.session_state['show_confirm'] = True
 
         with col_del_2:
@@ -192,7 +206,7 @@ def render_analisis_teks(model, tokenizer):
         # --- BARIS 2: TOMBOL DOWNLOAD (Hijau/Standar - Di Bawah) ---
         st.write("") 
         
-        csv_data = df_display.drop(columns=['Pilih']).to_csv(index=False).encode('utf-8')
+        csv_data = export_history_csv(history_store.revision(), q)
         st.download_button(
             label="📥 Download CSV (Backup Data Riwayat)", 
             data=csv_data, 
@@ -214,15 +228,10 @@ def render_analisis_teks(model, tokenizer):
                     with col_yes:
                         if st.button("✅ Ya, Hapus"):
                             if st.session_state['rows_to_delete'] == "ALL":
-                                st.session_state['history_analisis'] = []
+                                history_store.clear()
                             else:
-                                targets = st.session_state['rows_to_delete']
-                                st.session_state['history_analisis'] = [
-                                    item for item in st.session_state['history_analisis'] 
-                                    if item['Waktu'] not in targets
-                                ]
-                            
-                            save_history(st.session_state['history_analisis'])
+                                history_store.delete(st.session_state['rows_to_delete'])
+
                             st.session_state['show_confirm'] = False
                             st.session_state['rows_to_delete'] = []
                             st.success("Berhasil dihapus!")
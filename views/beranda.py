@@ -1,7 +1,10 @@
 import streamlit as st
-import pandas as pd
 import os
 
+from dataset import load_table
+from perf import timed
+
+@timed('render_beranda')
 def render_beranda():
     st.title("🎓 Selamat Datang di Sistem Analisis Sentimen")
     st.markdown("### Kebijakan Efisiensi Anggaran Pendidikan (2025)")
@@ -14,7 +17,7 @@ def render_beranda():
     # ==============================================================================
     # 1. Akurasi Testing 
     try:
-        df_perf = pd.read_csv('model/Tabel_Performa_LSTM.csv', index_col=0)
+        df_perf = load_table('model/Tabel_Performa_LSTM.csv', index_col=0)
         akurasi_testing = round(df_perf.loc['accuracy', 'f1-score'] * 100, 2)
     except:
         akurasi_testing = 0.0 
@@ -0,0 +1,78 @@
+import streamlit as st
+import pandas as pd
+import plotly.express as px
+
+import perf
+from inference import get_prediction_cache
+from micro_batcher import get_micro_batcher
+
+# ==============================================================================
+# HALAMAN ADMIN: PERFORMA (hanya muncul di menu bila SENTIMEN_PERF=1)
+# ==============================================================================
+def render_performa(resource_loader):
+    st.title("⏱️ Performa Dashboard")
+    st.markdown("Statistik durasi setiap span instrumentasi (`perf.py`) sejak proses dimulai atau sejak terakhir di-reset. Angka berlaku untuk semua sesi user.")
+
+    col_status, col_reset = st.columns([4, 1])
+    with col_status:
+        # Hanya status: instrumentasi diatur per proses lewat SENTIMEN_PERF, bukan dari UI
+        if perf.is_enabled():
+            st.success("Instrumentasi aktif (SENTIMEN_PERF=1).")
+        else:
+            st.warning("Instrumentasi nonaktif. Jalankan ulang dengan SENTIMEN_PERF=1.")
+    with col_reset:
+        if st.button("🔄 Reset Statistik", use_container_width=True):
+            perf.reset()
+
+    # --- 1. TABEL SPAN ---
+    snapshot = perf.snapshot()
+    if not snapshot:
+        st.info("Belum ada span yang tercatat. Buka halaman lain terlebih dahulu.")
+    else:
+        df_span = pd.DataFrame.from_dict(snapshot, orient='index').rename_axis('Span').reset_index()
+        df_span = df_span.sort_values('total_s', ascending=False)
+
+        st.subheader("📋 Ringkasan per Span")
+        st.dataframe(
+            df_span.style.format({'total_s': '{:.3f}', 'mean_ms': '{:.2f}', 'p50_ms': '{:.2f}', 'p90_ms': '{:.2f}', 'p99_ms': '{:.2f}', 'max_ms': '{:.2f}'}),
+            use_container_width=True, hide_index=True
+        )
+
+        fig = px.bar(
+            df_span.melt(id_vars='Span', value_vars=['p50_ms', 'p99_ms'], var_name='Persentil', value_name='Durasi (ms)'),
+            x='Durasi (ms)', y='Span', color='Persentil', barmode='group', orientation='h',
+            title="Latensi p50 & p99 per Span"
+        )
+        fig.update_layout(height=max(300, 40 * len(df_span)), yaxis_title=None, yaxis={'categoryorder': 'total ascending'})
+        st.plotly_chart(fig, use_container_width=True)
+
+        col_json, col_prom = st.columns(2)
+        with col_json:
+            st.download_button("📥 Export JSON", data=perf.to_json(), file_name="performa_span.json", mime="application/json", use_container_width=True)
+        with col_prom:
+            st.download_button("📥 Export Prometheus", data=perf.to_prometheus(), file_name="performa_span.prom", mime="text/plain", use_container_width=True)
+
+    # --- 2. CACHE PREDIKSI & MICRO-BATCHER ---
+    st.subheader("🧠 Cache Prediksi & Micro-Batcher")
+    if resource_loader.state != 'ready':
+        st.info("Model belum dimuat, statistik inferensi belum tersedia.")
+        return
+
+    cache_stats = get_prediction_cache(resource_loader.model).stats()
+    c1, c2, c3 = st.columns(3)
+    c1.metric("Isi Cache Prediksi", f"{cache_stats['size']:,} / {cache_stats['maxsize']:,}")
+    c2.metric("Hit Rate", f"{cache_stats['hit_rate'] * 100:.1f}%")
+    c3.metric("Hit / Miss", f"{cache_stats['hits']:,} / {cache_stats['misses']:,}")
+
+    # Hanya membaca batcher yang sudah ada: halaman ini tidak boleh memulai thread baru
+    batcher = get_micro_batcher(resource_loader.model, resource_loader.tokenizer, create=False)
+    if batcher is None:
+        st.info("Micro-batcher belum aktif. Statistik muncul setelah ada request di halaman Analisis Teks.")
+        return
+
+    batch_stats = batcher.stats()
+    b1, b2, b3, b4 = st.columns(4)
+    b1.metric("Request Analisis Teks", f"{batch_stats['requests']:,}")
+    b2.metric("Rata-rata Ukuran Batch", f"{batch_stats['mean_batch_size']:.1f}")
+    b3.metric("Latensi p50", f"{batch_stats['p50_ms']:.1f} ms")
+    b4.metric("Latensi p99", f"{batch_stats['p99_ms']:.1f} ms")
@@ -2,26 +2,103 @@ import streamlit as st
 import pandas as pd
 import numpy as np
 import os
-import hashlib
 from sklearn.model_selection import train_test_split
 import graphviz
 import plotly.express as px
 import plotly.graph_objects as go
 from sklearn.metrics import confusion_matrix
 
-@st.cache_data
-def load_data(file_path):
+from dataset import LABEL_CATEGORIES, count_rows, dataset_columns, load_dataset, load_table
+from search_index import BANTUAN_CARI
+from token_sequences import get_token_encoder, get_token_sequences
+from perf import timed
+from views.tabel_data import render_tabel_dataset
+
+KOLOM_PREPROCESSING = ['Teks Tweet', 'Tweet_CaseFolded', 'Tweet_Cleaned', 'Tweet_Tokenized', 'Tweet_Normalized', 'Tweet_Final']
+
+def load_data(columns=None):
+    # Hanya kolom yang dibutuhkan tiap tahapan yang dibaca dari cache kolumnar
     try:
-        return pd.read_csv(file_path)
-    except:
+        return load_dataset(columns)
+    except Exception:
         return pd.DataFrame()
 
+def kolom_dataset():
+    try:
+        return dataset_columns()
+    except Exception:
+        return []
+
+# ==============================================================================
+# GRAFIK PLOTLY (durasi tiap jenis grafik dicatat perf.py)
+# ==============================================================================
+@timed('plotly.confusion_matrix')
+def buat_confusion_matrix(cm, labels):
+    fig_cm = px.imshow(cm, text_auto=True, labels=dict(x="Prediksi Model", y="Label Aktual (Asli)", color="Jumlah Data"), x=labels, y=labels, color_continuous_scale='Blues')
+    fig_cm.update_layout(title="Matrix Kebenaran Prediksi P5")
+    return fig_cm
+
+@timed('plotly.akurasi_skenario')
+def buat_akurasi_skenario(df_acc_skenario, rata_rata):
+    fig_bar = px.bar(
+        df_acc_skenario, x='Label_X', y='Akurasi', 
+        text='Akurasi', 
+        color='Skenario',
+        color_discrete_sequence=px.colors.qualitative.Set1,
+        title="Persentase Akurasi per Skenario Data Latih",
+        labels={'Label_X': 'Skenario (Porsi Data Latih)', 'Akurasi': 'Akurasi (%)'}
+    )
+    fig_bar.update_traces(texttemplate='%{text:.2f}%', textposition='outside')
+    fig_bar.add_hline(y=rata_rata, line_dash="dot", line_color="red", annotation_text=f"Rata-rata: {rata_rata:.2f}%")
+    fig_bar.update_layout(yaxis_range=[0, 100], showlegend=False)
+    return fig_bar
+
+@timed('plotly.riwayat_akurasi')
+def buat_riwayat_akurasi(df_hist_filter, skenario_pilihan):
+    fig_acc_line = go.Figure()
+    fig_acc_line.add_trace(go.Scatter(x=df_hist_filter['Epoch'], y=df_hist_filter['accuracy'], mode='lines+markers', name='Train Acc'))
+    fig_acc_line.add_trace(go.Scatter(x=df_hist_filter['Epoch'], y=df_hist_filter['val_accuracy'], mode='lines+markers', name='Val Acc'))
+    fig_acc_line.update_layout(title=f"Akurasi ({skenario_pilihan})", xaxis_title="Epochs", yaxis_title="Akurasi", hovermode="x unified")
+    return fig_acc_line
+
+@timed('plotly.riwayat_loss')
+def buat_riwayat_loss(df_hist_filter, skenario_pilihan):
+    fig_loss_line = go.Figure()
+    fig_loss_line.add_trace(go.Scatter(x=df_hist_filter['Epoch'], y=df_hist_filter['loss'], mode='lines+markers', name='Train Loss', line=dict(color='orange')))
+    fig_loss_line.add_trace(go.Scatter(x=df_hist_filter['Epoch'], y=df_hist_filter['val_loss'], mode='lines+markers', name='Val Loss', line=dict(color='red')))
+    fig_loss_line.update_layout(title=f"Loss ({skenario_pilihan})", xaxis_title="Epochs", yaxis_title="Loss", hovermode="x unified")
+    return fig_loss_line
+
+@timed('plotly.coherence')
+def buat_coherence(df_coh):
+    fig_coh = px.line(df_coh, x='Num_Topics', y='Coherence_Score', markers=True,
+                      title="Pergerakan Nilai Coherence Score",
+                      labels={'Num_Topics': 'Jumlah Topik', 'Coherence_Score': 'Skor Koherensi (c_v)'})
+    
+    max_score = df_coh['Coherence_Score'].max()
+    best_topic_num = df_coh.loc[df_coh['Coherence_Score'].idxmax(), 'Num_Topics']
+    
+    fig_coh.add_annotation(x=best_topic_num, y=max_score,
+                           text=f"Optimal: {int(best_topic_num)} Topik",
+                           showarrow=True, arrowhead=1)
+    return fig_coh
+
+@timed('plotly.topik_lda')
+def buat_topik_lda(df_chart, topik_ke, sentimen):
+    fig = px.bar(
+        df_chart, x='Bobot', y='Kata', orientation='h',
+        title=f"<b>Topik {topik_ke}</b>",
+        color='Bobot',
+        color_continuous_scale='Reds' if sentimen == 'negatif' else 'Greys' if sentimen == 'netral' else 'Greens'
+    )
+    # Sembunyikan X-axis karena ini hanya bobot representasi urutan
+    fig.update_layout(height=280, showlegend=False, xaxis_title=None, xaxis_visible=False)
+    return fig
+
+@timed('render_proses_data')
 def render_proses_data():
     st.title("⚙️ Tahapan Proses Data & Modeling")
     st.markdown("Berikut adalah dokumentasi teknis alur pengolahan data dari mentah hingga evaluasi model, disertai penjelasan metodologi.")
-    
-    # LOAD DATA
-    df_mentah = load_data('data/Data_Lengkap_Tokenisasi.csv') 
 
     # ==============================================================================
     # NAVIGASI 
@@ -45,10 +122,13 @@ def render_proses_data():
     
     # --- 1. CRAWLING DATA ---
     if pilihan == "1. Crawling Data":
+        ada_data = 'Teks Tweet' in kolom_dataset()
+        total_data = count_rows(None) if ada_data else 0
+
         st.header("1. Pengumpulan Data (Crawling)")
         st.info("Tools: **Tweet-Harvest (Node.js)** API Scraper")
         
-        st.success(f"✅ Total Data Terkumpul: **{len(df_mentah):,} Data** (Setelah Deduplikasi)")
+        st.success(f"✅ Total Data Terkumpul: **{total_data:,} Data** (Setelah Deduplikasi)")
         st.warning("⚠️ **Catatan Imbalance:** Distribusi sentimen awal tidak seimbang, ditangani dengan ROS (Random Over Sampling) pada tahap Training.")
 
         st.markdown("### 📋 Kriteria Pengambilan Data")
@@ -77,18 +157,13 @@ def render_proses_data():
         """)
 
         st.markdown("### 🔍 Preview Data Mentah")
-        if not df_mentah.empty:
-            search_mentah = st.text_input("Cari kata dalam Tweet (Mentah):", placeholder="Contoh: dana bos", key="cari_mentah")
-            
-            if search_mentah:
-                df_tampil = df_mentah[df_mentah['Teks Tweet'].str.contains(search_mentah, case=False, na=False)].copy()
-            else:
-                df_tampil = df_mentah.copy()
-            
-            df_tampil = df_tampil[['created_at', 'username', 'Teks Tweet']].rename(columns={'created_at': 'Created At', 'username': 'Username'})
-            df_tampil.index = range(1, len(df_tampil) + 1)
-            
-            st.dataframe(df_tampil, use_container_width=True, height=250)
+        if ada_data:
+            search_mentah = st.text_input("Cari kata dalam Tweet (Mentah):", placeholder="Contoh: dana bos", key="cari_mentah", help=BANTUAN_CARI)
+            render_tabel_dataset(
+                "mentah", ['created_at', 'username', 'Teks Tweet'],
+                rename={'created_at': 'Created At', 'username': 'Username'},
+                search=search_mentah, height=250,
+            )
 
     # --- 2. PREPROCESSING ---
     elif pilihan == "2. Preprocessing":
@@ -111,19 +186,10 @@ def render_proses_data():
             """)
 
         st.subheader("🔍 Komparasi Sebelum vs Sesudah")
-        if not df_mentah.empty:
-            search_pre = st.text_input("Cari kata (Hasil Akhir):", placeholder="Contoh: guru", key="cari_pre")
-            
-            cols = ['Teks Tweet', 'Tweet_CaseFolded', 'Tweet_Cleaned', 'Tweet_Tokenized', 'Tweet_Normalized', 'Tweet_Final']
-            
-            cols_exist = [c for c in cols if c in df_mentah.columns]
-            df_tampil_pre = df_mentah[cols_exist].copy()
-
-            if search_pre:
-                df_tampil_pre = df_tampil_pre[df_tampil_pre['Tweet_Final'].str.contains(search_pre, case=False, na=False)]
-
-            df_tampil_pre.index = range(1, len(df_tampil_pre) + 1)
-            st.dataframe(df_tampil_pre, use_container_width=True, height=400)
+        cols_exist = [c for c in KOLOM_PREPROCESSING if c in kolom_dataset()]
+        if 'Tweet_Final' in cols_exist:
+            search_pre = st.text_input("Cari kata (Hasil Akhir):", placeholder="Contoh: guru", key="cari_pre", help=BANTUAN_CARI)
+            render_tabel_dataset("preprocessing", cols_exist, search=search_pre, search_field='Tweet_Final', height=400)
         else:
             st.warning("Data preprocessing belum tersedia.")
 
@@ -139,16 +205,37 @@ def render_proses_data():
         st.subheader("A. Tokenization & Padding")
         st.write("Setiap kata unik dalam dataset diberi ID angka. Karena panjang tweet berbeda-beda, kita lakukan **Padding (Post)** agar semua input memiliki panjang seragam (**100 kata**). Angka 0 di akhir akan diabaikan oleh fitur *Masking* pada model.")
 
-        if not df_mentah.empty and 'Label' in df_mentah.columns:
-            df_token = df_mentah.dropna(subset=['Label']).copy()
-            
-            # Helper simulasi token
-            def get_word_id(word): return int(hashlib.md5(word.encode()).hexdigest(), 16) % 3000 + 1
-            
-            df_token['Detail Token'] = df_token['Tweet_Final'].apply(lambda t: ", ".join([f"{w}:{get_word_id(w)}" for w in str(t).split()[:10]]))
-            df_token['Padding Sequence (100)'] = df_token['Tweet_Final'].apply(lambda t: str(([get_word_id(w) for w in str(t).split()] + [0]*100)[:20]) + " ...")
-            
-            st.dataframe(df_token[['Tweet_Final', 'Detail Token', 'Padding Sequence (100)']], use_container_width=True)
+        df_label = load_data(['Label'])
+        if not df_label.empty and 'Tweet_Final' in kolom_dataset():
+            df_label = df_label.dropna(subset=['Label'])
+
+            # ID token asli dari artefak data/token_sequences (lihat token_sequences.py)
+            try:
+                sequences = get_token_sequences()
+            except Exception as e:
+                sequences = None
+                st.error(f"Gagal memuat sequence token: {e}")
+            if sequences is not None and not sequences.from_artifact:
+                st.info("ℹ️ Artefak `data/token_sequences` belum ada/usang, sequence di-encode ulang di memori. "
+                        "Build ulang dengan `python token_sequences.py`.")
+
+            # Kolom turunan hanya diambil untuk baris di halaman yang tampil
+            def tambah_kolom_token(df_page):
+                if sequences is None:
+                    return df_page
+                seq, panjang = sequences.take(df_page.index.to_numpy())
+                # Pasangan kata:ID dari tokenisasi encoder sendiri (bukan split spasi),
+                # agar tetap sejajar saat filter memecah kata atau num_words membuangnya
+                encoder = get_token_encoder()
+                df_page['Detail Token'] = [
+                    ", ".join(f"{w}:{i}" for w, i in encoder.word_ids(t, maxlen=10))
+                    for t in df_page['Tweet_Final']
+                ]
+                df_page['Jumlah Token'] = panjang
+                df_page['Padding Sequence (100)'] = [str(ids[:20].tolist()) + " ..." for ids in seq]
+                return df_page
+
+            render_tabel_dataset("token", ['Tweet_Final'], filters={'Label_Clean': LABEL_CATEGORIES}, transform=tambah_kolom_token)
 
             st.markdown("---")
             st.subheader("B. Splitting 80:20 & Skenario 5 Percobaan")
@@ -161,7 +248,7 @@ def render_proses_data():
             Kami menduplikasi data minoritas (Positif/Netral) secara acak (*Random Over Sampling*) di **setiap porsi data latih** hingga jumlahnya setara dengan kelas mayoritas (Negatif). Data Testing (20%) dibiarkan murni agar evaluasi tetap objektif.
             """)
 
-            df_train, df_test = train_test_split(df_token, test_size=0.2, random_state=42, stratify=df_token['Label'])
+            df_train, df_test = train_test_split(df_label, test_size=0.2, random_state=42, stratify=df_label['Label'])
             kelas_mayoritas = df_train['Label'].value_counts().max()
             
             col_metric1, col_metric2, col_metric3 = st.columns(3)
@@ -242,7 +329,7 @@ def render_proses_data():
             if not os.path.exists(path_perf): path_perf = 'Tabel_Performa_LSTM.csv'
 
             if os.path.exists(path_perf):
-                df_perf = pd.read_csv(path_perf, index_col=0)
+                df_perf = load_table(path_perf, index_col=0)
                 st.table(
                     df_perf.style.highlight_max(axis=0, props='background-color: #FFEB3B; color: black; font-weight: bold')
                 )
@@ -256,12 +343,11 @@ def render_proses_data():
             st.subheader("2. Confusion Matrix (Model P5)")
             path_cm = 'model/Data_Confusion_Matrix.csv' 
             if os.path.exists(path_cm):
-                df_cm_data = pd.read_csv(path_cm)
+                df_cm_data = load_table(path_cm)
                 if 'y_true' in df_cm_data.columns and 'y_pred' in df_cm_data.columns:
                     labels = ['Negatif', 'Netral', 'Positif'] 
                     cm = confusion_matrix(df_cm_data['y_true'], df_cm_data['y_pred'])
-                    fig_cm = px.imshow(cm, text_auto=True, labels=dict(x="Prediksi Model", y="Label Aktual (Asli)", color="Jumlah Data"), x=labels, y=labels, color_continuous_scale='Blues')
-                    fig_cm.update_layout(title="Matrix Kebenaran Prediksi P5")
+                    fig_cm = buat_confusion_matrix(cm, labels)
                     st.plotly_chart(fig_cm, use_container_width=True)
             else:
                 st.warning("⚠️ File 'Data_Confusion_Matrix.csv' tidak ditemukan.")
@@ -273,24 +359,13 @@ def render_proses_data():
             
             path_akurasi = 'model/Akurasi_Skenario.csv'
             if os.path.exists(path_akurasi):
-                df_acc_skenario = pd.read_csv(path_akurasi)
+                df_acc_skenario = load_table(path_akurasi)
                 rata_rata = df_acc_skenario['Akurasi'].mean()
                 
                 # Buat label gabungan P1 (20%), dst
                 df_acc_skenario['Label_X'] = df_acc_skenario['Skenario'] + " (" + df_acc_skenario['Porsi_Data'] + ")"
                 
-                fig_bar = px.bar(
-                    df_acc_skenario, x='Label_X', y='Akurasi', 
-                    text='Akurasi', 
-                    color='Skenario',
-                    color_discrete_sequence=px.colors.qualitative.Set1,
-                    title="Persentase Akurasi per Skenario Data Latih",
-                    labels={'Label_X': 'Skenario (Porsi Data Latih)', 'Akurasi': 'Akurasi (%)'}
-                )
-                
-                fig_bar.update_traces(texttemplate='%{text:.2f}%', textposition='outside')
-                fig_bar.add_hline(y=rata_rata, line_dash="dot", line_color="red", annotation_text=f"Rata-rata: {rata_rata:.2f}%")
-                fig_bar.update_layout(yaxis_range=[0, 100], showlegend=False)
+                fig_bar = buat_akurasi_skenario(df_acc_skenario, rata_rata)
                 
                 st.plotly_chart(fig_bar, use_container_width=True)
             else:
@@ -303,7 +378,7 @@ def render_proses_data():
             
             path_hist_semua = 'model/Riwayat_Training_Semua.csv'
             if os.path.exists(path_hist_semua):
-                df_all_hist = pd.read_csv(path_hist_semua)
+                df_all_hist = load_table(path_hist_semua)
                 
                 # Opsi interaktif untuk memilih Skenario
                 skenario_pilihan = st.selectbox("Pilih Skenario:", ['P1', 'P2', 'P3', 'P4', 'P5'], index=4)
@@ -314,17 +389,11 @@ def render_proses_data():
                 col_chart1, col_chart2 = st.columns(2)
                 
                 with col_chart1:
-                    fig_acc_line = go.Figure()
-                    fig_acc_line.add_trace(go.Scatter(x=df_hist_filter['Epoch'], y=df_hist_filter['accuracy'], mode='lines+markers', name='Train Acc'))
-                    fig_acc_line.add_trace(go.Scatter(x=df_hist_filter['Epoch'], y=df_hist_filter['val_accuracy'], mode='lines+markers', name='Val Acc'))
-                    fig_acc_line.update_layout(title=f"Akurasi ({skenario_pilihan})", xaxis_title="Epochs", yaxis_title="Akurasi", hovermode="x unified")
+                    fig_acc_line = buat_riwayat_akurasi(df_hist_filter, skenario_pilihan)
                     st.plotly_chart(fig_acc_line, use_container_width=True)
                 
                 with col_chart2:
-                    fig_loss_line = go.Figure()
-                    fig_loss_line.add_trace(go.Scatter(x=df_hist_filter['Epoch'], y=df_hist_filter['loss'], mode='lines+markers', name='Train Loss', line=dict(color='orange')))
-                    fig_loss_line.add_trace(go.Scatter(x=df_hist_filter['Epoch'], y=df_hist_filter['val_loss'], mode='lines+markers', name='Val Loss', line=dict(color='red')))
-                    fig_loss_line.update_layout(title=f"Loss ({skenario_pilihan})", xaxis_title="Epochs", yaxis_title="Loss", hovermode="x unified")
+                    fig_loss_line = buat_riwayat_loss(df_hist_filter, skenario_pilihan)
                     st.plotly_chart(fig_loss_line, use_container_width=True)
             else:
                 st.warning("⚠️ File 'Riwayat_Training_Semua.csv' belum tersedia. Harap export dari Colab.")
@@ -349,19 +418,10 @@ def render_proses_data():
             if not os.path.exists(path_coherence): path_coherence = 'Nilai_Coherence.csv'
 
             if os.path.exists(path_coherence):
-                df_coh = pd.read_csv(path_coherence)
+                df_coh = load_table(path_coherence)
                 
                 # Plot Line Chart
-                fig_coh = px.line(df_coh, x='Num_Topics', y='Coherence_Score', markers=True,
-                                  title="Pergerakan Nilai Coherence Score",
-                                  labels={'Num_Topics': 'Jumlah Topik', 'Coherence_Score': 'Skor Koherensi (c_v)'})
-                
-                max_score = df_coh['Coherence_Score'].max()
-                best_topic_num = df_coh.loc[df_coh['Coherence_Score'].idxmax(), 'Num_Topics']
-                
-                fig_coh.add_annotation(x=best_topic_num, y=max_score,
-                                       text=f"Optimal: {int(best_topic_num)} Topik",
-                                       showarrow=True, arrowhead=1)
+                fig_coh = buat_coherence(df_coh)
                 
                 st.plotly_chart(fig_coh, use_container_width=True)
             else:
@@ -386,7 +446,7 @@ def render_proses_data():
 
         if os.path.exists(path_lda):
             try:
-                df_lda = pd.read_csv(path_lda)
+                df_lda = load_table(path_lda)
                 
                 # Fungsi Parsing Teks dari format CSV
                 def parse_lda_string(text_data):
@@ -425,14 +485,7 @@ def render_proses_data():
                                 df_chart = parse_lda_string(row['Kata Kunci'])
                                 
                                 if not df_chart.empty:
-                                    fig = px.bar(
-                                        df_chart, x='Bobot', y='Kata', orientation='h',
-                                        title=f"<b>Topik {topik_ke}</b>",
-                                        color='Bobot',
-                                        color_continuous_scale='Reds' if sentimen == 'negatif' else 'Greys' if sentimen == 'netral' else 'Greens'
-                                    )
-                                    # Sembunyikan X-axis karena ini hanya bobot representasi urutan
-                                    fig.update_layout(height=280, showlegend=False, xaxis_title=None, xaxis_visible=False)
+                                    fig = buat_topik_lda(df_chart, topik_ke, sentimen)
                                     
                                     if idx % 2 == 0:
                                         with col_t1: st.plotly_chart(fig, use_container_width=True)
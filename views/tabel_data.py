@@ -0,0 +1,57 @@
+import streamlit as st
+
+from dataset import count_rows, fetch_page, page_count, select_rows
+from perf import timed
+
+# ==============================================================================
+# TABEL DATASET BERHALAMAN (dipakai Visualisasi & Proses Data)
+# ==============================================================================
+# Filter, pencarian & urutan dikerjakan di dataset.py pada nomor baris; yang
+# dikirim ke st.dataframe hanya satu halaman dari kolom yang ditampilkan.
+
+@timed('render_tabel_dataset')
+def render_tabel_dataset(key, kolom, rename=None, filters=None, search=None, search_field='Teks Tweet',
+                         pilihan_urut=None, baris_per_halaman=20, transform=None, height=None):
+    """Tampilkan tabel dataset berhalaman.
+
+    - `kolom`       : kolom dataset yang ditampilkan;
+    - `rename`      : {kolom: judul kolom di tabel};
+    - `pilihan_urut`: {judul pilihan: kolom} untuk menu "Urutkan";
+    - `transform`   : fungsi opsional untuk menambah kolom turunan pada halaman.
+    """
+    sort_by, ascending = None, True
+    if pilihan_urut:
+        c_urut, c_arah = st.columns([2, 1])
+        with c_urut:
+            urut = st.selectbox("Urutkan:", ["Urutan Asli"] + list(pilihan_urut), key=f"{key}_urut")
+        with c_arah:
+            st.write("")
+            menurun = st.checkbox("Menurun", key=f"{key}_menurun")
+        if urut != "Urutan Asli":
+            sort_by, ascending = pilihan_urut[urut], not menurun
+
+    rows = select_rows(filters, search, search_field, sort_by, ascending)
+    total_data = count_rows(rows)
+    if total_data == 0:
+        st.warning("Data tidak ditemukan.")
+        return
+
+    total_halaman = page_count(total_data, baris_per_halaman)
+    c_nav, c_stat = st.columns([1, 3])
+    with c_nav:
+        # Key ikut jumlah halaman agar pilihan halaman kembali ke 1 bila hasil menyusut
+        halaman = st.number_input("Halaman", min_value=1, max_value=total_halaman, step=1,
+                                  key=f"{key}_halaman_{total_halaman}")
+    with c_stat:
+        st.write("")
+        st.caption(f"Menampilkan **{total_data}** Data (Halaman {halaman} dari {total_halaman})")
+
+    df_page = fetch_page(kolom, rows, halaman, baris_per_halaman)
+    if transform is not None:
+        df_page = transform(df_page)
+    if rename:
+        df_page = df_page.rename(columns=rename)
+
+    awal = (halaman - 1) * baris_per_halaman
+    df_page.index = range(awal + 1, awal + len(df_page) + 1)
+    st.dataframe(df_page, use_container_width=True, height=height)
@@ -1,12 +1,80 @@
 import streamlit as st
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
 import plotly.express as px  
-from wordcloud import WordCloud
 import os
-import math
 
+from dataset import DATASET_PATH, dataset_columns, dataset_version, load_dataset, load_table
+from wordcloud_cache import get_wordcloud_cache
+from word_freq import dataset_word_freq
+from timeseries import dataset_cube
+from search_index import BANTUAN_CARI
+from perf import timed
+from views.tabel_data import render_tabel_dataset
+
+PILIHAN_RESOLUSI = {"Per Jam": 'jam', "Harian": 'hari', "Mingguan": 'minggu'}
+
+# ==============================================================================
+# GRAFIK PLOTLY (durasi tiap jenis grafik dicatat perf.py)
+# ==============================================================================
+@timed('plotly.pie_sentimen')
+def buat_pie_sentimen(df_pie):
+    fig_pie = px.pie(
+        df_pie, 
+        names='Sentimen', 
+        values='Jumlah', 
+        hole=0.4, 
+        color='Sentimen',
+        color_discrete_map={'negatif':'#FF4B4B', 'netral':'#808495', 'positif':'#00CC96'},
+        title="Persentase Sentimen"
+    )
+    fig_pie.update_layout(showlegend=True, legend=dict(orientation="h", yanchor="bottom", y=-0.3, xanchor="center", x=0.5))
+    return fig_pie
+
+@timed('plotly.tren_sentimen')
+def buat_tren_sentimen(df_trend, judul):
+    fig_trend = px.line(
+        df_trend, 
+        x='Tanggal', 
+        y='Jumlah', 
+        color='Label', 
+        markers=True,
+        color_discrete_map={
+            'negatif':'#FF4B4B', 'netral':'#808495', 'positif':'#00CC96', 
+            'Negatif':'#FF4B4B', 'Netral':'#808495', 'Positif':'#00CC96', 
+            'negative':'#FF4B4B', 'neutral':'#808495', 'positive':'#00CC96' 
+        },
+        title=judul
+    )
+    fig_trend.update_layout(xaxis_title="Tanggal", yaxis_title="Jumlah Tweet", hovermode="x unified", legend=dict(orientation="h", y=1.1))
+    return fig_trend
+
+@timed('plotly.topik_lda')
+def buat_topik_lda(df_chart, topik_ke, sentimen):
+    fig = px.bar(
+        df_chart, x='Bobot', y='Kata', orientation='h',
+        title=f"<b>Topik {topik_ke}</b>",
+        color='Bobot',
+        color_continuous_scale='Reds' if sentimen == 'negatif' else 'Greys' if sentimen == 'netral' else 'Greens'
+    )
+    fig.update_layout(height=300, showlegend=False, xaxis_title=None, xaxis_visible=False)
+    return fig
+
+@timed('plotly.confusion_matrix')
+def buat_confusion_matrix(cm, labels):
+    fig_cm = px.imshow(
+        cm, 
+        text_auto=True, 
+        labels=dict(x="Prediksi Model", y="Label Aktual (Asli)", color="Jumlah Data"),
+        x=labels, 
+        y=labels,
+        color_continuous_scale='Blues',
+        aspect="auto"
+    )
+    fig_cm.update_layout(title="Confusion Matrix Heatmap")
+    return fig_cm
+
+@timed('render_visualisasi')
 def render_visualisasi():
     st.title("📈 Dashboard Visualisasi Data")
     st.markdown("Analisis visual interaktif terhadap data opini publik terkait kebijakan anggaran pendidikan.")
@@ -14,26 +82,21 @@ def render_visualisasi():
     # ==============================================================================
     # 1. LOAD DATA UTAMA
     # ==============================================================================
-    file_path = 'data/Data_Lengkap_Tokenisasi.csv'
-    
-    if not os.path.exists(file_path):
-        st.error(f"❌ File dataset tidak ditemukan di: {file_path}")
+    # Load Data (cache kolumnar bersama, lihat dataset.py). Tabel, tren, dan
+    # WordCloud membaca datanya sendiri; di sini cukup kolom label.
+    try:
+        kolom_tersedia = dataset_columns()
+    except FileNotFoundError:
+        st.error(f"❌ File dataset tidak ditemukan di: {DATASET_PATH}")
         return
 
-    # Load Data
-    df = pd.read_csv(file_path)
-
-    if 'Label' in df.columns:
-        df['Label_Clean'] = df['Label'].astype(str).str.lower().str.strip()
-    else:
+    if 'Label_Clean' not in kolom_tersedia:
         st.error("❌ Kolom 'Label' tidak ditemukan dalam CSV.")
         return
 
-    if 'created_at' in df.columns:
-        df['Tanggal'] = pd.to_datetime(df['created_at']).dt.date
-    elif 'Tanggal' in df.columns:
-        df['Tanggal'] = pd.to_datetime(df['Tanggal']).dt.date
-    else:
+    df = load_dataset(['Label_Clean'])
+
+    if 'created_at' not in kolom_tersedia:
         st.warning("⚠️ Kolom tanggal tidak ditemukan. Grafik tren waktu mungkin tidak muncul.")
 
     # ==============================================================================
@@ -48,49 +111,34 @@ def render_visualisasi():
         df_pie = df['Label_Clean'].value_counts().reset_index()
         df_pie.columns = ['Sentimen', 'Jumlah']
         
-        fig_pie = px.pie(
-            df_pie, 
-            names='Sentimen', 
-            values='Jumlah', 
-            hole=0.4, 
-            color='Sentimen',
-            color_discrete_map={'negatif':'#FF4B4B', 'netral':'#808495', 'positif':'#00CC96'},
-            title="Persentase Sentimen"
-        )
-        fig_pie.update_layout(showlegend=True, legend=dict(orientation="h", yanchor="bottom", y=-0.3, xanchor="center", x=0.5))
+        fig_pie = buat_pie_sentimen(df_pie)
         st.plotly_chart(fig_pie, use_container_width=True)
 
     # --- B. TREN WAKTU ---
+    # Jumlah per jam x label sudah di-agregasi di kubus (timeseries.py), sehingga
+    # kueri rentang tanggal tidak lagi memindai seluruh tweet.
     with col_bar:
-        if 'Tanggal' in df.columns:
-            start_date = pd.to_datetime("2025-02-01").date()
-            end_date = pd.to_datetime("2025-03-31").date()
-            
-            df_filtered = df[
-                (df['Tanggal'] >= start_date) & 
-                (df['Tanggal'] <= end_date)
-            ]
-         
-            kolom_label = 'Label' if 'Label' in df_filtered.columns else 'Label_Clean'
-            
-            df_trend = df_filtered.groupby(['Tanggal', kolom_label]).size().reset_index(name='Jumlah')
-            
-            fig_trend = px.line(
-                df_trend, 
-                x='Tanggal', 
-                y='Jumlah', 
-                color=kolom_label, 
-                markers=True,
-                color_discrete_map={
-                    'negatif':'#FF4B4B', 'netral':'#808495', 'positif':'#00CC96', 
-                    'Negatif':'#FF4B4B', 'Netral':'#808495', 'Positif':'#00CC96', 
-                    'negative':'#FF4B4B', 'neutral':'#808495', 'positive':'#00CC96' 
-                },
-                title="Tren Sentimen Harian (Feb - Mar 2025)"
-            )
+        cube = dataset_cube() if 'created_at' in kolom_tersedia else None
+        rentang_data = cube.time_range if cube is not None else None
+
+        if rentang_data is not None:
+            data_awal, data_akhir = rentang_data[0].date(), rentang_data[1].date()
+            # Default: periode crawling penelitian (Feb - Mar 2025)
+            default_awal = min(max(pd.Timestamp("2025-02-01").date(), data_awal), data_akhir)
+            default_akhir = max(min(pd.Timestamp("2025-03-31").date(), data_akhir), default_awal)
+
+            c_rentang, c_resolusi = st.columns([2, 1])
+            with c_rentang:
+                rentang = st.date_input("Rentang Tanggal:", value=(default_awal, default_akhir), min_value=data_awal, max_value=data_akhir)
+            with c_resolusi:
+                resolusi = st.selectbox("Granularitas:", list(PILIHAN_RESOLUSI), index=1)
+
+            # date_input mengembalikan 1 tanggal saat user baru memilih awal rentang
+            start_date, end_date = (rentang[0], rentang[-1]) if isinstance(rentang, (list, tuple)) else (rentang, rentang)
+
+            df_trend = cube.series(start_date, end_date, PILIHAN_RESOLUSI[resolusi])
             
-            fig_trend.update_xaxes(range=[start_date, end_date])
-            fig_trend.update_layout(xaxis_title="Tanggal", yaxis_title="Jumlah Tweet", hovermode="x unified", legend=dict(orientation="h", y=1.1))
+            fig_trend = buat_tren_sentimen(df_trend, f"Tren Sentimen {resolusi} ({start_date:%d %b %Y} - {end_date:%d %b %Y})")
             
             st.plotly_chart(fig_trend, use_container_width=True)
         else:
@@ -102,43 +150,27 @@ def render_visualisasi():
     st.subheader("☁️ WordCloud: Representasi Visual Teks")
     st.write("Kata-kata yang paling sering muncul dalam setiap kategori.")
 
-    # 1. Fungsi Asli untuk generate dari Teks (Data Mentah & Bersih)
-    def generate_wc(text, colormap):
-        if not isinstance(text, str) or not text.strip():
-            st.warning("⚠️ Tidak ada data teks yang cukup.")
-            return
-        
+    wc_cache = get_wordcloud_cache()
+
+    # Frekuensi kata dihitung sekali per versi dataset (word_freq.py), lalu
+    # PNG hasil render disimpan di cache disk (wordcloud_cache.py).
+    # collocations=True sama dengan WordCloud.generate (bigram seperti "dana BOS").
+    def generate_wc(grup, colormap, collocations=True):
+        def gambar(wc):
+            freq = dataset_word_freq().frequencies(grup, collocations=collocations)
+            if not freq:
+                raise ValueError("Tidak ada data teks yang cukup.")
+            wc.generate_from_frequencies(freq)
+
         with st.spinner("Sedang menggambar WordCloud..."):
             try:
-                wc = WordCloud(width=800, height=400, background_color='white', colormap=colormap, max_words=100).generate(text)
-                fig, ax = plt.subplots(figsize=(10, 5))
-                ax.imshow(wc, interpolation='bilinear')
-                ax.axis("off")
-                st.pyplot(fig)
+                png = wc_cache.render(dataset_version(), f"wordcloud-freq:{grup}:{collocations}", gambar, colormap)
+                st.image(png, use_column_width=True)
+            except ValueError:
+                st.warning("⚠️ Tidak ada data teks yang cukup.")
             except Exception as e:
                 st.error(f"Error WordCloud: {e}")
 
-    # 2. FUNGSI BARU: Generate WordCloud langsung dari CSV Frekuensi agar instan
-    def generate_wc_from_freq(file_path, colormap):
-        if os.path.exists(file_path):
-            try:
-                df_freq = pd.read_csv(file_path)
-                # Mengubah format DataFrame menjadi Dictionary (Syarat mutlak WordCloud)
-                freq_dict = dict(zip(df_freq['Word'], df_freq['Frequency']))
-                
-                with st.spinner("Merender WordCloud instan dari CSV..."):
-                    wc = WordCloud(width=800, height=400, background_color='white', colormap=colormap, max_words=100)
-                    wc.generate_from_frequencies(freq_dict)
-                    
-                    fig, ax = plt.subplots(figsize=(10, 5))
-                    ax.imshow(wc, interpolation='bilinear')
-                    ax.axis("off")
-                    st.pyplot(fig)
-            except Exception as e:
-                st.error(f"Error memproses file CSV WordFreq: {e}")
-        else:
-            st.warning(f"⚠️ File frekuensi belum tersedia: {file_path}")
-
     # Tabs Navigasi WordCloud
     tab_mentah, tab_bersih, tab_neg, tab_net, tab_pos = st.tabs([
         "Data Mentah", "Data Bersih", "Negatif", "Netral", "Positif"
@@ -146,27 +178,27 @@ def render_visualisasi():
 
     with tab_mentah:
         st.caption("Data dari kolom 'Teks Tweet' (Original)")
-        generate_wc(" ".join(df['Teks Tweet'].dropna().astype(str)), 'cividis')
+        generate_wc('Mentah', 'cividis')
 
     with tab_bersih:
         st.caption("Data dari kolom 'Tweet_Final' (Preprocessed)")
-        if 'Tweet_Final' in df.columns:
-            generate_wc(" ".join(df['Tweet_Final'].dropna().astype(str)), 'viridis')
+        if 'Tweet_Final' in kolom_tersedia:
+            generate_wc('Bersih', 'viridis')
         else: 
             st.warning("Kolom Tweet_Final tidak ada.")
 
-    # MENGGUNAKAN FILE CSV WORDFREQ DI SINI
+    # Frekuensi per sentimen dari kolom Tweet_Final tanpa kolokasi (sama dengan isi model/WordFreq_*.csv)
     with tab_neg:
-        st.caption("Kata dominan sentimen NEGATIF (Sumber: WordFreq_Negatif.csv)")
-        generate_wc_from_freq('model/WordFreq_Negatif.csv', 'Reds')
+        st.caption("Kata dominan sentimen NEGATIF (Sumber: kolom 'Tweet_Final')")
+        generate_wc('Negatif', 'Reds', collocations=False)
 
     with tab_net:
-        st.caption("Kata dominan sentimen NETRAL (Sumber: WordFreq_Netral.csv)")
-        generate_wc_from_freq('model/WordFreq_Netral.csv', 'Greys')
+        st.caption("Kata dominan sentimen NETRAL (Sumber: kolom 'Tweet_Final')")
+        generate_wc('Netral', 'Greys', collocations=False)
 
     with tab_pos:
-        st.caption("Kata dominan sentimen POSITIF (Sumber: WordFreq_Positif.csv)")
-        generate_wc_from_freq('model/WordFreq_Positif.csv', 'Greens')
+        st.caption("Kata dominan sentimen POSITIF (Sumber: kolom 'Tweet_Final')")
+        generate_wc('Positif', 'Greens', collocations=False)
 
     st.markdown("---")
 
@@ -181,7 +213,7 @@ def render_visualisasi():
 
     if os.path.exists(path_lda):
         try:
-            df_lda = pd.read_csv(path_lda)
+            df_lda = load_table(path_lda)
             
             def parse_lda_string(text_data):
                 data_items = []
@@ -211,13 +243,7 @@ def render_visualisasi():
                             df_chart = parse_lda_string(row['Kata Kunci'])
                             
                             if not df_chart.empty:
-                                fig = px.bar(
-                                    df_chart, x='Bobot', y='Kata', orientation='h',
-                                    title=f"<b>Topik {topik_ke}</b>",
-                                    color='Bobot',
-                                    color_continuous_scale='Reds' if sentimen == 'negatif' else 'Greys' if sentimen == 'netral' else 'Greens'
-                                )
-                                fig.update_layout(height=300, showlegend=False, xaxis_title=None, xaxis_visible=False)
+                                fig = buat_topik_lda(df_chart, topik_ke, sentimen)
                                 st.plotly_chart(fig, use_container_width=True)
                                 st.divider()
         except Exception as e:
@@ -236,41 +262,17 @@ def render_visualisasi():
     with tab_data:
         col_f1, col_f2 = st.columns([1, 2])
         with col_f1: filter_label = st.selectbox("Filter Sentimen:", ['Semua', 'negatif', 'netral', 'positif'])
-        with col_f2: search_keyword = st.text_input("Cari Tweet:", "")
-
-        cols_available = [c for c in ['created_at', 'username', 'Teks Tweet', 'Label_Clean'] if c in df.columns]
-        df_show = df[cols_available].copy()
-        
-        rename_map = {'created_at': 'Tanggal', 'username': 'Username', 'Label_Clean': 'Label'}
-        df_show = df_show.rename(columns=rename_map)
-
-        if filter_label != 'Semua' and 'Label' in df_show.columns:
-            df_show = df_show[df_show['Label'] == filter_label]
-        
-        if search_keyword and 'Teks Tweet' in df_show.columns:
-            df_show = df_show[df_show['Teks Tweet'].str.contains(search_keyword, case=False, na=False)]
-
-        df_show.index = range(1, len(df_show) + 1)
-        
-        baris_per_halaman = 20
-        total_data = len(df_show)
-        total_halaman = math.ceil(total_data / baris_per_halaman)
-
-        if total_data > 0:
-            c_nav, c_stat = st.columns([1, 3])
-            with c_nav:
-                halaman = st.number_input("Halaman", min_value=1, max_value=max(1, total_halaman), step=1)
-            with c_stat:
-                st.write("") 
-                st.caption(f"Menampilkan **{total_data}** Data (Halaman {halaman} dari {total_halaman})")
-
-            start_idx = (halaman - 1) * baris_per_halaman
-            end_idx = start_idx + baris_per_halaman
-            df_page = df_show.iloc[start_idx:end_idx]
-
-            st.dataframe(df_page, use_container_width=True)
-        else:
-            st.warning("Data tidak ditemukan.")
+        with col_f2: search_keyword = st.text_input("Cari Tweet:", "", help=BANTUAN_CARI)
+
+        # Filter, pencarian (indeks terbalik) & halaman dikerjakan di dataset.py
+        cols_available = [c for c in ['created_at', 'username', 'Teks Tweet', 'Label_Clean'] if c in kolom_tersedia]
+        render_tabel_dataset(
+            "explorer", cols_available,
+            rename={'created_at': 'Tanggal', 'username': 'Username', 'Label_Clean': 'Label'},
+            filters={'Label_Clean': filter_label} if filter_label != 'Semua' else None,
+            search=search_keyword,
+            pilihan_urut={"Tanggal": 'created_at', "Username": 'username'},
+        )
 
     # --- TAB 2: TABEL EVALUASI & CONFUSION MATRIX ---
     with tab_eval:
@@ -287,7 +289,7 @@ def render_visualisasi():
 
         if os.path.exists(path_perf):
             try:
-                df_perf = pd.read_csv(path_perf, index_col=0)
+                df_perf = load_table(path_perf, index_col=0)
                 st.table(
                     df_perf.style.highlight_max(axis=0, props='background-color: #FFEB3B; color: black; font-weight: bold')
                 )
@@ -306,7 +308,7 @@ def render_visualisasi():
 
         if os.path.exists(path_cm):
             try:
-                df_cm_data = pd.read_csv(path_cm)
+                df_cm_data = load_table(path_cm)
                 
                 if 'y_true' in df_cm_data.columns and 'y_pred' in df_cm_data.columns:
                     from sklearn.metrics import confusion_matrix
@@ -314,16 +316,7 @@ def render_visualisasi():
                     labels = ['Negatif', 'Netral', 'Positif'] 
                     cm = confusion_matrix(df_cm_data['y_true'], df_cm_data['y_pred'])
                     
-                    fig_cm = px.imshow(
-                        cm, 
-                        text_auto=True, 
-                        labels=dict(x="Prediksi Model", y="Label Aktual (Asli)", color="Jumlah Data"),
-                        x=labels, 
-                        y=labels,
-                        color_continuous_scale='Blues',
-                        aspect="auto"
-                    )
-                    fig_cm.update_layout(title="Confusion Matrix Heatmap")
+                    fig_cm = buat_confusion_matrix(cm, labels)
                     st.plotly_chart(fig_cm, use_container_width=True)
                     
                     total_benar = np.trace(cm)
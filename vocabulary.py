@@ -0,0 +1,191 @@
+"""Kosakata tokenizer dalam format biner ringkas yang dibaca lewat `mmap`.
+
+`model/tokenizer_sentiment.json` berisi string JSON di dalam JSON, lengkap
+dengan `word_counts`, `word_docs`, dll. untuk setiap kata yang pernah dilihat,
+padahal inferensi hanya butuh `num_words` entri teratas dari `word_index`.
+Langkah build di modul ini mengompilasi tokenizer menjadi satu file:
+
+    magic 'SVOCAB01' | panjang header (uint32) | header JSON | padding
+    kunci : n x S<lebar>  (UTF-8, terurut byte, untuk np.searchsorted)
+    id    : n x int32     (ID token sesuai urutan kunci)
+
+Header menyimpan konfigurasi tokenizer (num_words, oov_token, filters, lower,
+split), kata yang lebih panjang dari `lebar` (hanya segelintir kata), serta
+sha1 tokenizer JSON sumber untuk mendeteksi file yang usang.
+Saat runtime file dibuka dengan `mmap` read-only, sehingga halaman memorinya
+berbagi page cache yang sama antar proses (worker `scoring_pool`, dsb.).
+
+Build ulang setiap kali tokenizer berubah:
+    python vocabulary.py [--json model/tokenizer_sentiment.json] [--output model/tokenizer_sentiment.vocab]
+"""
+import argparse
+import hashlib
+import json
+import mmap
+import os
+import struct
+import threading
+
+import numpy as np
+
+VOCAB_MAGIC = b'SVOCAB01'
+# Lebar kunci tetap dipilih agar mencakup 99.9% kata (maksimum 32 byte); kata
+# yang lebih panjang (biasanya sambungan kata/URL rusak) disimpan di header
+VOCAB_KEY_COVERAGE = 0.999
+VOCAB_MAX_KEY_WIDTH = 32
+_ALIGN = 8
+
+
+_digests = {}
+_digests_lock = threading.Lock()
+
+
+def file_digest(path):
+    """sha1 isi file; dihitung ulang hanya bila ukuran/mtime file berubah."""
+    info = os.stat(path)
+    signature = (info.st_size, info.st_mtime_ns)
+    with _digests_lock:
+        cached = _digests.get(path)
+        if cached is None or cached[0] != signature:
+            digest = hashlib.sha1()
+            with open(path, 'rb') as f:
+                # Dibaca per blok agar file besar (mis. model .h5) tidak dimuat utuh
+                for block in iter(lambda: f.read(1 << 20), b''):
+                    digest.update(block)
+            cached = (signature, digest.hexdigest())
+            _digests[path] = cached
+        return cached[1]
+
+
+def read_tokenizer_config(path):
+    """Konfigurasi tokenizer Keras dari file JSON (menangani JSON ter-encode dua kali)."""
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    if isinstance(data, str):
+        data = json.loads(data)
+    config = dict(data.get('config', data))
+    if isinstance(config.get('word_index'), str):
+        config['word_index'] = json.loads(config['word_index'])
+    return config
+
+
+def compile_vocabulary(json_path, output_path, default_filters):
+    """Tulis kosakata biner dari tokenizer JSON; kembalikan jumlah kata yang disimpan."""
+    config = read_tokenizer_config(json_path)
+    num_words = config.get('num_words')
+    # Hanya kata yang benar-benar bisa dipakai model (ID < num_words)
+    entries = sorted(
+        (word.encode('utf-8'), idx) for word, idx in config['word_index'].items()
+        if not num_words or idx < num_words
+    )
+    lengths = sorted(len(w) for w, _ in entries) or [1]
+    width = max(1, min(VOCAB_MAX_KEY_WIDTH, lengths[int((len(lengths) - 1) * VOCAB_KEY_COVERAGE)]))
+    overflow = {w.decode('utf-8'): idx for w, idx in entries if len(w) > width}
+    entries = [(w, idx) for w, idx in entries if len(w) <= width]
+
+    header = json.dumps({
+        'count': len(entries),
+        'width': width,
+        'num_words': num_words,
+        'oov_token': config.get('oov_token'),
+        'filters': config.get('filters', default_filters),
+        'lower': config.get('lower', True),
+        'split': config.get('split', ' '),
+        'overflow': overflow,
+        'source_sha1': file_digest(json_path),
+    }, ensure_ascii=False).encode('utf-8')
+
+    keys = np.array([w for w, _ in entries], dtype=f'S{width}')
+    ids = np.array([idx for _, idx in entries], dtype='<i4')
+
+    prefix = VOCAB_MAGIC + struct.pack('<I', len(header)) + header
+    prefix += b'\x00' * (-len(prefix) % _ALIGN)
+    key_bytes = keys.tobytes()
+    key_bytes += b'\x00' * (-len(key_bytes) % _ALIGN)
+
+    tmp_path = output_path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(prefix)
+        f.write(key_bytes)
+        f.write(ids.tobytes())
+    os.replace(tmp_path, output_path)
+    return len(entries) + len(overflow)
+
+
+class MappedVocabulary:
+    """Kosakata biner yang dibaca lewat mmap, bersifat seperti `word_index` read-only.
+
+    Membuka file hanya membaca header; tabel kunci & ID tetap berada di page
+    cache bersama. `get(kata)` mencari langsung di tabel, sedangkan
+    `to_dict()` dipakai `SequenceEncoder` untuk lookup cepat saat encode.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._mmap[:len(VOCAB_MAGIC)] != VOCAB_MAGIC:
+            raise ValueError(f"{path} bukan file kosakata biner")
+
+        offset = len(VOCAB_MAGIC)
+        (header_len,) = struct.unpack_from('<I', self._mmap, offset)
+        offset += 4
+        self.config = json.loads(self._mmap[offset:offset + header_len].decode('utf-8'))
+        offset += header_len
+        offset += -offset % _ALIGN
+
+        count, width = self.config['count'], self.config['width']
+        self.width = width
+        self.keys = np.frombuffer(self._mmap, dtype=f'S{width}', count=count, offset=offset)
+        offset += count * width
+        offset += -offset % _ALIGN
+        self.ids = np.frombuffer(self._mmap, dtype='<i4', count=count, offset=offset)
+        self.overflow = self.config['overflow']
+
+    def __len__(self):
+        return len(self.keys) + len(self.overflow)
+
+    def to_dict(self):
+        """Seluruh kosakata sebagai dict {kata: id} (dibatasi num_words saat build)."""
+        words = [k.decode('utf-8') for k in self.keys.tolist()]
+        lookup = dict(zip(words, self.ids.tolist()))
+        lookup.update(self.overflow)
+        return lookup
+
+    def get(self, word, default=None):
+        """ID satu kata lewat binary search di tabel mmap, tanpa membangun dict."""
+        if word in self.overflow:
+            return self.overflow[word]
+        key = word.encode('utf-8')
+        if len(key) > self.width or not len(self.keys):
+            return default
+        pos = int(np.searchsorted(self.keys, np.array(key, dtype=f'S{self.width}')))
+        if pos < len(self.keys) and self.keys[pos] == key:
+            return int(self.ids[pos])
+        return default
+
+    def __contains__(self, word):
+        return self.get(word) is not None
+
+    def is_stale(self, json_path):
+        """True bila tokenizer JSON sumber berubah sejak file ini di-build."""
+        try:
+            return file_digest(json_path) != self.config.get('source_sha1')
+        except OSError:
+            return False
+
+
+def main():
+    from inference import KERAS_DEFAULT_FILTERS, TOKENIZER_JSON_PATH, TOKENIZER_VOCAB_PATH
+
+    parser = argparse.ArgumentParser(description="Kompilasi tokenizer JSON menjadi kosakata biner (mmap).")
+    parser.add_argument('--json', default=TOKENIZER_JSON_PATH)
+    parser.add_argument('--output', default=TOKENIZER_VOCAB_PATH)
+    args = parser.parse_args()
+
+    total = compile_vocabulary(args.json, args.output, KERAS_DEFAULT_FILTERS)
+    print(f"{total:,} kata ditulis ke {args.output} ({os.path.getsize(args.output) / 1024:.1f} KB)")
+
+
+if __name__ == '__main__':
+    main()
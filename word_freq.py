@@ -0,0 +1,211 @@
+"""Agregasi frekuensi kata untuk WordCloud dan file `WordFreq_*.csv`.
+
+WordCloud tidak perlu lagi menerima satu string raksasa hasil
+`" ".join(...)` lalu men-tokenisasi ulang: frekuensi dihitung sekali (atau
+bertahap per chunk) lalu dipakai langsung oleh `generate_from_frequencies`.
+Hasil yang sama juga bisa ditulis sebagai `WordFreq_<Label>.csv` (hitungan
+unigram tanpa kolokasi, sama dengan ekspor Colab di `model/`).
+
+Tokenisasi mengikuti `WordCloud.process_text` dengan pengaturan bawaan
+(pola kata, buang 's dan angka, `STOPWORDS`, huruf besar/kecil paling umum,
+gabung bentuk jamak, kolokasi bigram), sehingga gambarnya sama dengan
+`WordCloud.generate`. Bedanya, bigram tidak dibentuk melintasi dua teks.
+
+Membuat ulang artefak dari dataset penelitian:
+    python word_freq.py [--output model] [--top 100]
+"""
+import argparse
+import os
+import re
+import threading
+from collections import Counter
+from operator import itemgetter
+
+import pandas as pd
+from wordcloud import STOPWORDS
+from wordcloud.tokenization import score
+
+WORD_FREQ_DIR = 'model'
+WORD_FREQ_TOP_N = 100
+# Batas kata per grup untuk agregasi streaming (lihat `WordFrequencyAggregator`)
+WORD_FREQ_MAX_TERMS = 20000
+
+# Pengaturan bawaan WordCloud (min_word_length=0, collocation_threshold=30)
+WORD_PATTERN = re.compile(r"\w[\w']*")
+COLLOCATION_THRESHOLD = 30
+_STOPWORDS = frozenset(w.lower() for w in STOPWORDS)
+
+
+def tokenize(text):
+    """Kata-kata satu teks seperti `WordCloud.process_text` (sebelum stopword)."""
+    words = (w[:-2] if w.lower().endswith("'s") else w for w in WORD_PATTERN.findall(text))
+    return [w for w in words if not w.isdigit()]
+
+
+def count_words(texts):
+    """(unigram, bigram, jumlah kata) dari kumpulan teks.
+
+    Unigram tanpa stopword; bigram hanya dari dua kata berurutan yang
+    keduanya bukan stopword, di dalam satu teks yang sama.
+    """
+    unigrams, bigrams = Counter(), Counter()
+    for text in pd.Series(texts, dtype=object).dropna().astype(str):
+        words = tokenize(text)
+        is_stop = [w.lower() in _STOPWORDS for w in words]
+        unigrams.update(w for w, stop in zip(words, is_stop) if not stop)
+        bigrams.update(f"{a} {b}" for a, b, sa, sb in zip(words, words[1:], is_stop, is_stop[1:])
+                       if not (sa or sb))
+    return unigrams, bigrams, sum(unigrams.values())
+
+
+def _fuse_counts(counts):
+    """`wordcloud.tokenization.process_tokens` untuk Counter (bukan daftar kata)."""
+    cases = {}
+    for word, count in counts.items():
+        case_dict = cases.setdefault(word.lower(), {})
+        case_dict[word] = case_dict.get(word, 0) + count
+    merged_plurals = {}
+    for key in list(cases):
+        if key.endswith('s') and not key.endswith('ss') and key[:-1] in cases:
+            dict_singular = cases[key[:-1]]
+            for word, count in cases.pop(key).items():
+                dict_singular[word[:-1]] = dict_singular.get(word[:-1], 0) + count
+            merged_plurals[key] = key[:-1]
+    fused, standard = {}, {}
+    for key, case_dict in cases.items():
+        first = max(case_dict.items(), key=itemgetter(1))[0]
+        fused[first] = sum(case_dict.values())
+        standard[key] = first
+    for plural, singular in merged_plurals.items():
+        standard[plural] = standard[singular]
+    return fused, standard
+
+
+class WordFrequencyAggregator:
+    """Frekuensi kata per nama grup (mis. 'Mentah', 'Bersih', 'Negatif').
+
+    Bisa diisi sekaligus atau bertahap per chunk lewat `update` /
+    `update_by_label`; `agg['Negatif']` mengembalikan Counter frekuensi
+    siap pakai untuk `generate_from_frequencies` (kolokasi sudah dihitung).
+    Bila `max_terms` diisi, setiap Counter dipangkas ke `max_terms` kata
+    teratas begitu ukurannya melewati dua kali lipatnya, sehingga memori
+    tetap terbatas untuk file sebesar apa pun (hitungan kata langka menjadi
+    perkiraan, kata teratas tidak terpengaruh).
+    """
+
+    def __init__(self, max_terms=None):
+        self.max_terms = max_terms
+        self.unigrams = {}
+        self.bigrams = {}
+        self.totals = Counter()
+
+    def __getitem__(self, name):
+        return self.frequencies(name)
+
+    def __contains__(self, name):
+        return name in self.unigrams
+
+    def names(self):
+        return list(self.unigrams)
+
+    def _prune(self, counter):
+        if self.max_terms and len(counter) > 2 * self.max_terms:
+            top = counter.most_common(self.max_terms)
+            counter.clear()
+            counter.update(dict(top))
+
+    def update(self, name, texts):
+        unigrams, bigrams, total = count_words(texts)
+        for store, counts in ((self.unigrams, unigrams), (self.bigrams, bigrams)):
+            counter = store.setdefault(name, Counter())
+            counter.update(counts)
+            self._prune(counter)
+        self.totals[name] += total
+        return self
+
+    def update_by_label(self, texts, labels, label_names=None):
+        """Tambah frekuensi per label. `label_names` memetakan nilai label -> nama grup."""
+        texts = pd.Series(texts, dtype=object).reset_index(drop=True)
+        labels = pd.Series(labels).reset_index(drop=True)
+        for label, group in texts.groupby(labels, observed=True, sort=False):
+            name = label_names.get(label, label) if label_names else label
+            self.update(name, group)
+        return self
+
+    def frequencies(self, name, collocations=True):
+        """Counter frekuensi grup `name` seperti hasil `WordCloud.process_text`."""
+        counts, standard = _fuse_counts(self.unigrams.get(name, {}))
+        if collocations:
+            bigram_counts, _ = _fuse_counts(self.bigrams.get(name, {}))
+            original = dict(counts)
+            n_words = self.totals[name]
+            for bigram, count in bigram_counts.items():
+                first, second = bigram.split(' ')
+                word1, word2 = standard.get(first.lower()), standard.get(second.lower())
+                # Kata penyusunnya bisa saja sudah terpangkas (max_terms)
+                if word1 is None or word2 is None:
+                    continue
+                if score(count, original[word1], original[word2], n_words) > COLLOCATION_THRESHOLD:
+                    counts[word1] -= count
+                    counts[word2] -= count
+                    counts[bigram] = count
+        return Counter({word: count for word, count in counts.items() if count > 0})
+
+    def to_frame(self, name, top_n=WORD_FREQ_TOP_N, collocations=False):
+        """Tabel `Word`/`Frequency`; tanpa kolokasi seperti ekspor WordFreq_*.csv dari Colab."""
+        freq = self.frequencies(name, collocations=collocations)
+        return pd.DataFrame(freq.most_common(top_n), columns=['Word', 'Frequency'])
+
+    def write_csv(self, directory=WORD_FREQ_DIR, names=None, top_n=WORD_FREQ_TOP_N, prefix='WordFreq_'):
+        """Tulis `<prefix><nama>.csv` untuk setiap grup, kembalikan daftar path."""
+        os.makedirs(directory, exist_ok=True)
+        paths = []
+        for name in names or self.names():
+            path = os.path.join(directory, f"{prefix}{name}.csv")
+            self.to_frame(name, top_n).to_csv(path, index=False)
+            paths.append(path)
+        return paths
+
+# ==============================================================================
+# FREKUENSI DATASET PENELITIAN
+# ==============================================================================
+DATASET_LABEL_NAMES = {'negatif': 'Negatif', 'netral': 'Netral', 'positif': 'Positif'}
+
+_dataset_cache = {}
+_dataset_lock = threading.Lock()
+
+
+def dataset_word_freq():
+    """Frekuensi 'Mentah' (Teks Tweet), 'Bersih' (Tweet_Final) dan per sentimen.
+
+    Dihitung sekali per versi dataset (lihat dataset.py).
+    """
+    from dataset import dataset_version, load_dataset
+    from inference import strip_links
+
+    version = dataset_version()
+    with _dataset_lock:
+        if version not in _dataset_cache:
+            df = load_dataset(['Teks Tweet', 'Tweet_Final', 'Label_Clean'])
+            agg = WordFrequencyAggregator()
+            agg.update('Mentah', strip_links(df['Teks Tweet']))
+            agg.update('Bersih', df['Tweet_Final'])
+            agg.update_by_label(df['Tweet_Final'], df['Label_Clean'], DATASET_LABEL_NAMES)
+            _dataset_cache.clear()
+            _dataset_cache[version] = agg
+        return _dataset_cache[version]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Buat ulang file WordFreq_*.csv dari dataset penelitian.")
+    parser.add_argument('--output', default=WORD_FREQ_DIR)
+    parser.add_argument('--top', type=int, default=WORD_FREQ_TOP_N)
+    args = parser.parse_args()
+
+    agg = dataset_word_freq()
+    for path in agg.write_csv(args.output, names=list(DATASET_LABEL_NAMES.values()), top_n=args.top):
+        print(path)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,118 @@
+"""Cache render WordCloud (PNG) di disk.
+
+Menggambar WordCloud dari seluruh korpus memakan waktu beberapa detik,
+padahal hasilnya hanya berubah bila data sumbernya berubah. Gambar PNG
+disimpan di `data/.cache/wordcloud` dengan kunci (versi data, sumber teks,
+colormap, ukuran), sehingga bertahan walau aplikasi di-restart. Bila total
+ukuran cache melewati batas, file yang paling lama tidak dipakai dihapus.
+"""
+import hashlib
+import io
+import json
+import os
+import tempfile
+import threading
+
+from wordcloud import WordCloud
+
+from perf import span
+
+WORDCLOUD_CACHE_DIR = 'data/.cache/wordcloud'
+WORDCLOUD_CACHE_MAX_BYTES = int(os.environ.get('SENTIMEN_WC_CACHE_BYTES', 50 * 1024 * 1024))
+
+_lock = threading.Lock()
+
+
+def file_version(path):
+    """Versi sederhana sebuah file sumber (ukuran + mtime) untuk kunci cache."""
+    st_ = os.stat(path)
+    return f"{st_.st_size}-{st_.st_mtime_ns}"
+
+
+class WordCloudCache:
+    def __init__(self, cache_dir=WORDCLOUD_CACHE_DIR, max_bytes=WORDCLOUD_CACHE_MAX_BYTES):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+
+    @staticmethod
+    def key(version, source, colormap, width, height, max_words):
+        raw = json.dumps([version, source, colormap, width, height, max_words], ensure_ascii=False)
+        return hashlib.blake2b(raw.encode('utf-8'), digest_size=16).hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, key + '.png')
+
+    def get(self, key):
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+        except OSError:
+            return None
+        # mtime dipakai sebagai penanda "terakhir dipakai" untuk eviction
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return data
+
+    def put(self, key, data):
+        os.makedirs(self.cache_dir, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, self._path(key))
+        self._evict()
+
+    def _evict(self):
+        with _lock:
+            entries = []
+            for name in os.listdir(self.cache_dir):
+                if not name.endswith('.png'):
+                    continue
+                try:
+                    st_ = os.stat(os.path.join(self.cache_dir, name))
+                except OSError:
+                    continue
+                entries.append((st_.st_mtime_ns, st_.st_size, name))
+
+            total = sum(size for _, size, _ in entries)
+            for _, size, name in sorted(entries):
+                if total <= self.max_bytes:
+                    break
+                try:
+                    os.remove(os.path.join(self.cache_dir, name))
+                    total -= size
+                except OSError:
+                    pass
+
+    def render(self, version, source, generate, colormap, width=800, height=400, max_words=100):
+        """PNG WordCloud dari cache, atau digambar lewat `generate(wc)` bila belum ada.
+
+        `generate` menerima objek WordCloud kosong dan memanggil `.generate(...)`
+        atau `.generate_from_frequencies(...)`; teks/frekuensi sebaiknya baru
+        disiapkan di dalamnya agar tidak dihitung saat cache hit.
+        """
+        key = self.key(version, source, colormap, width, height, max_words)
+        data = self.get(key)
+        if data is not None:
+            return data
+
+        with span('wordcloud'):
+            wc = WordCloud(width=width, height=height, background_color='white', colormap=colormap, max_words=max_words)
+            generate(wc)
+            buffer = io.BytesIO()
+            wc.to_image().save(buffer, format='PNG')
+        data = buffer.getvalue()
+        self.put(key, data)
+        return data
+
+
+_default_cache = None
+
+
+def get_wordcloud_cache():
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = WordCloudCache()
+    return _default_cache